@@ -0,0 +1,43 @@
+import argparse
+import json
+import sys
+from . import runner
+
+# Usage: python -m benchmarks [--workload NAME] [--engine NAME] [--documents N] [--repeat N]
+#                             [--output FILE] [--compare FILE] [--threshold FRACTION]
+#
+# Run from the root of the repository. Results are written as JSON, so you can keep them and
+# compare them with the results of a later version. With `--compare`, the exit code is 1 if any
+# workload got slower than the threshold allows.
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Runs the Okay benchmarks.')
+    parser.add_argument('--workload', action='append', choices=list(runner.WORKLOADS), help='workload to run; can be repeated; default is all')
+    parser.add_argument('--engine', action='append', choices=runner.ENGINES, help='engine to run; can be repeated; default is all')
+    parser.add_argument('--documents', type=int, default=1000, help='number of documents per workload')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs per workload; the fastest run counts')
+    parser.add_argument('--output', help='file to write the results to; default is standard output')
+    parser.add_argument('--compare', help='results of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown that counts as a regression, e.g. 0.1 for 10%%')
+    arguments = parser.parse_args(arguments)
+
+    results = runner.run(arguments.workload, arguments.engine, arguments.documents, arguments.repeat)
+    output = json.dumps(results, indent=2)
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = runner.compare(json.load(file), results, arguments.threshold)
+        for regression in regressions:
+            print('Regression: ' + regression, file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
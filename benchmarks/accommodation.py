@@ -0,0 +1,60 @@
+from okay import Message
+from okay.schema import *
+
+# The accommodation schema and documents from the performance optimizations section of the
+# development log. Half of the documents are valid, the other half have several errors each.
+
+def score(field, value):
+    if not isinstance(value, dict) or 'score' not in value or 'out_of' not in value or not isinstance(value['score'], (int, float)) or not isinstance(value['out_of'], (int, float)):
+        return
+
+    if value['score'] > value['out_of']:
+        return Message(
+            type='score_too_high',
+            field=field,
+            expected=value['out_of']
+        )
+
+def schema():
+    required('metadata', type='object')
+    required('metadata.accommodation_id', type='int', min=1)
+    required('metadata.external_id', type='string')
+    required('metadata.partner', type='string')
+    required('metadata.source_type', type='string')
+    required('accommodation', type='object')
+    required('accommodation.name', type='string')
+    required('accommodation.address', type='string')
+    required('accommodation.city', type='string')
+    required('accommodation.country', type='string')
+    optional('accommodation.postal_code', type='string')
+    optional('accommodation.phone', type='string', regex=r'[\+\- 0-9]+')
+    optional('accommodation.checkin', type='object')
+    required('accommodation.checkin.from', type='string', regex=r'[0-2]\d:[0-2]\d')
+    required('accommodation.checkin.until', type='string', regex=r'[0-2]\d:[0-2]\d')
+    optional('accommodation.checkout', type='object')
+    required('accommodation.checkout.from', type='string', regex=r'[0-2]\d:[0-2]\d')
+    required('accommodation.checkout.until', type='string', regex=r'[0-2]\d:[0-2]\d')
+    optional('accommodation.geo', type='object')
+    required('accommodation.geo.longitude', type='string', regex=r'\-?\d+\.\d+')
+    required('accommodation.geo.latitude', type='string', regex=r'\-?\d+\.\d+')
+    required('accommodation.ratings[].aspect', type='string', options=['general', 'cleanliness', 'staff'])
+    required('accommodation.ratings[].score', type='number', min=0)
+    required('accommodation.ratings[].out_of', type='number', min=0)
+    optional('accommodation.ratings[]', type='custom', validator=score)
+
+valid_document = { "metadata": { "accommodation_id": 1, "external_id": "id1", "partner": "getaway", "source_type": "direct" }, "accommodation": { "name": "Heartbreak Hotel", "address": "Lonely Street", "city": "Memphis", "country": "United States", "postal_code": "37501", "phone": "+1 901-555-7300", "checkin": { "from": "15:00", "until": "23:00" }, "checkout": { "from": "00:00", "until": "12:00" }, "geo": { "longitude": "35.14", "latitude": "-90.038" }, "ratings": [{ "aspect": "general", "score": 2.5, "out_of": 5 }, { "aspect": "cleanliness", "score": 1.8, "out_of": 5 }, { "aspect": "staff", "score": 3.9, "out_of": 5 } ] } }
+invalid_document = { "metadata": { "accommodation_id": -1, "external_id": 1, "partner": "getaway" }, "accommodation": { "name": "Heartbreak Hotel", "address": "Lonely Street", "country": "United States", "postal_code": "37501", "phone": "+1 901-555-7300", "checkin": { "from": "15:00", "until": "midnight" }, "checkout": { "from": "00:00", "until": "12:00" }, "geo": { "longitude": 35.14, "latitude": "-90" }, "ratings": [ { "aspect": "general", "score": 2.5 }, { "aspect": "loneliness", "score": 1.8, "out_of": 5 }, { "aspect": "staff", "score": 6.9, "out_of": 5 } ] } }
+
+def generate_documents(count):
+    # The development log used the same two dictionaries over and over again. Each document gets its
+    # own copy here, so results caches or identity tricks can't make the benchmark look better than
+    # it is.
+    return [ _copy(valid_document) if i < count // 2 else _copy(invalid_document) for i in range(count) ]
+
+def _copy(value):
+    if isinstance(value, dict):
+        return { key: _copy(item) for key, item in value.items() }
+    if isinstance(value, list):
+        return [ _copy(item) for item in value ]
+
+    return value
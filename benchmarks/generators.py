@@ -0,0 +1,92 @@
+import random
+from okay.schema import *
+
+# Generates a schema and matching documents with a controllable shape. Each object has `fields`
+# fields of rotating types, an object field `child` if `depth` is more than 1, and a list of objects
+# `items` if `list_length` is more than 0. Each document has a chance of `error_rate` to contain one
+# error: a value of the wrong type, a missing field, or an extra field. The same seed always gives
+# the same documents.
+
+_TYPES = [ 'string', 'int', 'number', 'bool' ]
+
+def generate_schema(fields=10, depth=1, list_length=0):
+    field_names = []
+    _add_field_names(field_names, '', fields, depth, list_length)
+
+    def schema():
+        for field_name, type in field_names:
+            required(field_name, type=type)
+
+    return schema
+
+def generate_documents(count, fields=10, depth=1, list_length=0, error_rate=0.0, seed=0):
+    generator = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        document = _generate_object(generator, fields, depth, list_length)
+        if generator.random() < error_rate:
+            _add_error(generator, document)
+        documents.append(document)
+
+    return documents
+
+def _add_field_names(field_names, prefix, fields, depth, list_length):
+    for i in range(fields):
+        field_names.append((prefix + f'field_{i}', _TYPES[i % len(_TYPES)]))
+
+    if depth > 1:
+        field_names.append((prefix + 'child', 'object'))
+        _add_field_names(field_names, prefix + 'child.', fields, depth - 1, list_length)
+
+    if list_length > 0:
+        field_names.append((prefix + 'items', 'list'))
+        _add_field_names(field_names, prefix + 'items[].', fields, 1, 0)
+
+def _generate_object(generator, fields, depth, list_length):
+    document = {}
+    for i in range(fields):
+        document[f'field_{i}'] = _generate_value(generator, _TYPES[i % len(_TYPES)])
+
+    if depth > 1:
+        document['child'] = _generate_object(generator, fields, depth - 1, list_length)
+
+    if list_length > 0:
+        document['items'] = [ _generate_object(generator, fields, 1, 0) for _ in range(list_length) ]
+
+    return document
+
+def _generate_value(generator, type):
+    if type == 'string':
+        return ''.join(generator.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(generator.randint(1, 12)))
+    if type == 'int':
+        return generator.randint(-1000, 1000)
+    if type == 'number':
+        return generator.uniform(-1000, 1000)
+
+    return generator.random() < 0.5
+
+def _add_error(generator, document):
+    # Pick a random object in the document and break one of its fields.
+    objects = [ document ]
+    value = document
+    while True:
+        children = [ child for key, child in value.items() if isinstance(child, dict) ]
+        children += [ item for items in value.values() if isinstance(items, list) for item in items ]
+        if not children:
+            break
+        value = generator.choice(children)
+        objects.append(value)
+
+    target = generator.choice(objects)
+    keys = [ key for key in target if key.startswith('field_') ]
+    if not keys:
+        return
+
+    key = generator.choice(keys)
+    error = generator.choice([ 'invalid_type', 'missing_field', 'extra_field' ])
+    if error == 'invalid_type':
+        target[key] = [ target[key] ]
+    elif error == 'missing_field':
+        del target[key]
+    else:
+        target['extra_' + key] = target[key]
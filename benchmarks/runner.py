@@ -0,0 +1,99 @@
+import platform
+import time
+from okay import validate, Profiler, SchemaCache, Validator
+from okay.profiler import PHASES
+from okay.schema_compiler import compile
+from . import accommodation
+from . import generators
+
+# Each workload is timed a number of times and we keep the fastest run, because that's the run with
+# the least interference from other processes. For the interpreter, we also time each phase of the
+# validation separately, in a separate run with a profiler.
+
+WORKLOADS = {
+    'accommodation': lambda count: (accommodation.schema, accommodation.generate_documents(count)),
+    'flat': lambda count: _generate(count, fields=20),
+    'nested': lambda count: _generate(count, fields=4, depth=5),
+    'lists': lambda count: _generate(count, fields=4, list_length=20),
+    'valid': lambda count: _generate(count, fields=10, depth=2, list_length=3, error_rate=0.0),
+    'invalid': lambda count: _generate(count, fields=10, depth=2, list_length=3, error_rate=1.0)
+}
+
+ENGINES = [ 'interpreter', 'generated', 'lazy' ]
+
+def run(workloads=None, engines=None, count=1000, repeat=5):
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'documents': count,
+        'repeat': repeat,
+        'results': []
+    }
+
+    for name in workloads or WORKLOADS:
+        schema, documents = WORKLOADS[name](count)
+        for engine in engines or ENGINES:
+            result = { 'workload': name, 'engine': engine }
+            result.update(time_workload(schema, documents, engine, repeat))
+            results['results'].append(result)
+
+    return results
+
+def time_workload(schema, documents, engine, repeat):
+    best = None
+    message_count = 0
+    for _ in range(repeat):
+        seconds, message_count = _time_engine(schema, documents, engine)
+        if engine == 'interpreter':
+            seconds.update(_time_phases(schema, documents))
+
+        if best is None or seconds['total'] < best['total']:
+            best = seconds
+
+    return { 'messages': message_count, 'seconds': best }
+
+def compare(baseline, results, threshold=0.1):
+    # Returns a description of each workload that got slower by more than `threshold`, e.g. 0.1 for
+    # 10%.
+    baseline_seconds = { (result['workload'], result['engine']): result['seconds']['total'] for result in baseline['results'] }
+    regressions = []
+    for result in results['results']:
+        key = (result['workload'], result['engine'])
+        if key not in baseline_seconds:
+            continue
+
+        before = baseline_seconds[key]
+        after = result['seconds']['total']
+        if before > 0 and (after - before) / before > threshold:
+            regressions.append(f"{key[0]} ({key[1]}): {before:.4f}s -> {after:.4f}s (+{(after - before) / before:.0%})")
+
+    return regressions
+
+def _time_phases(schema, documents):
+    # The profiler times each rule and runs the rules without a rule plan, so it's slower than the
+    # interpreter itself. That's why we only use it to see how the time is divided over the phases,
+    # and time the interpreter on its own for the total, so it compares fairly to the other engines.
+    profiler = Profiler()
+    validator = Validator(schema_cache=SchemaCache(), profiler=profiler)
+    for document in documents:
+        validator.validate(schema, document)
+
+    return { phase: seconds for phase, seconds in profiler.phases.items() if phase != 'compile' }
+
+def _time_engine(schema, documents, engine):
+    start = time.perf_counter()
+    compiled_schema = compile(schema)
+    validate(compiled_schema, {}, engine=engine)
+    compiled = time.perf_counter()
+
+    message_count = 0
+    for document in documents:
+        message_count += len(validate(compiled_schema, document, engine=engine))
+    done = time.perf_counter()
+
+    return { 'compile': compiled - start, 'total': done - start }, message_count
+
+def _generate(count, error_rate=0.1, **shape):
+    schema = generators.generate_schema(**shape)
+    documents = generators.generate_documents(count, error_rate=error_rate, **shape)
+    return schema, documents
@@ -13,6 +13,9 @@ setup(
     author_email='joost@ronkes.nl',
     packages=find_packages('src'),
     package_dir={ '': 'src' },
+    extras_require={
+        'numpy': [ 'numpy' ]
+    },
     url='https://github.com/williamwilling/okay',
     project_urls={
         'Documentation': 'https://github.com/williamwilling/okay/blob/master/docs/README.md',
@@ -1,2 +1,14 @@
-from .validator import validate, Message
-from .schema_error import SchemaError
\ No newline at end of file
+from .validator import validate, validate_many, is_valid, precompile, explain, Validator, Message
+from .adaptive_order import AdaptiveOrder
+from .async_validator import avalidate, avalidate_many
+from .columnar import validate_columns
+from .incremental import revalidate
+from .json_lines import validate_jsonl
+from .pipeline import Pipeline
+from .profiler import Profiler
+from .result_cache import ResultCache
+from .schema_cache import SchemaCache
+from .schema_error import SchemaError
+from .schema_serializer import dump_schema, dumps_schema, load_schema, loads_schema
+from .shape_cache import ShapeCache
+from .sinks import CSVMessageSink, JSONLinesSink
\ No newline at end of file
@@ -0,0 +1,92 @@
+import threading
+import weakref
+
+class AdaptiveOrder:
+    # To find out whether a document is valid, the validator can stop at the first problem, so it
+    # pays to check the fields that fail most often, and cost the least, first. The order keeps track
+    # of how often each field fails and how long it takes to check, including its children. After each
+    # window of documents, it sorts the children of each object by the time it takes on average to
+    # find a failure, and starts counting again. Measuring isn't free, so it only measures one in every
+    # `sample_every` documents.
+    #
+    # Only `is_valid()` uses the order. It reports no messages, so the order doesn't change the result.
+    # Validating a document always reports its messages in the same order, adaptive or not.
+    #
+    # Counting happens for every field in every measured document, so it only takes the lock the first
+    # time it sees a node. If several threads use the same order at once, some counts may get lost,
+    # which only makes the order a little less precise.
+    #
+    # Measurements and orders are stored per node, and the order only holds weak references to the
+    # nodes, so when the schema cache removes a schema, they go with it.
+    def __init__(self, window=1000, sample_every=10):
+        self.window = window
+        self.sample_every = sample_every
+        self.documents = 0
+        self.reorders = 0
+        self._samples = 0
+        self._stats = weakref.WeakKeyDictionary()
+        self._orders = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get_order(self, node):
+        # Adding a node takes the lock, because `_reorder()` goes through all nodes.
+        order = self._orders.get(node)
+        if order is None:
+            with self._lock:
+                order = self._orders.get(node)
+                if order is None:
+                    order = self._orders[node] = tuple(node.children.items())
+
+        return order
+
+    def record(self, node, seconds, failed):
+        stats = self._stats.get(node)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(node, [ 0, 0, 0.0 ])
+
+        stats[0] += 1
+        stats[1] += failed
+        stats[2] += seconds
+
+    def add_document(self):
+        # Returns whether to measure this document.
+        self.documents += 1
+        if self.documents >= self.window:
+            with self._lock:
+                if self.documents >= self.window:
+                    self._reorder()
+
+        self._samples += 1
+        return self._samples % self.sample_every == 0
+
+    def clear(self):
+        with self._lock:
+            self._stats = weakref.WeakKeyDictionary()
+            self._orders = weakref.WeakKeyDictionary()
+            self.documents = 0
+
+    def _reorder(self):
+        # Children are sorted starting from the schema order, not the current order, so the same
+        # counts always give the same order.
+        stats = self._stats
+        self._orders = weakref.WeakKeyDictionary(
+            (node, tuple(sorted(node.children.items(), key=lambda item: _get_priority(stats.get(item[1])))))
+            for node in list(self._orders.keys())
+        )
+        self._stats = weakref.WeakKeyDictionary()
+        self.documents = 0
+        self.reorders += 1
+
+def _get_priority(stats):
+    # Fields that never failed come last, the fastest first, because all of them have to be checked
+    # for a valid document anyway. Fields that weren't checked at all count as fast, so they get a
+    # chance to show how often they fail.
+    if stats is None:
+        return (1, 0.0)
+
+    calls, failures, seconds = stats
+    if failures == 0:
+        return (1, seconds / calls)
+
+    return (0, seconds / failures)
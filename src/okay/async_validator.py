@@ -0,0 +1,101 @@
+import asyncio
+from . import validator
+from .type_validators.custom_validator import CustomValidator, _pending_calls
+
+async def avalidate(schema, document, message_values=None, engine='interpreter', max_messages=None, fail_fast=False, offload=False, executor=None, max_concurrency=10):
+    max_messages = validator._get_max_messages(max_messages, fail_fast)
+    run = _AsyncRunner(schema, engine, max_messages, offload, executor, max_concurrency)
+    return await run(document, message_values)
+
+async def avalidate_many(schema, documents, message_values=None, engine='interpreter', max_messages=None, fail_fast=False, offload=False, executor=None, max_concurrency=10):
+    max_messages = validator._get_max_messages(max_messages, fail_fast)
+    run = _AsyncRunner(schema, engine, max_messages, offload, executor, max_concurrency)
+
+    document_number = 0
+    async for document in _iterate(documents):
+        yield document_number, await run(document, message_values)
+        document_number += 1
+
+        # Give other tasks a chance to run between documents, even if validation didn't need to
+        # await anything.
+        await asyncio.sleep(0)
+
+async def _iterate(documents):
+    if hasattr(documents, '__aiter__'):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
+
+class _AsyncRunner:
+    def __init__(self, schema, engine, max_messages, offload, executor, max_concurrency):
+        if max_concurrency < 1:
+            raise ValueError('The maximum concurrency must be at least 1.')
+
+        compiled_schema = validator._validator._precompile(schema, engine)
+        self._has_async_validators = any(
+            isinstance(rule.validate, CustomValidator) and rule.validate.is_async
+            for field in compiled_schema.fields.values()
+            for rule in field.rules
+        )
+
+        # An asynchronous custom validator may or may not return a message, so we don't know how many
+        # messages a document has until we've awaited them all. That's why we only limit the number of
+        # messages afterwards.
+        self._max_messages = max_messages
+        if self._has_async_validators:
+            self._run = validator._validator._get_runner(compiled_schema, engine)
+        else:
+            self._run = validator._validator._get_runner(compiled_schema, engine, max_messages)
+
+        self._offload = offload
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+
+    async def __call__(self, document, message_values):
+        if self._offload is True or (callable(self._offload) and self._offload(document)):
+            loop = asyncio.get_running_loop()
+            messages, pending_calls = await loop.run_in_executor(self._executor, self._run_collecting, document)
+        else:
+            messages, pending_calls = self._run_collecting(document)
+
+        if pending_calls:
+            messages = await self._finish(messages, pending_calls)
+        if self._has_async_validators and self._max_messages is not None:
+            messages = messages[:self._max_messages]
+
+        if message_values:
+            for message in messages:
+                message.add(**message_values)
+        return messages
+
+    def _run_collecting(self, document):
+        pending_calls = []
+        token = _pending_calls.set(pending_calls)
+        try:
+            messages = self._run(document)
+        finally:
+            _pending_calls.reset(token)
+
+        return messages, pending_calls
+
+    async def _finish(self, messages, pending_calls):
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        async def finish(custom_validator, field, awaitable):
+            async with semaphore:
+                return await custom_validator.finish(field, awaitable)
+
+        tasks = [ asyncio.ensure_future(finish(custom_validator, field, awaitable)) for _, custom_validator, field, awaitable in pending_calls ]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Replace each placeholder with the message that the custom validator returned, if any, so
+        # the messages end up in the same order as if the custom validators were synchronous.
+        results = { id(placeholder): message for (placeholder, _, _, _), message in zip(pending_calls, results) }
+        messages = [ results.get(id(message), message) for message in messages ]
+        return [ message for message in messages if message is not None ]
@@ -0,0 +1,253 @@
+from .message import Message
+from .type_validators import BoolValidator, ListValidator, ObjectValidator
+
+# The code generator turns a compiled schema into the source code of a single Python function that
+# validates a document. The generated function walks the document the same way `create_index()`
+# does, but it checks the rules for a field as soon as it finds the field, so it doesn't need an
+# index. Validation messages are collected in one group per field, and the groups are concatenated
+# in the order in which the fields were first found, so the result is identical to what the
+# interpreter in `Validator` produces.
+#
+# A few exotic documents can't be handled by the generated function, e.g. documents with keys that
+# contain a dot and happen to match a nested field name. In that case the generated function
+# returns `None` and the caller should fall back to the interpreter.
+
+def generate(schema):
+    namespace = { 'Message': Message }
+    source = generate_source(schema, namespace)
+
+    try:
+        code = compile(source, '<okay-generated>', 'exec')
+    except (SyntaxError, RecursionError, MemoryError):
+        # Python limits how deeply blocks can be nested, so extremely deep schemas can't be turned
+        # into a single function.
+        return _fall_back
+
+    exec(code, namespace)
+    function = namespace['validate_document']
+    function.source = source
+    return function
+
+def generate_source(schema, namespace=None):
+    if namespace is None:
+        namespace = { 'Message': Message }
+
+    return _Generator(schema, namespace).generate()
+
+def _fall_back(document):
+    return None
+
+
+class _Path:
+    # The text of a path is split into pieces at the list indexes, and `variables` holds the names of
+    # the index variables that go in between, so keys can contain any character.
+    def __init__(self, text, variables=(), pieces=()):
+        self.text = text
+        self.variables = variables
+        self.pieces = pieces
+
+    def child(self, key):
+        if self.text == '.':
+            return _Path(key)
+        else:
+            return _Path(self.text + '.' + key, self.variables, self.pieces)
+
+    def element(self, variable):
+        return _Path(']', self.variables + (variable,), self.pieces + (self.text + '[',))
+
+    def code(self, suffix=''):
+        if not self.variables:
+            return repr(self.text + suffix)
+
+        template = '%d'.join(piece.replace('%', '%%') for piece in self.pieces + (self.text + suffix,))
+        return repr(template) + ' % (' + ', '.join(self.variables) + ',)'
+
+
+class _Generator:
+    def __init__(self, schema, namespace):
+        self._fields = schema.fields
+        self._namespace = namespace
+        self._lines = []
+        self._depth = 0
+
+        self._groups = {}
+        for field_name in self._fields:
+            self._groups[field_name] = 'g' + str(len(self._groups))
+        if '.' not in self._groups:
+            self._groups['.'] = 'g' + str(len(self._groups))
+
+        tree = schema.tree
+        self._tree = tree
+        self._buckets = [ 'mf' + str(bucket) for bucket in range(tree.bucket_count) ]
+        self._missing = {}
+        for node in tree.parents:
+            self._missing[node.name] = [ ('mf' + str(bucket), child_name, key) for bucket, child_name, key in node.missing ]
+
+    def generate(self):
+        self._write(0, 'def validate_document(document):')
+        for field_name, group in self._groups.items():
+            if field_name != '.':
+                self._write(1, group + ' = None')
+        self._write(1, self._groups['.'] + ' = []')
+        self._write(1, 'groups = [' + self._groups['.'] + ']')
+        for bucket in self._buckets:
+            self._write(1, bucket + ' = []')
+        self._write(1, 'extras = []')
+
+        self._write_field('.', 'document', _Path('.'), 1, register=False)
+
+        self._write(1, 'messages = [ message for group in groups for message in group ]')
+        for bucket in self._buckets:
+            self._write(1, 'messages += ' + bucket)
+        # Children ignore extra fields if the root does, so then there can't be any.
+        if not self._tree.root.ignore_extra_fields:
+            self._write(1, 'for path in extras:')
+            self._write(2, "messages.append(Message(type='extra_field', field=path))")
+        self._write(1, 'return messages')
+
+        return '\n'.join(self._lines) + '\n'
+
+    def _write(self, indent, line):
+        self._lines.append('    ' * indent + line)
+
+    def _write_field(self, field_name, value, path, indent, register=True):
+        group = self._groups[field_name]
+        if register:
+            self._write_registration(group, indent)
+
+        field = self._fields.get(field_name)
+        if field is not None and field.rules:
+            self._write_rules(self._tree.nodes[field_name].plan, group, value, path, indent)
+
+        self._write_children(field_name, field, value, path, indent)
+
+    def _write_registration(self, group, indent):
+        self._write(indent, 'if ' + group + ' is None:')
+        self._write(indent + 1, group + ' = []')
+        self._write(indent + 1, 'groups.append(' + group + ')')
+
+    def _write_rules(self, plan, group, value, path, indent):
+        self._write(indent, 'if ' + value + ' is None:')
+        for rule_type in plan.null_types:
+            self._write(indent + 1, group + ".append(Message(type='null_value', field=" + path.code() + ", expected={ 'type': " + repr(rule_type) + ' }))')
+        if not plan.null_types:
+            self._write(indent + 1, 'pass')
+
+        if plan.type_check is not None:
+            python_type, expected, count = plan.type_check
+            self._write(indent, 'elif not isinstance(' + value + ', ' + python_type.__name__ + '):')
+            for _ in range(count):
+                self._write(indent + 1, group + ".append(Message(type='invalid_type', field=" + path.code() + ", expected={ 'type': " + repr(expected['type']) + ' }))')
+
+        if not plan.checks:
+            return
+
+        self._write(indent, 'else:')
+        for rule in plan.checks:
+            self._write_rule(rule, group, value, path, indent + 1)
+
+    def _write_rule(self, rule, group, value, path, indent):
+        validator = rule.validate
+        inline_types = {
+            ObjectValidator: ('dict', 'object'),
+            BoolValidator: ('bool', 'bool')
+        }
+
+        if type(validator) is ListValidator and validator._min is None and validator._max is None:
+            inline_types[ListValidator] = ('list', 'list')
+
+        if type(validator) in inline_types:
+            python_type, type_name = inline_types[type(validator)]
+            self._write(indent, 'if not isinstance(' + value + ', ' + python_type + '):')
+            self._write(indent + 1, group + ".append(Message(type='invalid_type', field=" + path.code() + ", expected={ 'type': " + repr(type_name) + ' }))')
+            return
+
+        function = 'r' + str(len(self._namespace))
+        self._namespace[function] = validator
+        self._write(indent, 'message = ' + function + '(' + path.code() + ', ' + value + ')')
+        self._write(indent, 'if message is not None:')
+        self._write(indent + 1, group + '.append(message)')
+
+    def _write_children(self, field_name, field, value, path, indent):
+        missing = self._missing.get(field_name, [])
+        is_nullable_object = field is not None and field.is_nullable_object()
+
+        self._write(indent, 'if isinstance(' + value + ', dict):')
+        if len(missing) > 1:
+            # Checking all required keys at once is faster than checking them one by one, and it's
+            # usually enough.
+            required_keys = 'rk' + str(len(self._namespace))
+            self._namespace[required_keys] = self._tree.nodes[field_name].required_keys
+            self._write(indent + 1, 'if not ' + value + '.keys() >= ' + required_keys + ':')
+            self._write_missing_checks(missing, value, path, indent + 2)
+        else:
+            self._write_missing_checks(missing, value, path, indent + 1)
+        self._write_object(field_name, value, path, indent + 1)
+
+        if missing and not is_nullable_object:
+            self._write(indent, 'elif ' + value + ' is None:')
+            for bucket, child_name, key in missing:
+                self._write(indent + 1, bucket + ".append(Message(type='missing_field', field=" + path.child(child_name).code() + '))')
+
+        element = self._tree.nodes[field_name].element
+        if element is not None:
+            self._write(indent, 'elif isinstance(' + value + ', list):')
+            self._write_list(element.name, value, path, indent + 1)
+
+    def _write_missing_checks(self, missing, value, path, indent):
+        for bucket, child_name, key in missing:
+            self._write(indent, 'if ' + repr(key) + ' not in ' + value + ':')
+            self._write(indent + 1, bucket + ".append(Message(type='missing_field', field=" + path.child(child_name).code() + '))')
+
+    def _write_object(self, field_name, value, path, indent):
+        node = self._tree.nodes[field_name]
+        children = node.children
+        unusual_keys = node.unusual_keys
+
+        if not children and not unusual_keys and node.ignore_extra_fields:
+            self._write(indent, 'pass')
+            return
+
+        self._depth += 1
+        key_variable = 'k' + str(self._depth)
+        value_variable = 'v' + str(self._depth)
+        self._write(indent, 'for ' + key_variable + ', ' + value_variable + ' in ' + value + '.items():')
+
+        keyword = 'if'
+        for key, child in children.items():
+            self._write(indent + 1, keyword + ' ' + key_variable + ' == ' + repr(key) + ':')
+            self._write_field(child.name, value_variable, path.child(key), indent + 2)
+            keyword = 'elif'
+
+        if unusual_keys:
+            unusual = 'u' + str(len(self._namespace))
+            self._namespace[unusual] = unusual_keys
+            self._write(indent + 1, keyword + ' ' + key_variable + ' in ' + unusual + ':')
+            self._write(indent + 2, 'return None')
+            keyword = 'elif'
+
+        if not node.ignore_extra_fields:
+            if field_name == '.':
+                extra_path = key_variable
+            else:
+                extra_path = '(' + path.code('.') + ') + ' + key_variable
+
+            if keyword == 'if':
+                self._write(indent + 1, 'extras.append(' + extra_path + ')')
+            else:
+                self._write(indent + 1, 'else:')
+                self._write(indent + 2, 'extras.append(' + extra_path + ')')
+        elif keyword == 'if':
+            self._write(indent + 1, 'pass')
+
+        self._depth -= 1
+
+    def _write_list(self, element_name, value, path, indent):
+        self._write_registration(self._groups[element_name], indent)
+
+        self._depth += 1
+        index_variable = 'i' + str(self._depth)
+        value_variable = 'v' + str(self._depth)
+        self._write(indent, 'for ' + index_variable + ', ' + value_variable + ' in enumerate(' + value + '):')
+        self._write_field(element_name, value_variable, path.element(index_variable), indent + 1, register=False)
+        self._depth -= 1
@@ -0,0 +1,251 @@
+from operator import itemgetter
+from . import validator
+from .message import Message
+from .type_validators import AnyValidator, BoolValidator, IntValidator, ListValidator, NumberValidator, ObjectValidator, StringValidator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Validating columns gives the same messages as validating each row as a separate document, i.e. a
+# dictionary with one key per column, but it runs each rule once for an entire column. First, a
+# quick check finds the rows that may fail a rule; for NumPy arrays, that check is vectorized. Only
+# the rows it finds go through the rule itself, so each message is exactly what `validate()` would
+# report. Values in a NumPy array are validated as the Python values `tolist()` gives you.
+#
+# Columns only make sense for flat records, so if the schema or the columns contain nested fields, or
+# if a column contains objects, even inside lists, we fall back to validating the rows one by one.
+# Otherwise, we would miss the extra fields in those objects.
+
+def validate_columns(schema, columns, message_values=None):
+    compiled_schema = validator._validator._precompile(schema, 'interpreter')
+    row_count = _get_row_count(columns)
+
+    if _is_nested(compiled_schema, columns):
+        found = _validate_rows(compiled_schema, columns, row_count)
+    else:
+        found = _validate_columns(compiled_schema, columns, row_count)
+
+    messages = []
+    for row_number, message in found:
+        message.add(row_number=row_number)
+        if message_values:
+            message.add(**message_values)
+        messages.append(message)
+
+    return messages
+
+def _get_row_count(columns):
+    row_count = None
+    for name, column in columns.items():
+        if numpy is not None and isinstance(column, numpy.ndarray) and column.ndim != 1:
+            raise ValueError(f"Column `{name}` must be one-dimensional.")
+        if row_count is None:
+            row_count = len(column)
+        elif len(column) != row_count:
+            raise ValueError('All columns must have the same number of rows.')
+
+    return row_count or 0
+
+def _is_nested(compiled_schema, columns):
+    for name in list(compiled_schema.fields) + list(columns):
+        if name != '.' and ('.' in name or name.endswith('[]')):
+            return True
+
+    return any(_has_objects(column) for column in columns.values())
+
+def _has_objects(column):
+    # NumPy arrays can only contain objects if their type is `object`.
+    if numpy is not None and isinstance(column, numpy.ndarray) and column.dtype.kind != 'O':
+        return False
+
+    return any(_is_or_contains_object(value) for value in column)
+
+def _is_or_contains_object(value):
+    if isinstance(value, dict):
+        return True
+    if isinstance(value, list):
+        return any(_is_or_contains_object(item) for item in value)
+
+    return False
+
+def _validate_rows(compiled_schema, columns, row_count):
+    found = []
+    for row_number, row in enumerate(_get_rows(columns, row_count)):
+        for message in validator._Validation(compiled_schema, row).run():
+            found.append((row_number, message))
+
+    return found
+
+def _validate_columns(compiled_schema, columns, row_count):
+    # Messages are collected per field for all rows, in the order `validate()` reports them for a
+    # single row. Sorting them by row number afterwards keeps that order, because the sort is stable.
+    found = []
+    fields = compiled_schema.fields
+
+    if '.' in fields:
+        rows = None
+        for rule in fields['.'].rules:
+            # Rows are always objects, so only rules other than the object rule can fail.
+            if type(rule.validate) is ObjectValidator:
+                continue
+            if rows is None:
+                rows = _get_rows(columns, row_count)
+            _check_rows(rule, '.', range(row_count), rows, found)
+
+    for name, column in columns.items():
+        if name not in fields:
+            continue
+
+        values = None
+        for rule in fields[name].rules:
+            candidates = None
+            if numpy is not None and isinstance(column, numpy.ndarray):
+                candidates = _find_array_candidates(rule.validate, column)
+            if candidates is not None:
+                _check_rows(rule, name, candidates, column[candidates].tolist(), found)
+                continue
+
+            if values is None:
+                values = _to_list(column)
+            candidates = _find_candidates(rule.validate, values)
+            _check_rows(rule, name, candidates, [ values[i] for i in candidates ], found)
+
+    for name, field in fields.items():
+        if name != '.' and field.strictness == 'required' and name not in columns:
+            found += ((row_number, Message(type='missing_field', field=name)) for row_number in range(row_count))
+
+    if not compiled_schema.tree.root.ignore_extra_fields:
+        for name in columns:
+            if name not in fields:
+                found += ((row_number, Message(type='extra_field', field=name)) for row_number in range(row_count))
+
+    found.sort(key=itemgetter(0))
+    return found
+
+def _get_rows(columns, row_count):
+    names = list(columns)
+    values = [ _to_list(column) for column in columns.values() ]
+    return [ { name: column[row_number] for name, column in zip(names, values) } for row_number in range(row_count) ]
+
+def _check_rows(rule, field_name, row_numbers, values, found):
+    for row_number, value in zip(row_numbers, values):
+        if value is None:
+            if not rule.nullable:
+                found.append((row_number, Message(
+                    type='null_value',
+                    field=field_name,
+                    expected={
+                        'type': rule.type
+                    }
+                )))
+        else:
+            message = rule.validate(field_name, value)
+            if message is not None:
+                found.append((row_number, message))
+
+def _to_list(column):
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column.tolist()
+    return column if isinstance(column, list) else list(column)
+
+def _find_candidates(validate, values):
+    # Returns the rows that may fail the rule. It's fine to return rows that pass, but never to miss a
+    # row that fails. Null values are always candidates, because a rule may not allow them. Comparisons
+    # with NaN are always false, so NaN is a candidate whenever there's a minimum or a maximum.
+    kind = type(validate)
+    if kind is AnyValidator:
+        return [ i for i, value in enumerate(values) if value is None ]
+
+    if kind is BoolValidator:
+        return [ i for i, value in enumerate(values) if type(value) is not bool ]
+
+    if kind is ObjectValidator:
+        return [ i for i, value in enumerate(values) if type(value) is not dict ]
+
+    if kind is StringValidator and validate._regex is None and validate._options is None:
+        return _find_sized_candidates(str, validate._min, validate._max, values)
+
+    if kind is ListValidator:
+        return _find_sized_candidates(list, validate._min, validate._max, values)
+
+    if kind is NumberValidator and _has_simple_range(validate):
+        low, high = validate._min, validate._max
+        return [
+            i for i, value in enumerate(values)
+            if (type(value) is not int and type(value) is not float)
+            or (low is not None and not value >= low)
+            or (high is not None and not value <= high)
+        ]
+
+    if kind is IntValidator and _has_simple_range(validate._validate_number):
+        low, high = validate._validate_number._min, validate._validate_number._max
+        return [
+            i for i, value in enumerate(values)
+            if (type(value) is not int and (type(value) is not float or not value.is_integer()))
+            or (low is not None and not value >= low)
+            or (high is not None and not value <= high)
+        ]
+
+    return list(range(len(values)))
+
+def _find_sized_candidates(value_type, low, high, values):
+    return [
+        i for i, value in enumerate(values)
+        if type(value) is not value_type
+        or (low is not None and len(value) < low)
+        or (high is not None and len(value) > high)
+    ]
+
+def _find_array_candidates(validate, array):
+    # The same as `_find_candidates()`, but vectorized. Returns `None` if the rule can't be checked
+    # for this kind of array, e.g. an array of Python objects.
+    kind = type(validate)
+    dtype_kind = array.dtype.kind
+
+    if kind is BoolValidator and dtype_kind == 'b':
+        return []
+
+    if kind is StringValidator and dtype_kind == 'U' and validate._regex is None and validate._options is None:
+        return _flagged_rows(_outside(numpy.char.str_len(array), validate._min, validate._max))
+
+    if kind is NumberValidator and _has_simple_range(validate) and _has_exact_bounds(array, validate):
+        return _flagged_rows(_outside(array, validate._min, validate._max))
+
+    if kind is IntValidator and _has_simple_range(validate._validate_number) and _has_exact_bounds(array, validate._validate_number):
+        mask = _outside(array, validate._validate_number._min, validate._validate_number._max)
+        if dtype_kind == 'f':
+            mask |= ~numpy.isfinite(array) | (array != numpy.floor(array))
+        return _flagged_rows(mask)
+
+    return None
+
+def _outside(array, low, high):
+    mask = numpy.zeros(len(array), dtype=bool)
+    if low is not None:
+        mask |= ~(array >= low)
+    if high is not None:
+        mask |= ~(array <= high)
+    return mask
+
+def _flagged_rows(mask):
+    return numpy.flatnonzero(mask).tolist()
+
+def _has_simple_range(validate):
+    # Only plain numbers compare the same way in Python and NumPy as they do with `Decimal`.
+    return validate._is_native and validate._options is None
+
+def _has_exact_bounds(array, validate):
+    # NumPy compares an array with a Python number in the type of the array, e.g. a float32 array with
+    # `0.7` in float32, or an int64 array with a float in float64, and then rounding can hide a value
+    # that's out of range. Python compares the values `tolist()` gives you exactly, so we only compare
+    # float64 arrays with floats and int64 arrays with ints, where NumPy is exact as well.
+    if array.dtype == numpy.float64:
+        bound_type = float
+    elif array.dtype == numpy.int64:
+        bound_type = int
+    else:
+        return False
+
+    return all(type(bound) is bound_type for bound in (validate._min, validate._max) if bound is not None)
@@ -0,0 +1,201 @@
+import re
+from . import validator
+from .message import Message
+from .walker import _Path, _Unsupported, _Walk
+
+# Re-validating a changed document only visits the changed fields. Messages for a changed field and
+# everything below it are replaced by the messages the walker reports for the new value. Fields
+# above a changed field keep their messages, except for fields with custom validators, because a
+# custom validator may look at the entire value, including the part that changed.
+#
+# The messages are the same as the ones `validate()` returns, but the messages for changed fields
+# come after the messages of the unchanged fields, so the order may be different.
+
+_PATH_PATTERN = re.compile(r'([^.\[\]]+)|\[(\d+)\]')
+
+def revalidate(schema, document, messages, changes, message_values=None):
+    compiled_schema = validator._validator._precompile(schema, 'lazy')
+    walker = compiled_schema.walker
+
+    changed_paths = []
+    for change in changes:
+        if isinstance(change, dict):
+            changed_paths += _get_patched_paths(document, change)
+        else:
+            changed_paths.append(_resolve(document, _parse_path(change)))
+
+    result = None
+    if () not in changed_paths:
+        result = _revalidate_paths(walker, document, _remove_nested_paths(changed_paths))
+
+    # The walker can't handle every document, e.g. if keys contain dots, so then we just validate the
+    # whole document again.
+    if result is None:
+        return validator._validator._validate_one(compiled_schema, document, message_values, 'lazy', None)
+
+    ancestor_fields, changed_fields, new_messages = result
+    kept_messages = [ message for message in messages if not _is_changed(getattr(message, 'field', None), ancestor_fields, changed_fields) ]
+    if message_values:
+        for message in new_messages:
+            message.add(**message_values)
+
+    return kept_messages + new_messages
+
+def _revalidate_paths(walker, document, changed_paths):
+    walk = _Walk(walker, None)
+    changed_fields = set()
+    ancestors = {}
+
+    try:
+        for segments in changed_paths:
+            node = walker.root
+            path = _Path(None, None)
+            value = document
+            for segment in segments[:-1]:
+                _add_ancestor(ancestors, node, value, path)
+                node = _get_child(node, segment)
+                path = _Path(path, segment)
+                value = value[segment]
+
+            _add_ancestor(ancestors, node, value, path)
+            changed_fields.add(_Path(path, segments[-1]).text)
+            _revalidate_child(walk, node, value, path, segments[-1])
+    except _Unsupported:
+        return None
+
+    # Only the rules of the ancestor itself run again, not the rules of its children, because the
+    # children haven't changed.
+    for field_name, (node, value) in ancestors.items():
+        group = walk._groups.setdefault(node, [])
+        for validate, is_built_in in node.checks:
+            if is_built_in:
+                message = validate(None, value)
+                if message is not None:
+                    message.field = field_name
+            else:
+                message = validate(field_name, value)
+
+            if message is not None:
+                walk._add(group, message)
+
+    return set(ancestors), changed_fields, walk.get_messages()
+
+def _add_ancestor(ancestors, node, value, path):
+    if node is not None and any(not is_built_in for _, is_built_in in node.checks):
+        ancestors[path.text] = (node, value)
+
+def _revalidate_child(walk, node, parent_value, parent_path, key):
+    # If the parent isn't in the schema, neither is the child, so it has no messages.
+    if node is None:
+        return
+
+    exists = key in parent_value if isinstance(parent_value, dict) else 0 <= key < len(parent_value)
+    if not exists:
+        for bucket, child_name, child_key in node.missing:
+            if child_key == key:
+                walk._add(walk._missing[bucket], Message(type='missing_field', field=parent_path.child_text(child_name)))
+        return
+
+    child = _get_child(node, key)
+    if child is not None:
+        walk.visit(child, parent_value[key], parent_path, key)
+    elif isinstance(parent_value, dict) and not node.ignore_extra_fields:
+        walk._add(walk._extras, parent_path.child_text(key))
+
+def _get_child(node, segment):
+    if node is None:
+        return None
+
+    if type(segment) is int:
+        return node.element
+
+    if segment in node.unusual_keys:
+        raise _Unsupported()
+    return node.children.get(segment)
+
+def _is_changed(field_name, ancestor_fields, changed_fields):
+    if field_name is None:
+        return False
+
+    if field_name in ancestor_fields or field_name in changed_fields:
+        return True
+
+    for changed_path in changed_fields:
+        if field_name.startswith(changed_path) and field_name[len(changed_path)] in '.[':
+            return True
+
+    return False
+
+def _parse_path(field_name):
+    if field_name == '.':
+        return []
+
+    segments = []
+    for key, index in _PATH_PATTERN.findall(field_name):
+        if key:
+            segments.append(key)
+        elif index:
+            segments.append(int(index))
+
+    return segments
+
+def _get_patched_paths(document, operation):
+    op = operation.get('op')
+    if op == 'test':
+        return []
+
+    pointers = [ operation['path'] ]
+    if op == 'move':
+        pointers.append(operation['from'])
+
+    paths = []
+    for pointer in pointers:
+        segments = [ segment.replace('~1', '/').replace('~0', '~') for segment in pointer.split('/')[1:] ]
+        path = _resolve(document, segments, from_pointer=True)
+
+        # Adding or removing a list element moves all elements after it, so the entire list changed.
+        if op in ('add', 'remove', 'move') and len(path) == len(segments) and path and type(path[-1]) is int:
+            path = path[:-1]
+        paths.append(path)
+
+    return paths
+
+def _resolve(document, segments, from_pointer=False):
+    # Finds the part of the path that exists in the document. If a key is missing from an object,
+    # the key was removed, so the object itself didn't change. Otherwise, the change affects the
+    # deepest value that does exist.
+    value = document
+    path = []
+    for segment in segments:
+        if isinstance(value, list):
+            if from_pointer and segment == '-':
+                return tuple(path)
+            if from_pointer:
+                if not segment.isdigit():
+                    return tuple(path)
+                segment = int(segment)
+            if type(segment) is not int:
+                return tuple(path)
+            if not 0 <= segment < len(value):
+                return tuple(path)
+        elif isinstance(value, dict):
+            if type(segment) is not str:
+                return tuple(path)
+            if segment not in value:
+                return tuple(path + [ segment ])
+        else:
+            return tuple(path)
+
+        path.append(segment)
+        value = value[segment]
+
+    return tuple(path)
+
+def _remove_nested_paths(paths):
+    paths = sorted(set(paths), key=len)
+    result = []
+    for path in paths:
+        if not any(path[:len(other)] == other for other in result):
+            result.append(path)
+
+    return result
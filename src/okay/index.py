@@ -1,3 +1,5 @@
+from .schema_tree import SchemaTree
+
 class Index:
     def __init__(self):
         self.fields = {}
@@ -7,45 +9,76 @@ class IndexEntry:
     def __init__(self, path, value):
         self.path = path
         self.value = value
+        self.shape = None
+
+def create_index(document, schema_fields, shape_cache=None):
+    # You can pass a schema tree, or just the field names, in which case we build the tree here.
+    tree = schema_fields if isinstance(schema_fields, SchemaTree) else SchemaTree(dict.fromkeys(schema_fields))
 
-def create_index(document, schema_fields):
     index = Index()
-    index.fields['.'] = [ IndexEntry(path='.', value=document) ]
+    root = IndexEntry(path='.', value=document)
+    index.fields['.'] = [ root ]
 
     if isinstance(document, dict):
-        _create_object_entry(index, document, schema_fields, parent_name='.', parent_path='.')
+        root.shape = _create_object_entry(index, document, tree, tree.root, '.', shape_cache)
 
     return index
 
-def _create_object_entry(index, document, schema_fields, parent_name, parent_path):
-    for key, value in document.items():
-        field_name = parent_name + '.' + key if parent_name != '.' else key
-        path = parent_path + '.' + key if parent_path != '.' else key
-        if field_name not in schema_fields:
-            index.extra_fields.append(path)
+def _create_object_entry(index, document, tree, parent, parent_path, shape_cache):
+    # Returns the shape of the object, if the shape cache has it, so we can use it again to find
+    # missing fields.
+    ignore_extra_fields = parent.ignore_extra_fields
+    if ignore_extra_fields and not parent.children and not parent.unusual_keys:
+        # Every key is an extra field that we'd ignore anyway.
+        return None
+
+    shape = shape_cache.get(parent, document) if shape_cache is not None else None
+    nodes = shape.children if shape is not None else _find_nodes(tree, parent, document)
+    for (key, value), node in zip(document.items(), nodes):
+        if node is None:
+            if not ignore_extra_fields:
+                index.extra_fields.append(parent_path + '.' + key if parent_path != '.' else key)
             continue
 
-        index.fields[field_name] = index.fields.get(field_name, [])
+        path = parent_path + '.' + key if parent_path != '.' else key
+
+        entries = index.fields.get(node.name)
+        if entries is None:
+            entries = index.fields[node.name] = []
 
-        index.fields[field_name].append(IndexEntry(path, value))
+        entry = IndexEntry(path, value)
+        entries.append(entry)
 
         if isinstance(value, dict):
-            _create_object_entry(index, value, schema_fields, field_name, path)
+            entry.shape = _create_object_entry(index, value, tree, node, path, shape_cache)
         elif isinstance(value, list):
-            _create_list_entry(index, value, schema_fields, field_name, path)
+            _create_list_entry(index, value, tree, node, path, shape_cache)
+
+    return shape
+
+def _find_nodes(tree, parent, document):
+    children = parent.children
+    for key in document:
+        node = children.get(key)
+        if node is None and key in parent.unusual_keys:
+            node = tree.get_child(parent, key)
+        yield node
 
-def _create_list_entry(index, document, schema_fields, parent_name, parent_path):
-    field_name = parent_name + '[]'
-    if field_name not in schema_fields:
+def _create_list_entry(index, document, tree, parent, parent_path, shape_cache):
+    node = parent.element
+    if node is None:
         return
 
-    index.fields[field_name] = index.fields.get(field_name, [])
+    entries = index.fields.get(node.name)
+    if entries is None:
+        entries = index.fields[node.name] = []
 
     for i, value in enumerate(document):
         path = parent_path + '[' + str(i) + ']'
-        index.fields[field_name].append(IndexEntry(path, value))
+        entry = IndexEntry(path, value)
+        entries.append(entry)
 
         if isinstance(value, dict):
-            _create_object_entry(index, value, schema_fields, field_name, path)
+            entry.shape = _create_object_entry(index, value, tree, node, path, shape_cache)
         elif isinstance(value, list):
-            _create_list_entry(index, value, schema_fields, field_name, path)
\ No newline at end of file
+            _create_list_entry(index, value, tree, node, path, shape_cache)
\ No newline at end of file
@@ -0,0 +1,130 @@
+import json
+import mmap
+import os
+from . import parallel
+from . import validator
+from .message import Message
+
+_BUFFER_SIZE = 1024 * 1024
+
+def validate_jsonl(schema, file, message_values=None, engine='interpreter', max_messages=None, fail_fast=False, workers=None, chunk_bytes=16 * 1024 * 1024):
+    max_messages = validator._get_max_messages(max_messages, fail_fast)
+
+    # Compile the schema before we start reading, so schema errors are raised right away instead of
+    # when you ask for the first result.
+    run = validator._validator._get_runner(schema, engine, max_messages)
+    if workers is None:
+        return _validate_file(run, file, message_values)
+
+    if not isinstance(file, (str, bytes, os.PathLike)):
+        raise ValueError('You must pass the path of the file to use worker processes.')
+    if chunk_bytes < 1:
+        raise ValueError('The chunk size must be at least 1 byte.')
+
+    ranges = ((file, start, end) for start, end in _split_file(file, chunk_bytes))
+    results = parallel.map_in_processes(schema, engine, max_messages, workers, _validate_range, ranges)
+    return _number_lines(results, message_values)
+
+def _validate_file(run, file, message_values):
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, 'rb', buffering=_BUFFER_SIZE) as opened_file:
+            yield from _validate_lines(run, opened_file, message_values)
+    elif hasattr(file, 'buffer') and _is_unread(file):
+        # A file opened in text mode may translate line endings and use any encoding, so we read the
+        # binary file underneath it to count the bytes that are actually in the file, and decode each
+        # line ourselves. That only works if nobody read from the file yet, because the text file
+        # reads ahead, so the binary file may already be past the lines that are left.
+        yield from _validate_lines(run, file.buffer, message_values, decode_with=file.encoding)
+    else:
+        yield from _validate_lines(run, file, message_values, encode_with=getattr(file, 'encoding', None) or 'utf-8')
+
+def _is_unread(file):
+    try:
+        return file.tell() == 0
+    except (OSError, ValueError):
+        return False
+
+def _validate_lines(run, file, message_values, decode_with=None, encode_with='utf-8'):
+    # Lines from a text file are encoded again to determine their length in bytes. If the file
+    # translates line endings, that length is off, but that's the best we can do.
+    byte_offset = 0
+    for line_number, line in enumerate(file, start=1):
+        line_length = len(line) if isinstance(line, bytes) else len(line.encode(encode_with, 'replace'))
+        if line.strip():
+            messages = _validate_line(run, line, decode_with)
+            for message in messages:
+                message.add(line_number=line_number, byte_offset=byte_offset)
+                if message_values:
+                    message.add(**message_values)
+
+            yield line_number, messages
+
+        byte_offset += line_length
+
+def _validate_line(run, line, decode_with=None):
+    try:
+        document = json.loads(line if decode_with is None else line.decode(decode_with))
+    except json.JSONDecodeError as e:
+        return [Message(
+            type='invalid_json',
+            message=e.msg,
+            position=e.pos
+        )]
+    except UnicodeDecodeError as e:
+        return [Message(
+            type='invalid_json',
+            message=e.reason,
+            position=e.start
+        )]
+
+    return run(document)
+
+def _split_file(path, chunk_bytes):
+    # Splits the file into byte ranges of roughly `chunk_bytes` bytes that end right after a newline,
+    # so each range contains complete lines. Worker processes read the ranges themselves, so we only
+    # send them the offsets.
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            start = 0
+            while start < size:
+                end = mapped_file.find(b'\n', min(start + chunk_bytes, size) - 1)
+                end = size if end == -1 else end + 1
+                yield start, end
+                start = end
+
+def _validate_range(path, start, end):
+    results = []
+    line_count = 0
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            position = start
+            while position < end:
+                line_end = mapped_file.find(b'\n', position, end)
+                line_end = end if line_end == -1 else line_end + 1
+                line = mapped_file[position:line_end]
+                line_count += 1
+
+                if line.strip():
+                    messages = _validate_line(parallel.validate_in_worker, line)
+                    results.append((line_count, position, messages))
+
+                position = line_end
+
+    return line_count, results
+
+def _number_lines(results, message_values):
+    lines_before = 0
+    for line_count, range_results in results:
+        for line_number, byte_offset, messages in range_results:
+            for message in messages:
+                message.add(line_number=lines_before + line_number, byte_offset=byte_offset)
+                if message_values:
+                    message.add(**message_values)
+
+            yield lines_before + line_number, messages
+
+        lines_before += line_count
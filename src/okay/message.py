@@ -1,11 +1,123 @@
+_unset = object()
+
 class Message:
-    def __init__(self, type, **kwargs):
-        self.type = type
-        self.add(**kwargs)
-        
+    # Validators can produce a lot of messages, so a message stores the fields that every message
+    # has in slots, and only creates a dictionary if it gets any other fields, e.g. from
+    # `message_values`. Other fields work like regular attributes, they just live in that dictionary.
+    __slots__ = ('type', 'field', 'expected', '_values')
+
+    def __init__(self, type, field=_unset, expected=_unset, **kwargs):
+        # Setting the slots directly skips `__setattr__()`, which makes creating a message a lot faster.
+        _set_type(self, type)
+        if field is not _unset:
+            _set_field(self, field)
+        if expected is not _unset:
+            _set_expected(self, expected)
+        _set_values(self, kwargs or None)
+
     def add(self, **kwargs):
         for key, value in kwargs.items():
-            self.__dict__[key] = value
-    
+            self.__setattr__(key, value)
+
+    def __setattr__(self, name, value):
+        if name in _slots:
+            object.__setattr__(self, name, value)
+        elif self._values is None:
+            _set_values(self, { name: value })
+        else:
+            self._values[name] = value
+
+    def __delattr__(self, name):
+        if name in _slots:
+            object.__delattr__(self, name)
+            return
+
+        try:
+            del self._values[name]
+        except (KeyError, TypeError):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+    def __getattr__(self, name):
+        # Only called if the attribute isn't in a slot. Don't use `self._values` here, because it may
+        # not be set yet, e.g. while unpickling.
+        if name not in _slots:
+            try:
+                return Message._values.__get__(self)[name]
+            except (AttributeError, KeyError, TypeError):
+                pass
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def __dict__(self):
+        return _Properties(self)
+
+    def to_dict(self):
+        values = { 'type': self.type }
+        try:
+            values['field'] = self.field
+        except AttributeError:
+            pass
+        try:
+            values['expected'] = self.expected
+        except AttributeError:
+            pass
+        if self._values is not None:
+            values.update(self._values)
+
+        return values
+
+    def __eq__(self, other):
+        if not isinstance(other, Message):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _restore, (type(self), self.to_dict())
+
     def __repr__(self):
-        return self.type + ': ' + self.field
\ No newline at end of file
+        field = getattr(self, 'field', None)
+        return self.type + ': ' + field if field is not None else self.type
+
+class _Properties(dict):
+    # What `message.__dict__` and `vars(message)` return: a new dictionary with all properties of the
+    # message, which writes any change back to the message, like the `__dict__` of a regular object.
+    __slots__ = ('_message',)
+
+    def __init__(self, message):
+        super().__init__(message.to_dict())
+        self._message = message
+
+def _writes_back(method):
+    def write(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        message = self._message
+        for name in ('type', 'field', 'expected'):
+            if name not in self:
+                try:
+                    object.__delattr__(message, name)
+                except AttributeError:
+                    pass
+        _set_values(message, None)
+        message.add(**self)
+        return result
+
+    return write
+
+for _name in ('__setitem__', '__delitem__', '__ior__', 'clear', 'pop', 'popitem', 'setdefault', 'update'):
+    setattr(_Properties, _name, _writes_back(getattr(dict, _name)))
+
+def _restore(message_type, values):
+    message = message_type.__new__(message_type)
+    _set_values(message, None)
+    message.add(**values)
+    return message
+
+_set_type = Message.type.__set__
+_set_field = Message.field.__set__
+_set_expected = Message.expected.__set__
+_set_values = Message._values.__set__
+_slots = frozenset(Message.__slots__)
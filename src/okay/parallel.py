@@ -0,0 +1,83 @@
+import multiprocessing
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from . import validator
+from .schema_error import SchemaError
+
+_run = None
+
+def validate_in_processes(schema, documents, workers, chunk_size, engine, max_messages=None):
+    if chunk_size < 1:
+        raise ValueError('The chunk size must be at least 1.')
+
+    tasks = ((chunk,) for chunk in _split(documents, chunk_size))
+    results = map_in_processes(schema, engine, max_messages, workers, _validate_chunk, tasks)
+
+    document_number = 0
+    for chunk_messages in results:
+        for messages in chunk_messages:
+            yield document_number, messages
+            document_number += 1
+
+def map_in_processes(schema, engine, max_messages, workers, function, tasks):
+    # Runs `function` in worker processes for each tuple of arguments in `tasks` and yields the
+    # results in order. The function runs after `_initialize_worker()`, so it can use
+    # `validate_in_worker()`.
+    if workers < 1:
+        raise ValueError('The number of workers must be at least 1.')
+
+    executor = ProcessPoolExecutor(
+        workers,
+        mp_context=_get_context(schema),
+        initializer=_initialize_worker,
+        initargs=(schema, engine, max_messages)
+    )
+
+    try:
+        # Only keep a limited number of tasks in flight, so we don't read the entire input into
+        # memory when the workers can't keep up.
+        pending = deque()
+        for arguments in tasks:
+            pending.append(executor.submit(function, *arguments))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+def validate_in_worker(document):
+    return _run(document)
+
+def _get_context(schema):
+    # If the schema can be pickled, i.e. it's a function at the top level of a module, worker
+    # processes can import it by name, so any start method will do. Otherwise, the workers have to
+    # inherit the schema from this process, which only works if we fork.
+    try:
+        pickle.dumps(schema)
+        return multiprocessing.get_context()
+    except (pickle.PicklingError, AttributeError, TypeError):
+        pass
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+
+    raise SchemaError(f"Schema `{getattr(schema, '__name__', schema)}` can't be sent to worker processes. Define the schema at the top level of a module.")
+
+def _split(documents, chunk_size):
+    iterator = iter(documents)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+def _initialize_worker(schema, engine, max_messages):
+    global _run
+    _run = validator.Validator()._get_runner(schema, engine, max_messages)
+
+def _validate_chunk(documents):
+    return [ _run(document) for document in documents ]
+
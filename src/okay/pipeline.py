@@ -0,0 +1,86 @@
+import time
+from collections import deque
+from . import validator
+
+class Pipeline:
+    # A pipeline reads each document from its source once, validates it, and routes it to the sink
+    # for valid documents or the sink for invalid documents. Validation messages go to the message
+    # sink. Sinks receive items in batches, so a sink that writes to a file or a network service
+    # doesn't have to do so for every single document.
+    def __init__(self, schema, valid_sink=None, invalid_sink=None, message_sink=None, message_values=None, engine='interpreter', workers=None, chunk_size=100, batch_size=1000):
+        if batch_size < 1:
+            raise ValueError('The batch size must be at least 1.')
+
+        self.schema = schema
+        self.valid_sink = valid_sink
+        self.invalid_sink = invalid_sink
+        self.message_sink = message_sink
+        self.message_values = message_values
+        self.engine = engine
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+    def run(self, documents):
+        stats = PipelineStats()
+        start_time = time.perf_counter()
+
+        # The validator only returns the validation messages of a document, so we keep the documents
+        # it has read, but not yet returned results for, until we know where they should go. That's
+        # one document at a time, or a limited number of chunks when using worker processes.
+        pending = deque()
+        def read():
+            for document in documents:
+                pending.append(document)
+                yield document
+
+        batches = { sink: [] for sink in (self.valid_sink, self.invalid_sink, self.message_sink) if sink is not None }
+        try:
+            results = validator._validator._validate_many(self.schema, read(), self.message_values, self.engine, self.workers, self.chunk_size, None)
+            for document_number, messages in results:
+                document = pending.popleft()
+                stats.documents += 1
+                if messages:
+                    stats.invalid_documents += 1
+                    stats.messages += len(messages)
+                    self._add(batches, self.invalid_sink, [ document ])
+
+                    for message in messages:
+                        message.add(document_number=document_number)
+                    self._add(batches, self.message_sink, messages)
+                else:
+                    stats.valid_documents += 1
+                    self._add(batches, self.valid_sink, [ document ])
+
+            for sink, batch in batches.items():
+                if batch:
+                    sink.write(batch)
+        finally:
+            for sink in batches:
+                sink.close()
+
+        stats.seconds = time.perf_counter() - start_time
+        return stats
+
+    def _add(self, batches, sink, items):
+        if sink is None:
+            return
+
+        batch = batches[sink]
+        batch += items
+        if len(batch) >= self.batch_size:
+            sink.write(batch)
+            batches[sink] = []
+
+
+class PipelineStats:
+    def __init__(self):
+        self.documents = 0
+        self.valid_documents = 0
+        self.invalid_documents = 0
+        self.messages = 0
+        self.seconds = 0.0
+
+    @property
+    def documents_per_second(self):
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
@@ -0,0 +1,61 @@
+import threading
+
+PHASES = ('compile', 'index', 'rules', 'missing', 'extra')
+
+class Profiler:
+    # Collects timings from a `Validator`. The validator measures a single document on its own and
+    # then adds the results to the profiler in one go, so a profiler can be shared between threads.
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.documents = 0
+            self.messages = 0
+            self.phases = dict.fromkeys(PHASES, 0.0)
+            self.rules = {}
+
+    @property
+    def seconds(self):
+        return sum(self.phases.values())
+
+    def slowest_rules(self, count=10):
+        with self._lock:
+            rules = list(self.rules.values())
+
+        return sorted(rules, key=lambda rule: rule.seconds, reverse=True)[:count]
+
+    def add_compile_time(self, seconds):
+        with self._lock:
+            self.phases['compile'] += seconds
+
+    def add_document(self, phases, rules, messages):
+        with self._lock:
+            self.documents += 1
+            self.messages += len(messages)
+            for phase, seconds in phases.items():
+                self.phases[phase] += seconds
+            for key, (calls, seconds, message_count) in rules.items():
+                stats = self.rules.get(key)
+                if stats is None:
+                    stats = self.rules[key] = RuleStats(*key)
+                stats.calls += calls
+                stats.seconds += seconds
+                stats.messages += message_count
+
+        if self.callback is not None:
+            self.callback(phases, messages)
+
+
+class RuleStats:
+    def __init__(self, field, type):
+        self.field = field
+        self.type = type
+        self.calls = 0
+        self.seconds = 0.0
+        self.messages = 0
+
+    def __repr__(self):
+        return f'{self.field} ({self.type}): {self.calls} calls, {self.seconds:.6f}s, {self.messages} messages'
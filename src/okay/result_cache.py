@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+
+class ResultCache:
+    # Stores the validation messages of documents, or of parts of documents, that the validator has
+    # seen before. The walker records what it reported while it validated a field listed in `fields`,
+    # and if it finds the same value for that field again, it replays the recording instead of
+    # validating the value again. This assumes custom validators always return the same message for
+    # the same value.
+    def __init__(self, fields=('.',), max_size=1024, key=None):
+        self.fields = frozenset(fields)
+        self.max_size = max_size
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._results)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def get_key(self, node, value):
+        if self.key is not None:
+            return node, self.key(value)
+
+        try:
+            return node, _freeze(value)
+        except TypeError:
+            # The value contains something that can't be hashed, so we can't cache it.
+            return None
+
+    def get(self, key):
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self._results.move_to_end(key)
+                self.hits += 1
+
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._results[key] = result
+            while self.max_size is not None and len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+def _freeze(value):
+    # Turns a value into something hashable that is only equal to the frozen version of an identical
+    # value. Types are included, because `1`, `1.0` and `True` are equal in Python, but they don't
+    # produce the same validation messages. Key order is kept, because it determines the order of
+    # the messages.
+    value_type = type(value)
+    if value_type is dict:
+        return value_type, tuple((key, _freeze(item)) for key, item in value.items())
+    if value_type is list:
+        return value_type, tuple(_freeze(item) for item in value)
+
+    hash(value)
+    return value_type, value
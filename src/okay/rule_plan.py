@@ -0,0 +1,76 @@
+from .type_validators import AnyValidator, BoolValidator, ListValidator, ObjectValidator, StringValidator
+
+# The schema compiler adds implicit rules for every parent of a field, and every field you specify
+# without a type gets an `any` rule, so a field often has rules that can never fail, or several rules
+# that all start by checking the same type. A rule plan decides once, when the schema tree is built,
+# what actually needs to run for a field. It still reports exactly the messages the rules would, in
+# the same order, so the engines can run the plan instead of the rules.
+
+# Validators of these types report `invalid_type` if the value isn't an instance of the Python type,
+# and without parameters, that's the only thing they check.
+_TYPE_CHECKS = {
+    BoolValidator: (bool, 'bool'),
+    ListValidator: (list, 'list'),
+    ObjectValidator: (dict, 'object'),
+    StringValidator: (str, 'string')
+}
+
+class RulePlan:
+    __slots__ = ('null_types', 'type_check', 'checks', 'validators', 'dropped')
+
+    def __init__(self, rules):
+        # A null value only ever gets a `null_value` message from each rule that isn't nullable, so
+        # that's decided for the field as a whole.
+        self.null_types = tuple(rule.type for rule in rules if not rule.nullable)
+
+        checks = [ rule for rule in rules if type(rule.validate) is not AnyValidator ]
+        self.dropped = [ (rule, 'no-op') for rule in rules if type(rule.validate) is AnyValidator ]
+
+        # If all checks start with the same type check, the plan checks the type once. If the value has
+        # the wrong type, every check would report `invalid_type`, so the plan reports it once per
+        # check. If the type is right, checks without parameters can't fail anymore. That only pays off
+        # if there are checks without parameters, otherwise the type would just be checked twice.
+        self.type_check = None
+        kinds = { type(rule.validate) for rule in checks }
+        merged = [ rule for rule in checks if not _has_parameters(rule.validate) ]
+        if len(kinds) == 1 and next(iter(kinds)) in _TYPE_CHECKS and merged:
+            python_type, type_name = _TYPE_CHECKS[kinds.pop()]
+            self.type_check = (python_type, { 'type': type_name }, len(checks))
+            self.dropped += ((rule, 'merged into type check') for rule in merged)
+            checks = [ rule for rule in checks if _has_parameters(rule.validate) ]
+
+        self.checks = tuple(checks)
+        self.validators = tuple(rule.validate for rule in checks)
+
+    def describe(self):
+        lines = []
+        if self.null_types:
+            lines.append('if null: ' + ', '.join('null_value (' + rule_type + ')' for rule_type in self.null_types))
+        if self.type_check is not None:
+            python_type, _, count = self.type_check
+            lines.append('if not ' + python_type.__name__ + ': invalid_type' + (' x' + str(count) if count > 1 else ''))
+        if self.checks:
+            lines.append('run: ' + ', '.join(_describe_rule(rule) for rule in self.checks))
+        if self.dropped:
+            lines.append('dropped: ' + ', '.join(_describe_rule(rule) + ' (' + reason + ')' for rule, reason in self.dropped))
+
+        return lines or [ 'nothing to run' ]
+
+
+def _has_parameters(validate):
+    if type(validate) is ListValidator:
+        return validate._min is not None or validate._max is not None
+    if type(validate) is StringValidator:
+        return any(parameter is not None for parameter in (validate._regex, validate._options, validate._min, validate._max))
+
+    return False
+
+def _describe_rule(rule):
+    parameters = ', '.join(key + '=' + _describe_value(value) for key, value in rule.parameters.items())
+    text = rule.type + ('?' if rule.nullable else '') + ('(' + parameters + ')' if parameters else '')
+    return 'implicit ' + text if rule.is_implicit else text
+
+def _describe_value(value):
+    if callable(value) and hasattr(value, '__name__'):
+        return value.__name__
+    return repr(value)
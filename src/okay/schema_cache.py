@@ -0,0 +1,90 @@
+import inspect
+import threading
+import weakref
+from collections import OrderedDict
+from .schema_compiler import compile
+from .schema_error import SchemaError
+
+class SchemaCache:
+    def __init__(self, max_size=None, weak=False):
+        self.max_size = max_size
+        self.weak = weak
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._compiled_schemas = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Weak references can die at any moment, also while we hold the lock, so their callbacks
+        # only make a note of the dead reference. We remove dead references the next time we use
+        # the cache.
+        self._dead_keys = []
+
+    def __len__(self):
+        with self._lock:
+            self._remove_dead_keys()
+            return len(self._compiled_schemas)
+
+    def get(self, schema):
+        key = self._get_key(schema, for_lookup=True)
+        with self._lock:
+            self._remove_dead_keys()
+            compiled_schema = self._compiled_schemas.get(key)
+            if compiled_schema is not None:
+                self._compiled_schemas.move_to_end(key)
+                self.hits += 1
+                return compiled_schema
+
+            self.misses += 1
+
+        # Compile outside of the lock, because the schema may run arbitrary code, including code that
+        # compiles other schemas. If two threads compile the same schema at the same time, the first
+        # one to finish wins.
+        try:
+            compiled_schema = compile(schema)
+        except Exception as e:
+            raise SchemaError(f"Schema raised `{type(e).__name__}`.") from e
+
+        key = self._get_key(schema)
+        with self._lock:
+            compiled_schema = self._compiled_schemas.setdefault(key, compiled_schema)
+            self._evict()
+            return compiled_schema
+
+    def invalidate(self, schema):
+        key = self._get_key(schema, for_lookup=True)
+        with self._lock:
+            self._compiled_schemas.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._compiled_schemas.clear()
+            self._dead_keys.clear()
+
+    def _get_key(self, schema, for_lookup=False):
+        if not self.weak:
+            return schema
+
+        callback = None if for_lookup else self._dead_keys.append
+        try:
+            if inspect.ismethod(schema):
+                return weakref.WeakMethod(schema, callback)
+            else:
+                return weakref.ref(schema, callback)
+        except TypeError:
+            # Not every callable supports weak references, so fall back to a regular reference.
+            return schema
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+
+        while len(self._compiled_schemas) > self.max_size:
+            self._compiled_schemas.popitem(last=False)
+            self.evictions += 1
+
+    def _remove_dead_keys(self):
+        while self._dead_keys:
+            self._compiled_schemas.pop(self._dead_keys.pop(), None)
+
+shared_schema_cache = SchemaCache()
@@ -1,15 +1,32 @@
+import threading
 from . import type_validators
 from .schema_error import SchemaError
+from .schema_tree import SchemaTree
 from collections import defaultdict
 
-_active_schema = None
+# Each thread compiles its own schema, and a schema may cause another schema to be compiled while
+# it's running, e.g. when a custom validator calls `validate()`, so the active schema is stored per
+# thread and restored when compilation finishes.
+_state = threading.local()
 
 def compile(schema):
-    global _active_schema
-    _active_schema = Schema()
-
-    schema()
-    return _active_schema
+    previous_schema = getattr(_state, 'active_schema', None)
+    _state.active_schema = Schema()
+
+    try:
+        schema()
+        compiled_schema = _state.active_schema
+        for field_name in compiled_schema.ignore_extra_fields_in:
+            if field_name not in compiled_schema.fields:
+                raise SchemaError(
+                    "Field '" + field_name + "' ignores extra fields, but it isn't in the schema.",
+                    type='unknown_field',
+                    field=field_name.strip('[]')
+                )
+        compiled_schema.tree = SchemaTree(compiled_schema.fields, compiled_schema.ignore_extra_fields, compiled_schema.ignore_extra_fields_in)
+        return compiled_schema
+    finally:
+        _state.active_schema = previous_schema
 
 def required(field_name, type=None, **kwargs):
     _process(field_name, type, is_required=True, **kwargs)
@@ -24,8 +41,11 @@ def optional(field_name, type=None, **kwargs):
     
     _process(field_name, type, is_required=False, **kwargs)
 
-def ignore_extra_fields():
-    _active_schema.ignore_extra_fields = True
+def ignore_extra_fields(field_name=None):
+    if field_name is None or field_name == '.':
+        _state.active_schema.ignore_extra_fields = True
+    else:
+        _state.active_schema.ignore_extra_fields_in.append(field_name)
 
 def _process(field_name, type, is_required, **kwargs):
     if type is not None:
@@ -37,19 +57,20 @@ def _process(field_name, type, is_required, **kwargs):
         nullable = False
         is_implicit = True
 
+    active_schema = _state.active_schema
     strictness = 'required' if is_required else 'optional'
     if type == 'list':
-        _active_schema.fields[field_name + '[]'].strictness = strictness
+        active_schema.fields[field_name + '[]'].strictness = strictness
     
     while field_name:
-        field = _active_schema.fields[field_name]
+        field = active_schema.fields[field_name]
         _raise_on_schema_errors(field, field_name, strictness, nullable, is_implicit)
         
         if not is_implicit and type in ['object', 'list']:
             field.remove_implicit_rule_for(type)
         if not (type in ['object', 'list'] and is_implicit and field.has_rule_for(type)):
             validation_function = _get_validation_function(type, field_name, kwargs)
-            rule = Rule(type, nullable, is_implicit, validation_function)
+            rule = Rule(type, nullable, is_implicit, validation_function, kwargs)
             field.rules.append(rule)
 
         field.nullable = field.nullable or nullable
@@ -110,6 +131,10 @@ class Schema:
     def __init__(self):
         self.fields = defaultdict(Field)
         self.ignore_extra_fields = False
+        self.ignore_extra_fields_in = []
+        self.tree = None
+        self.generated_function = None
+        self.walker = None
 
 
 class Field:
@@ -140,12 +165,13 @@ class Field:
         return False
     
     def remove_implicit_rule_for(self, type):
-        self.rules = [ rules for rule in self.rules if rule.type != type or not rule.is_implicit ]
+        self.rules = [ rule for rule in self.rules if rule.type != type or not rule.is_implicit ]
 
 
 class Rule:
-    def __init__(self, type, nullable, is_implicit, validation_function):
+    def __init__(self, type, nullable, is_implicit, validation_function, parameters=None):
         self.type = type
         self.nullable = nullable
         self.is_implicit = is_implicit
-        self.validate = validation_function
\ No newline at end of file
+        self.validate = validation_function
+        self.parameters = parameters if parameters is not None else {}
\ No newline at end of file
@@ -3,3 +3,7 @@ class SchemaError(Exception):
         super(SchemaError, self).__init__(message)
         self.type = type
         self.field = field
+
+    def __reduce__(self):
+        # Keep `type` and `field` when the exception is sent from a worker process.
+        return SchemaError, (str(self), self.type, self.field)
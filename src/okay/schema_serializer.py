@@ -0,0 +1,143 @@
+import importlib
+import json
+from decimal import Decimal
+from .schema_cache import shared_schema_cache
+from .schema_compiler import Field, Rule, Schema, _get_validation_function
+from .schema_error import SchemaError
+
+# Compiled schemas are stored as compact JSON. Type validator parameters are stored as they were
+# passed to `required()` or `optional()`, so loading a schema builds the type validators again, but
+# it doesn't run the schema definition. Functions, like custom validators, are stored by name, so
+# they must be defined at the top level of a module. JSON has no tuples, so tuples are tagged like
+# decimals, to get them back as tuples.
+
+FORMAT_VERSION = 1
+
+def dumps_schema(schema):
+    compiled_schema = schema if isinstance(schema, Schema) else shared_schema_cache.get(schema)
+    data = {
+        'format': 'okay-schema',
+        'version': FORMAT_VERSION,
+        'ignore_extra_fields': compiled_schema.ignore_extra_fields,
+        'ignore_extra_fields_in': compiled_schema.ignore_extra_fields_in,
+        'fields': [ _dump_field(field_name, field) for field_name, field in compiled_schema.fields.items() ]
+    }
+
+    return json.dumps(data, default=_encode_value, separators=(',', ':')).encode('utf-8')
+
+def dump_schema(schema, file):
+    file.write(dumps_schema(schema))
+
+def loads_schema(data):
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+
+    try:
+        data = json.loads(data, object_hook=_decode_value)
+    except ValueError as e:
+        raise SchemaError('Serialized schema is not valid JSON.') from e
+
+    if not isinstance(data, dict) or data.get('format') != 'okay-schema':
+        raise SchemaError('Serialized schema has an unknown format.')
+    if data.get('version') != FORMAT_VERSION:
+        raise SchemaError(f"Serialized schema has version {data.get('version')}, but only version {FORMAT_VERSION} is supported.")
+
+    compiled_schema = Schema()
+    compiled_schema.ignore_extra_fields = data['ignore_extra_fields']
+    for field_data in data['fields']:
+        compiled_schema.fields[field_data['name']] = _load_field(field_data)
+
+    ignore_extra_fields_in = data.get('ignore_extra_fields_in', [])
+    if not isinstance(ignore_extra_fields_in, list) or not all(isinstance(field_name, str) for field_name in ignore_extra_fields_in):
+        raise SchemaError('Serialized schema has an invalid list of fields that ignore extra fields.')
+    for field_name in ignore_extra_fields_in:
+        if field_name not in compiled_schema.fields:
+            raise SchemaError(f"Field '{field_name}' ignores extra fields, but it isn't in the serialized schema.")
+
+    compiled_schema.ignore_extra_fields_in = ignore_extra_fields_in
+
+    return compiled_schema
+
+def load_schema(file):
+    return loads_schema(file.read())
+
+def _dump_field(field_name, field):
+    return {
+        'name': field_name,
+        'strictness': field.strictness,
+        'nullable': field.nullable,
+        'rules': [{
+            'type': rule.type,
+            'nullable': rule.nullable,
+            'implicit': rule.is_implicit,
+            'parameters': _tag_tuples(rule.parameters)
+        } for rule in field.rules ]
+    }
+
+def _load_field(field_data):
+    field = Field()
+    field.strictness = field_data['strictness']
+    field.nullable = field_data['nullable']
+    for rule_data in field_data['rules']:
+        validation_function = _get_validation_function(rule_data['type'], field_data['name'], rule_data['parameters'])
+        field.rules.append(Rule(
+            rule_data['type'],
+            rule_data['nullable'],
+            rule_data['implicit'],
+            validation_function,
+            rule_data['parameters']
+        ))
+
+    return field
+
+def _tag_tuples(value):
+    # `json.dumps()` writes tuples as lists without asking `_encode_value()`, so we tag them first.
+    if isinstance(value, tuple):
+        return { '$tuple': [ _tag_tuples(item) for item in value ] }
+    if isinstance(value, list):
+        return [ _tag_tuples(item) for item in value ]
+    if isinstance(value, dict):
+        return { key: _tag_tuples(item) for key, item in value.items() }
+
+    return value
+
+def _encode_value(value):
+    if isinstance(value, Decimal):
+        return { '$decimal': str(value) }
+
+    if callable(value):
+        module = getattr(value, '__module__', None)
+        name = getattr(value, '__qualname__', None)
+        if module is None or name is None or '<' in name or _import(module, name) is not value:
+            raise SchemaError(f"Function `{getattr(value, '__name__', value)}` can't be serialized. Define it at the top level of a module.")
+
+        return { '$callable': module + ':' + name }
+
+    raise SchemaError(f"Value of type `{type(value).__name__}` can't be serialized.")
+
+def _decode_value(value):
+    if len(value) == 1 and '$decimal' in value:
+        return Decimal(value['$decimal'])
+
+    if len(value) == 1 and '$tuple' in value:
+        return tuple(value['$tuple'])
+
+    if len(value) == 1 and '$callable' in value:
+        module, name = value['$callable'].split(':', 1)
+        function = _import(module, name)
+        if function is None:
+            raise SchemaError(f"Function `{value['$callable']}` specified in serialized schema can't be imported.")
+
+        return function
+
+    return value
+
+def _import(module_name, name):
+    try:
+        value = importlib.import_module(module_name)
+        for part in name.split('.'):
+            value = getattr(value, part)
+    except (ImportError, AttributeError):
+        return None
+
+    return value
@@ -0,0 +1,113 @@
+from .rule_plan import RulePlan
+
+# A schema tree has one node for each object or list level in a schema, linked to the nodes of its
+# children and its list elements, so you can find the node of a key with a single dictionary lookup
+# instead of building and looking up a dotted field name. Each node also knows which keys it allows
+# and which keys it requires, so checking an object for missing or extra fields is a set operation.
+#
+# Keys that contain a dot or end with `[]` are unusual: they can match a nested field name, e.g. the
+# key `b.c` in the object `a` matches the field `a.b.c`. Nodes don't link to unusual keys, so code
+# that runs into one has to look up the field by name, or give up.
+#
+# A node that ignores extra fields passes that on to all of its children, so you can opt an entire
+# subtree out of checking for extra fields.
+
+class SchemaTree:
+    def __init__(self, fields, ignore_extra_fields=False, ignore_extra_fields_in=()):
+        self.nodes = {}
+        for field_name, field in fields.items():
+            self.nodes[field_name] = SchemaNode(field_name, field)
+        if '.' not in self.nodes:
+            self.nodes['.'] = SchemaNode('.', None)
+
+        for field_name, node in self.nodes.items():
+            prefix = '' if field_name == '.' else field_name + '.'
+            unusual_keys = []
+            for child_name, child in self.nodes.items():
+                if child_name == '.' or not child_name.startswith(prefix):
+                    continue
+
+                key = child_name[len(prefix):]
+                if '.' in key or key.endswith('[]'):
+                    unusual_keys.append(key)
+                else:
+                    node.children[key] = child
+
+            if field_name == '.' and '.' in fields:
+                unusual_keys.append('.')
+            node.unusual_keys = frozenset(unusual_keys)
+            node.allowed_keys = frozenset(node.children)
+
+            if field_name != '.':
+                node.element = self.nodes.get(field_name + '[]')
+
+        # Parents have shorter names than their children, so they're always done first.
+        for field_name in sorted(self.nodes, key=lambda name: (name != '.', len(name))):
+            node = self.nodes[field_name]
+            if field_name == '.':
+                node.ignore_extra_fields = ignore_extra_fields
+            else:
+                parent = self.nodes.get(_get_parent_name(field_name), self.nodes['.'])
+                node.ignore_extra_fields = parent.ignore_extra_fields or field_name in ignore_extra_fields_in
+
+        # Missing fields are reported in the order of the schema, so each required field gets a
+        # bucket number, and its parent remembers which bucket to put the message in.
+        self.bucket_count = 0
+        for field_name, field in fields.items():
+            if field_name == '.' or field is None or field.strictness != 'required':
+                continue
+
+            # Unlike `_get_parent_name()`, this treats `a[]` as the key `a` of the root, because that's
+            # where the message for a missing list goes. The parent of `.[]` would be an empty name,
+            # which no document can have, so that field is never missing.
+            if '.' not in field_name:
+                parent_name, child_name = '.', field_name
+            else:
+                parent_name, child_name = field_name.rsplit('.', 1)
+
+            parent = self.nodes.get(parent_name)
+            if parent is None:
+                continue
+
+            parent.missing.append((self.bucket_count, child_name, child_name.strip('[]')))
+            self.bucket_count += 1
+
+        self.parents = []
+        for node in self.nodes.values():
+            node.missing = tuple(node.missing)
+            node.required_keys = frozenset(key for _, _, key in node.missing)
+            if node.missing:
+                self.parents.append(node)
+
+        self.root = self.nodes['.']
+
+    def get_child(self, node, key):
+        child = node.children.get(key)
+        if child is None and key in node.unusual_keys:
+            child = self.nodes.get(key if node.name == '.' else node.name + '.' + key)
+
+        return child
+
+
+class SchemaNode:
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+        self.children = {}
+        self.element = None
+        self.unusual_keys = frozenset()
+        self.allowed_keys = frozenset()
+        self.required_keys = frozenset()
+        self.missing = []
+        self.ignore_extra_fields = False
+        self.is_nullable_object = field is not None and field.is_nullable_object()
+        self.plan = RulePlan(field.rules if field is not None else ())
+
+
+def _get_parent_name(field_name):
+    # The parent of `a.b[]` is `a.b`, the parent of `a.b` is `a`, and the parent of `a` is the root.
+    if field_name.endswith('[]'):
+        return field_name[:-2]
+    if '.' in field_name:
+        return field_name.rsplit('.', 1)[0]
+    return '.'
@@ -0,0 +1,73 @@
+import threading
+import weakref
+
+class ShapeCache:
+    # Documents from the same source usually have only a handful of layouts, so the same objects
+    # come along with the same keys in the same order over and over again. For each node in the
+    # schema, the cache remembers what it found for each layout: which node each key belongs to, or
+    # `None` if the key is an extra field, and which required fields are missing. For a layout it has
+    # seen before, the validator only needs a dictionary lookup instead of checking each key.
+    #
+    # Shapes are stored per node, and the cache only holds weak references to the nodes, so when the
+    # schema cache removes a schema, its shapes go with it.
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._shapes = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(shapes) for shapes in list(self._shapes.values()))
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def get(self, node, document):
+        # Returns `None` for objects with keys that may match a nested field name, because those
+        # need more than a lookup in the node's children.
+        #
+        # Looking up a shape happens for every object in every document, so it doesn't take the lock.
+        # That's safe, because a single dictionary lookup is atomic, but it means `hits` may miss a
+        # count when several threads use the cache at once.
+        keys = tuple(document)
+        shapes = self._shapes.get(node)
+        if shapes is not None:
+            shape = shapes.get(keys)
+            if shape is not None:
+                self.hits += 1
+                return shape
+
+        with self._lock:
+            self.misses += 1
+            if not node.unusual_keys.isdisjoint(keys):
+                return None
+
+            shape = _Shape(node, keys, document)
+            shapes = self._shapes.setdefault(node, {})
+            shapes[keys] = shape
+
+            # The cache removes the oldest shape, not the least recently used one, so a hit doesn't
+            # have to change anything.
+            while self.max_size is not None and len(shapes) > self.max_size:
+                del shapes[next(iter(shapes))]
+                self.evictions += 1
+
+        return shape
+
+    def clear(self):
+        with self._lock:
+            self._shapes.clear()
+
+
+class _Shape:
+    __slots__ = ('children', 'missing')
+
+    def __init__(self, node, keys, document):
+        children = node.children
+        self.children = tuple(children.get(key) for key in keys)
+        self.missing = tuple((bucket, child_name) for bucket, child_name, key in node.missing if key not in document)
@@ -0,0 +1,56 @@
+import csv
+import json
+import os
+from .message import Message
+
+# A sink receives the documents or validation messages that a `Pipeline` routes to it, in batches.
+# Any object with a `write(items)` method and a `close()` method can be used as a sink.
+
+class JSONLinesSink:
+    def __init__(self, file):
+        self._file, self._owns_file = _open(file)
+
+    def write(self, items):
+        self._file.write(''.join(json.dumps(_to_json(item), ensure_ascii=False, default=str) + '\n' for item in items))
+
+    def close(self):
+        _close(self._file, self._owns_file)
+
+
+class CSVMessageSink:
+    def __init__(self, file, columns=('document_number', 'type', 'field')):
+        self.columns = columns
+        self._file, self._owns_file = _open(file)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, messages):
+        self._writer.writerows([ _get_cell(message, column) for column in self.columns ] for message in messages)
+
+    def close(self):
+        _close(self._file, self._owns_file)
+
+
+def _open(file):
+    if isinstance(file, (str, os.PathLike)):
+        return open(file, 'w', encoding='utf-8', newline=''), True
+
+    return file, False
+
+def _close(file, owns_file):
+    if owns_file:
+        file.close()
+    else:
+        file.flush()
+
+def _to_json(item):
+    return vars(item) if isinstance(item, Message) else item
+
+def _get_cell(message, column):
+    value = getattr(message, column, None)
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    return value
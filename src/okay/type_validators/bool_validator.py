@@ -1,5 +1,7 @@
 from ..message import Message
 
+_expected_type = { 'type': 'bool' }
+
 class BoolValidator:
     def __init__(self, field=None, **kwargs):
         pass
@@ -9,7 +11,5 @@ class BoolValidator:
             return Message(
                 type='invalid_type',
                 field=field,
-                expected={
-                    'type': 'bool'
-                }
+                expected=_expected_type
             )
\ No newline at end of file
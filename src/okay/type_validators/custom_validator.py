@@ -1,6 +1,13 @@
+import contextvars
+import inspect
 from ..message import Message
 from ..schema_error import SchemaError
 
+# While `avalidate()` runs, asynchronous custom validation functions aren't awaited right away.
+# Instead, the custom validator returns a placeholder message and makes a note of the call, so
+# `avalidate()` can await all calls at once and replace the placeholders with the results.
+_pending_calls = contextvars.ContextVar('pending_calls', default=None)
+
 class CustomValidator:
     def __init__(self, field, **kwargs):
         if not 'validator' in kwargs:
@@ -13,6 +20,7 @@ class CustomValidator:
         self._validator = validator
         self._kwargs = kwargs
         del self._kwargs['validator']
+        self.is_async = inspect.iscoroutinefunction(validator) or inspect.iscoroutinefunction(getattr(validator, '__call__', None))
     
     def __call__(self, field, value):
         try:
@@ -20,7 +28,32 @@ class CustomValidator:
         except Exception as e:
             raise SchemaError(f"Custom validation function `{self._validator.__name__}()` specified for field '{field}' raised exception `{type(e).__name__}`.") from e
 
+        if inspect.isawaitable(message):
+            return self._defer(field, message)
+
+        self._check(field, message)
+        return message
+    
+    async def finish(self, field, awaitable):
+        try:
+            message = await awaitable
+        except Exception as e:
+            raise SchemaError(f"Custom validation function `{self._validator.__name__}()` specified for field '{field}' raised exception `{type(e).__name__}`.") from e
+        
+        self._check(field, message)
+        return message
+    
+    def _defer(self, field, awaitable):
+        pending_calls = _pending_calls.get()
+        if pending_calls is None:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise SchemaError(f"Custom validation function `{self._validator.__name__}()` specified for field '{field}' is asynchronous, so you must use `avalidate()`.")
+
+        placeholder = Message(type='pending')
+        pending_calls.append((placeholder, self, field, awaitable))
+        return placeholder
+    
+    def _check(self, field, message):
         if not (message is None or isinstance(message, Message)):
             raise SchemaError(f"Custom validation function `{self._validator.__name__}()` specified for field '{field}' must return a `Message` object, but it returned a `{type(message).__name__}` object instead.")
-
-        return message
\ No newline at end of file
@@ -2,6 +2,8 @@ import math
 from ..message import Message
 from okay.type_validators import NumberValidator
 
+_expected_type = { 'type': 'int' }
+
 class IntValidator:
     def __init__(self, field=None, **kwargs):
         self._validate_number = NumberValidator(**kwargs)
@@ -11,9 +13,7 @@ class IntValidator:
             return Message(
                 type='invalid_type',
                 field=field,
-                expected={
-                    'type': 'int'
-                }
+                expected=_expected_type
             )
         
         return self._validate_number(field, value, **kwargs)
\ No newline at end of file
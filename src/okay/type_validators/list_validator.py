@@ -1,35 +1,35 @@
 from ..message import Message
 
+_expected_type = { 'type': 'list' }
+
 class ListValidator:
     def __init__(self, field=None, min=None, max=None):
         self._min = min
         self._max = max
 
+        self._expected = {
+            'min': self._min,
+            'max': self._max
+        }
+
     def __call__(self, field, value):
         if not isinstance(value, list):
             return Message(
                 type='invalid_type',
                 field=field,
-                expected={
-                    'type': 'list'
-                }
+                expected=_expected_type
             )
         
-        expected = {
-            'min': self._min,
-            'max': self._max
-        }
-        
         if self._min is not None and len(value) < self._min:
             return Message(
                 type='too_few_elements',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
         
         if self._max is not None and len(value) > self._max:
             return Message(
                 type='too_many_elements',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
\ No newline at end of file
@@ -1,32 +1,47 @@
 from decimal import Decimal
 from ..message import Message
 
+_expected_type = { 'type': 'number' }
+
 class NumberValidator:
     def __init__(self, field=None, min=None, max=None, options=None):
         self._min = min
         self._max = max
         self._options = options
 
+        # Converting a value to `Decimal` is slow, especially for floats. If the limits and the options
+        # are plain numbers, comparing ints and floats directly gives exactly the same results, because
+        # Python compares ints, floats, and decimals by their exact values, and numbers that are equal
+        # have the same hash. The exception is NaN: comparing `Decimal('NaN')` raises an exception, so
+        # NaN still goes through `Decimal`, as do `Decimal` values.
+        self._is_native = all(_is_plain_number(limit) for limit in (min, max) if limit is not None)
+        if options is not None:
+            self._is_native = self._is_native and isinstance(options, (list, tuple)) and all(_is_plain_number(option) for option in options)
+        self._option_set = set(options) if self._is_native and options is not None else None
+
+        self._expected = {
+            'min': self._min,
+            'max': self._max,
+            'options': self._options
+        }
+
     def __call__(self, field, value):
         if not isinstance(value, (int, float, Decimal)):
             return Message(
                 type='invalid_type',
                 field=field,
-                expected={
-                    'type': 'number'
-                }
+                expected=_expected_type
             )
         
-        value = Decimal(value)
-        expected = {
-            'min': self._min,
-            'max': self._max,
-            'options': self._options
-        }
+        if self._is_native and not isinstance(value, Decimal) and value == value:
+            options = self._option_set
+        else:
+            value = Decimal(value)
+            options = self._options
 
         pass_minimum = value >= self._min if self._min is not None else self._max is not None
         pass_maximum = value <= self._max if self._max is not None else self._min is not None
-        pass_options = value in self._options if self._options is not None else False
+        pass_options = value in options if options is not None else False
 
         if pass_options or (pass_minimum and pass_maximum):
             return
@@ -35,24 +50,27 @@ class NumberValidator:
             return Message(
                 type='number_too_small',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
         
         if self._max is not None and not pass_maximum:
             return Message(
                 type='number_too_large',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
         
         if self._options is not None and not pass_options:
             return Message(
                 type='invalid_number_option',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
 
         # If we reach this point, the validator didn't receive any parameters, so we only need to
         # validate the type, and we already did that at the beginning of this function. In other
         # words, everything is fine.
-        return
\ No newline at end of file
+        return
+
+def _is_plain_number(value):
+    return type(value) in (int, float, bool) and value == value
\ No newline at end of file
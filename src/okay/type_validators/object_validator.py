@@ -1,5 +1,7 @@
 from ..message import Message
 
+_expected_type = { 'type': 'object' }
+
 class ObjectValidator:
     def __init__(self, field=None):
         pass
@@ -9,7 +11,5 @@ class ObjectValidator:
             return Message(
                 type='invalid_type',
                 field=field,
-                expected={
-                    'type': 'object'
-                }
+                expected=_expected_type
             )
\ No newline at end of file
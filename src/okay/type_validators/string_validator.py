@@ -1,6 +1,8 @@
 import re
 from ..message import Message
 
+_expected_type = { 'type': 'string' }
+
 class StringValidator:
     def __init__(self, field=None, regex=None, options=None, case_sensitive=True, min=None, max=None):
         self._pattern = regex
@@ -14,24 +16,23 @@ class StringValidator:
         
         self._min = min
         self._max = max
+
+        # All messages of this validator share the same `expected` dictionary.
+        self._expected = {
+            'case_sensitive': self._case_sensitive if self._options is not None else None,
+            'max': self._max,
+            'min': self._min,
+            'options': self._options,
+            'regex': self._pattern
+        }
     
     def __call__(self, field, value, **kwargs):
         if not isinstance(value, str):
             return Message(
                 type='invalid_type',
                 field=field,
-                expected={
-                    'type': 'string'
-                }
+                expected=_expected_type
             )
-        
-        expected = {
-            'case_sensitive': self._case_sensitive if self._options is not None else None,
-            'max': self._max,
-            'min': self._min,
-            'options': self._options,
-            'regex': self._pattern
-        }
 
         pass_regex = self._regex.fullmatch(value) if self._regex is not None else False
         pass_minimum = len(value) >= self._min if self._min is not None else self._max is not None
@@ -45,28 +46,28 @@ class StringValidator:
             return Message(
                 type='no_match',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
 
         if self._min is not None and not pass_minimum:
             return Message(
                 type='string_too_short',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
         
         if self._max is not None and not pass_maximum:
             return Message(
                 type='string_too_long',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
         
         if self._options is not None and not pass_options:
             return Message(
                 type='invalid_string_option',
                 field=field,
-                expected=expected
+                expected=self._expected
             )
         
         # If we reach this point, the validator didn't receive any parameters, so we only need to
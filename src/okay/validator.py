@@ -1,66 +1,198 @@
+import time
+from . import parallel
 from . import type_validators
+from .code_generator import generate
 from .index import create_index
 from .message import Message
-from .schema_compiler import compile, required, optional, ignore_extra_fields
+from .schema_cache import shared_schema_cache
+from .schema_compiler import Field, Schema, required, optional, ignore_extra_fields
 from .schema_error import SchemaError
+from .schema_tree import SchemaTree
+from .walker import Walker
 
-def validate(schema, document, message_values=None):
-    _validator._reset(schema, document)
-    _validator._validate()
-    _validator._report_missing_fields()
-    _validator._report_extra_fields()
+def validate(schema, document, message_values=None, engine='interpreter', max_messages=None, fail_fast=False):
+    max_messages = _get_max_messages(max_messages, fail_fast)
+    return _validator._validate_one(schema, document, message_values, engine, max_messages)
 
-    if message_values:
-        for message in _validator.messages:
-            message.add(**message_values)
-    return _validator.messages
+def validate_many(schema, documents, message_values=None, engine='interpreter', workers=None, chunk_size=100, max_messages=None, fail_fast=False):
+    max_messages = _get_max_messages(max_messages, fail_fast)
+    return _validator._validate_many(schema, documents, message_values, engine, workers, chunk_size, max_messages)
+
+def is_valid(schema, document):
+    return _validator.is_valid(schema, document)
+
+def precompile(schema, engine='interpreter'):
+    return _validator._precompile(schema, engine)
+
+def explain(schema):
+    compiled_schema = _validator._precompile(schema, 'interpreter')
+    lines = []
+    for field_name, node in compiled_schema.tree.nodes.items():
+        if node.field is None:
+            continue
+
+        lines.append(field_name)
+        lines += ('  ' + line for line in node.plan.describe())
+
+    return '\n'.join(lines)
 
 
 class Validator:
-    def __init__(self):
-        self.messages = []
-        self._type_validators = {}
-        self._compiled_schemas = {}
-    
-    def _reset(self, schema, document):
-        if schema not in self._compiled_schemas:
-            try:
-                self._preprocessing = True
-                self._compiled_schemas[schema] = compile(schema)
-                self._preprocessing = False
-            except Exception as e:
-                raise SchemaError(f"Schema raised `{type(e).__name__}`.") from e
+    # A validator doesn't keep any state between or during validations; everything it needs to
+    # validate a single document lives in a `_Validation` object. This means you can use the same
+    # validator from multiple threads at once, and custom validators can call `validate()`.
+    def __init__(self, engine='interpreter', schema_cache=None, result_cache=None, profiler=None, shape_cache=None, adaptive_order=None):
+        self.engine = engine
+        self.result_cache = result_cache
+        self.profiler = profiler
+        self.shape_cache = shape_cache
+        self.adaptive_order = adaptive_order
+        self._schema_cache = schema_cache if schema_cache is not None else shared_schema_cache
+    
+    def validate(self, schema, document, message_values=None, max_messages=None, fail_fast=False):
+        max_messages = _get_max_messages(max_messages, fail_fast)
+        return self._validate_one(schema, document, message_values, self.engine, max_messages)
+    
+    def validate_many(self, schema, documents, message_values=None, workers=None, chunk_size=100, max_messages=None, fail_fast=False):
+        max_messages = _get_max_messages(max_messages, fail_fast)
+        return self._validate_many(schema, documents, message_values, self.engine, workers, chunk_size, max_messages)
+    
+    def is_valid(self, schema, document):
+        # With an adaptive order, the walker may check the fields of a document in any order, because it
+        # only has to find out whether there's a problem, not which problem comes first.
+        if self.adaptive_order is not None and self.profiler is None:
+            compiled_schema = self._precompile(schema, 'lazy')
+            result = compiled_schema.walker.is_valid(document, self.adaptive_order)
+            if result is None:
+                return not _Validation(compiled_schema, document).run()
+            return result
+
+        return not self._validate_one(schema, document, None, self.engine, 1)
+    
+    def precompile(self, schema):
+        return self._precompile(schema, self.engine)
+    
+    def warmup(self, schemas):
+        return [ self.precompile(schema) for schema in schemas ]
+    
+    def _validate_one(self, schema, document, message_values, engine, max_messages):
+        run = self._get_runner(schema, engine, max_messages)
+        messages = run(document)
+
+        if message_values:
+            for message in messages:
+                message.add(**message_values)
+        return messages
+    
+    def _validate_many(self, schema, documents, message_values, engine, workers, chunk_size, max_messages):
+        # Compile the schema up front, even when using worker processes, so schema errors are raised
+        # here instead of in a worker.
+        run = self._get_runner(schema, engine, max_messages)
+        if workers is None:
+            results = ((document_number, run(document)) for document_number, document in enumerate(documents))
+        else:
+            results = parallel.validate_in_processes(schema, documents, workers, chunk_size, engine, max_messages)
+
+        return _add_message_values(results, message_values)
+    
+    def _precompile(self, schema, engine):
+        if engine not in ('interpreter', 'generated', 'lazy'):
+            raise ValueError(f"Unknown validation engine `{engine}`.")
+
+        if isinstance(schema, Schema):
+            compiled_schema = schema
+        else:
+            compiled_schema = self._schema_cache.get(schema)
+
+        # Schemas that don't come from `compile()`, e.g. loaded schemas, don't have a tree yet.
+        if compiled_schema.tree is None:
+            compiled_schema.tree = SchemaTree(compiled_schema.fields, compiled_schema.ignore_extra_fields, compiled_schema.ignore_extra_fields_in)
         
-        self._schema = self._compiled_schemas[schema]
-        self._index = create_index(document, self._schema.fields.keys())
+        if engine == 'generated' and compiled_schema.generated_function is None:
+            compiled_schema.generated_function = generate(compiled_schema)
+        elif engine == 'lazy' and compiled_schema.walker is None:
+            compiled_schema.walker = Walker(compiled_schema)
+        
+        return compiled_schema
+    
+    def _get_runner(self, schema, engine, max_messages=None):
+        # Only the interpreter uses the shape cache. The other engines look up each key while they walk
+        # the document anyway, so looking up the shape of an object costs them more than it saves.
+        shape_cache = self.shape_cache
+
+        # The profiler measures the phases of the interpreter, so if there's a profiler, we always use
+        # the interpreter, no matter which engine was requested.
+        if self.profiler is not None:
+            profiler = self.profiler
+            start = time.perf_counter()
+            compiled_schema = self._precompile(schema, 'interpreter')
+            profiler.add_compile_time(time.perf_counter() - start)
+            return lambda document: _ProfiledValidation(compiled_schema, document, profiler, shape_cache).run()[:max_messages]
+
+        compiled_schema = self._precompile(schema, engine)
+
+        # Only the walker can stop halfway through a document or reuse the results for part of a
+        # document, so if the number of messages is limited or if there's a result cache, we always use
+        # the walker, no matter which engine was requested.
+        if max_messages is not None or self.result_cache is not None:
+            self._precompile(compiled_schema, 'lazy')
+            result_cache = self.result_cache
+            return lambda document: _run_lazy(compiled_schema, document, max_messages, result_cache)
+        elif engine == 'interpreter':
+            return lambda document: _Validation(compiled_schema, document, shape_cache).run()
+        elif engine == 'generated':
+            return lambda document: _run_generated(compiled_schema, document)
+        else:
+            return lambda document: _run_lazy(compiled_schema, document)
+
+
+class _Validation:
+    def __init__(self, compiled_schema, document, shape_cache=None):
+        self._schema = compiled_schema
+        self._index = create_index(document, self._schema.tree, shape_cache)
         self._document = document
-        self._ignore_extra_fields = False
         self.messages = []
     
+    def run(self):
+        self._validate()
+        self._report_missing_fields()
+        self._report_extra_fields()
+        return self.messages
+    
     def _validate(self):
+        nodes = self._schema.tree.nodes
+        messages = self.messages
         for field_name, fields in self._index.fields.items():
-            for field in fields:
-                for rule in self._schema.fields[field_name].rules:
-                    if field.value is None:
-                        if not rule.nullable:
-                            message = Message(
-                                type='null_value',
-                                field=field.path,
-                                expected={
-                                    'type': rule.type
-                                }
-                            )
+            plan = nodes[field_name].plan
+            null_types = plan.null_types
+            type_check = plan.type_check
+            validators = plan.validators
 
-                            self.messages.append(message)
-                    else:
-                        message = rule.validate(field.path, field.value)
+            for field in fields:
+                value = field.value
+                if value is None:
+                    for rule_type in null_types:
+                        messages.append(Message(
+                            type='null_value',
+                            field=field.path,
+                            expected={
+                                'type': rule_type
+                            }
+                        ))
+                elif type_check is not None and not isinstance(value, type_check[0]):
+                    for _ in range(type_check[2]):
+                        messages.append(Message(
+                            type='invalid_type',
+                            field=field.path,
+                            expected=type_check[1]
+                        ))
+                else:
+                    for validate in validators:
+                        message = validate(field.path, value)
                         if not message is None:
-                            self.messages.append(message)
+                            messages.append(message)
     
     def _report_extra_fields(self):
-        if self._schema.ignore_extra_fields:
-            return
-
         for extra_field in self._index.extra_fields:
             self.messages.append(Message(
                 type='extra_field',
@@ -68,28 +200,117 @@ class Validator:
             ))
     
     def _report_missing_fields(self):
-        for field_name, field in self._schema.fields.items():
-            if '.' not in field_name:
-                parent_name = '.'
-                child_name = field_name
-            else:
-                parent_name, child_name = field_name.rsplit('.', 1)
-
-            parent = self._index.fields.get(parent_name, [])
-            for parent_field in parent:
-                if parent_field.value is None and self._schema.fields[parent_field.path].is_nullable_object():
+        # Messages go into one bucket per required field, so they're reported in the order of the
+        # schema. Most objects aren't missing anything, which we can check with one set comparison.
+        tree = self._schema.tree
+        if not tree.bucket_count:
+            return
+
+        buckets = [ [] for _ in range(tree.bucket_count) ]
+        for parent in tree.parents:
+            for parent_field in self._index.fields.get(parent.name, []):
+                value = parent_field.value
+                if parent_field.shape is not None:
+                    missing = parent_field.shape.missing
+                elif isinstance(value, dict):
+                    if value.keys() >= parent.required_keys:
+                        continue
+                    missing = [ (bucket, child_name) for bucket, child_name, key in parent.missing if key not in value ]
+                elif value is None and not parent.is_nullable_object:
+                    missing = [ (bucket, child_name) for bucket, child_name, _ in parent.missing ]
+                else:
                     continue
 
-                if parent_field.value is None and field.strictness == 'required':
-                    self.messages.append(Message(
+                for bucket, child_name in missing:
+                    buckets[bucket].append(Message(
                         type='missing_field',
                         field=parent_field.path + '.' + child_name if parent_field.path != '.' else child_name
                     ))
 
-                if isinstance(parent_field.value, dict) and field.strictness == 'required' and child_name.strip('[]') not in parent_field.value:
-                    self.messages.append(Message(
-                        type='missing_field',
-                        field=parent_field.path + '.' + child_name if parent_field.path != '.' else child_name
-                    ))
+        for bucket in buckets:
+            self.messages += bucket
+
+
+class _ProfiledValidation(_Validation):
+    def __init__(self, compiled_schema, document, profiler, shape_cache=None):
+        start = time.perf_counter()
+        super().__init__(compiled_schema, document, shape_cache)
+        self._phases = { 'index': time.perf_counter() - start }
+        self._rules = {}
+        self._profiler = profiler
+
+    def run(self):
+        start = time.perf_counter()
+        self._validate()
+        rules_done = time.perf_counter()
+        self._report_missing_fields()
+        missing_done = time.perf_counter()
+        self._report_extra_fields()
+        extra_done = time.perf_counter()
+
+        self._phases['rules'] = rules_done - start
+        self._phases['missing'] = missing_done - rules_done
+        self._phases['extra'] = extra_done - missing_done
+        self._profiler.add_document(self._phases, self._rules, self.messages)
+        return self.messages
+
+    def _validate(self):
+        # The same as `_Validation._validate()`, but with a timer around each rule.
+        rules = self._rules
+        for field_name, fields in self._index.fields.items():
+            for field in fields:
+                for rule in self._schema.fields.get(field_name, _no_field).rules:
+                    start = time.perf_counter()
+                    message = None
+                    if field.value is None:
+                        if not rule.nullable:
+                            message = Message(
+                                type='null_value',
+                                field=field.path,
+                                expected={
+                                    'type': rule.type
+                                }
+                            )
+                    else:
+                        message = rule.validate(field.path, field.value)
+                    seconds = time.perf_counter() - start
+
+                    if not message is None:
+                        self.messages.append(message)
+
+                    key = (field_name, rule.type)
+                    calls, total_seconds, message_count = rules.get(key, (0, 0.0, 0))
+                    rules[key] = (calls + 1, total_seconds + seconds, message_count + (message is not None))
+
+def _run_generated(compiled_schema, document):
+    messages = compiled_schema.generated_function(document)
+    if messages is None:
+        return _Validation(compiled_schema, document).run()
+    
+    return messages
+
+def _run_lazy(compiled_schema, document, max_messages=None, result_cache=None):
+    messages = compiled_schema.walker.walk(document, max_messages, result_cache)
+    if messages is None:
+        return _Validation(compiled_schema, document).run()[:max_messages]
+    
+    return messages
+
+def _get_max_messages(max_messages, fail_fast):
+    if fail_fast:
+        return 1
+    
+    if max_messages is not None and max_messages < 1:
+        raise ValueError('The maximum number of messages must be at least 1.')
+    
+    return max_messages
+
+def _add_message_values(results, message_values):
+    for document_number, messages in results:
+        if message_values:
+            for message in messages:
+                message.add(**message_values)
+        yield document_number, messages
 
+_no_field = Field()
 _validator = Validator()
\ No newline at end of file
@@ -0,0 +1,340 @@
+import copy
+import time
+from .message import Message
+from .type_validators import BoolValidator, IntValidator, ListValidator, NumberValidator, ObjectValidator, StringValidator
+
+# The walker validates a document without creating an index. It walks the schema and the document
+# together, runs the rules of a field as soon as it finds the field, and only builds path strings
+# when it actually needs them, i.e. when it reports a validation message or when it calls a custom
+# validator. It collects validation messages the same way the code generator does, so the result is
+# identical to what the interpreter in `Validator` produces. Like the generated function, the
+# walker returns `None` for the few documents it can't handle.
+#
+# Because the walker doesn't need to see the entire document before it can report anything, it can
+# stop as soon as it found the maximum number of validation messages you asked for.
+
+# The built-in type validators only use the field name to create a validation message, so the
+# walker passes `None` and fills in the field name when validation fails.
+_BUILT_IN_VALIDATORS = (BoolValidator, IntValidator, ListValidator, NumberValidator, ObjectValidator, StringValidator)
+
+class Walker:
+    def __init__(self, schema):
+        self.bucket_count = schema.tree.bucket_count
+
+        # The walker's nodes mirror the nodes of the schema tree, but also hold the rules to run.
+        nodes = {}
+        for field_name, tree_node in schema.tree.nodes.items():
+            nodes[field_name] = _Node(field_name, tree_node)
+
+        for field_name, tree_node in schema.tree.nodes.items():
+            node = nodes[field_name]
+            node.children = { key: nodes[child.name] for key, child in tree_node.children.items() }
+            node.unusual_keys = tree_node.unusual_keys
+            node.element = nodes[tree_node.element.name] if tree_node.element is not None else None
+            node.missing = tree_node.missing
+            node.required_keys = tree_node.required_keys
+            node.ignore_extra_fields = tree_node.ignore_extra_fields
+
+        self.root = nodes['.']
+
+    def walk(self, document, max_messages=None, result_cache=None):
+        if result_cache is None:
+            walk = _Walk(self, max_messages)
+        else:
+            walk = _CachingWalk(self, max_messages, result_cache)
+        try:
+            walk.visit(self.root, document, None, None)
+        except _Unsupported:
+            return None
+        except _LimitReached:
+            pass
+
+        return walk.get_messages()
+
+    def is_valid(self, document, adaptive_order):
+        walk = _AdaptiveWalk(self, adaptive_order, adaptive_order.add_document())
+        try:
+            walk.visit(self.root, document, None, None)
+        except _Unsupported:
+            return None
+        except _LimitReached:
+            return False
+
+        return True
+
+
+class _Node:
+    def __init__(self, name, tree_node):
+        self.name = name
+        self.children = {}
+        self.unusual_keys = frozenset()
+        self.element = None
+        self.missing = ()
+        self.required_keys = frozenset()
+        self.ignore_extra_fields = False
+        self.is_nullable_object = tree_node.is_nullable_object
+
+        plan = tree_node.plan
+        self.null_types = plan.null_types
+        self.type_check = plan.type_check
+        self.checks = [ (validate, isinstance(validate, _BUILT_IN_VALIDATORS)) for validate in plan.validators ]
+
+
+class _Path:
+    __slots__ = ('_parent', '_key', '_text')
+
+    def __init__(self, parent, key):
+        self._parent = parent
+        self._key = key
+        self._text = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            if self._parent is None:
+                self._text = '.'
+            elif type(self._key) is int:
+                self._text = self._parent.text + '[' + str(self._key) + ']'
+            elif self._parent._parent is None:
+                self._text = self._key
+            else:
+                self._text = self._parent.text + '.' + self._key
+
+        return self._text
+
+    def child_text(self, key):
+        return key if self._parent is None else self.text + '.' + key
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _LimitReached(Exception):
+    pass
+
+
+class _Walk:
+    def __init__(self, walker, max_messages):
+        self._groups = { walker.root: [] }
+        self._missing = [ [] for _ in range(walker.bucket_count) ]
+        self._extras = []
+        self._message_count = 0
+        self._max_messages = max_messages
+
+    def get_messages(self):
+        messages = [ message for group in self._groups.values() for message in group ]
+        for bucket in self._missing:
+            messages += bucket
+        for path in self._extras:
+            messages.append(Message(type='extra_field', field=path))
+
+        return messages
+
+    def _add(self, messages, message):
+        messages.append(message)
+        self._message_count += 1
+        if self._message_count == self._max_messages:
+            raise _LimitReached()
+
+    def visit(self, node, value, parent_path, key):
+        group = self._groups.get(node)
+        if group is None:
+            group = self._groups[node] = []
+
+        path = None
+        if value is None:
+            for rule_type in node.null_types:
+                path = path or _Path(parent_path, key)
+                self._add(group, Message(type='null_value', field=path.text, expected={ 'type': rule_type }))
+        elif node.type_check is not None and not isinstance(value, node.type_check[0]):
+            path = path or _Path(parent_path, key)
+            for _ in range(node.type_check[2]):
+                self._add(group, Message(type='invalid_type', field=path.text, expected=node.type_check[1]))
+        else:
+            for validate, is_built_in in node.checks:
+                path = path or _Path(parent_path, key)
+                if is_built_in:
+                    message = validate(None, value)
+                    if message is not None:
+                        message.field = path.text
+                else:
+                    message = validate(path.text, value)
+
+                if message is not None:
+                    self._add(group, message)
+
+        if isinstance(value, dict):
+            path = path or _Path(parent_path, key)
+            if node.missing and not value.keys() >= node.required_keys:
+                for bucket, child_name, child_key in node.missing:
+                    if child_key not in value:
+                        self._add(self._missing[bucket], Message(type='missing_field', field=path.child_text(child_name)))
+            self._visit_object(node, value, path)
+        elif value is None:
+            if node.missing and not node.is_nullable_object:
+                path = path or _Path(parent_path, key)
+                for bucket, child_name, _ in node.missing:
+                    self._add(self._missing[bucket], Message(type='missing_field', field=path.child_text(child_name)))
+        elif node.element is not None and isinstance(value, list):
+            self._visit_list(node.element, value, path or _Path(parent_path, key))
+
+    def _visit_object(self, node, document, path):
+        children = node.children
+        unusual_keys = node.unusual_keys
+        ignore_extra_fields = node.ignore_extra_fields
+        if ignore_extra_fields and not children and not unusual_keys:
+            return
+
+        for key, value in document.items():
+            child = children.get(key)
+            if child is not None:
+                self.visit(child, value, path, key)
+            elif key in unusual_keys:
+                raise _Unsupported()
+            elif not ignore_extra_fields:
+                self._add(self._extras, path.child_text(key))
+
+    def _visit_list(self, element, document, path):
+        if element not in self._groups:
+            self._groups[element] = []
+
+        for i, value in enumerate(document):
+            self.visit(element, value, path, i)
+
+
+class _AdaptiveWalk(_Walk):
+    # Stops at the first message, like a walk with a maximum of one message, but it visits the children
+    # of an object in the order the adaptive order gives, and if it measures the document, it tells the
+    # order how each child went. Extra fields are checked before the children, because that only takes
+    # a lookup per key.
+    def __init__(self, walker, adaptive_order, measure):
+        super().__init__(walker, 1)
+        self._adaptive_order = adaptive_order
+        self._measure = measure
+
+    def _visit_object(self, node, document, path):
+        children = node.children
+        unusual_keys = node.unusual_keys
+        if not node.ignore_extra_fields or unusual_keys:
+            for key in document:
+                if key not in children:
+                    if key in unusual_keys:
+                        raise _Unsupported()
+                    if not node.ignore_extra_fields:
+                        self._add(self._extras, path.child_text(key))
+
+        if not self._measure:
+            for key, child in self._adaptive_order.get_order(node):
+                if key in document:
+                    self.visit(child, document[key], path, key)
+            return
+
+        record = self._adaptive_order.record
+        for key, child in self._adaptive_order.get_order(node):
+            if key not in document:
+                continue
+
+            start = time.perf_counter()
+            try:
+                self.visit(child, document[key], path, key)
+            except _LimitReached:
+                record(child, time.perf_counter() - start, True)
+                raise
+            record(child, time.perf_counter() - start, False)
+
+
+class _CachingWalk(_Walk):
+    # While the walk visits a cached field, it records which nodes it touched, because that
+    # determines the order of the message groups, and which messages it reported where. Replaying the
+    # recording for the same value at another path gives the same result as visiting it again.
+    def __init__(self, walker, max_messages, result_cache):
+        super().__init__(walker, max_messages)
+        self._result_cache = result_cache
+        self._recording = None
+
+    def visit(self, node, value, parent_path, key):
+        if self._recording is not None:
+            self._recording[0].append(node)
+
+        cache_key = None
+        if node.name in self._result_cache.fields:
+            cache_key = self._result_cache.get_key(node, value)
+        if cache_key is None:
+            return _Walk.visit(self, node, value, parent_path, key)
+
+        path = _Path(parent_path, key)
+        result = self._result_cache.get(cache_key)
+        if result is not None:
+            self._replay(result, path)
+            return
+
+        outer_recording = self._recording
+        self._recording = recording = ([ node ], [])
+        try:
+            _Walk.visit(self, node, value, parent_path, key)
+        finally:
+            self._recording = outer_recording
+
+        self._result_cache.put(cache_key, self._store(recording, path))
+        if outer_recording is not None:
+            outer_recording[0].extend(recording[0])
+            outer_recording[1].extend(recording[1])
+
+    def _visit_list(self, element, document, path):
+        if self._recording is not None:
+            self._recording[0].append(element)
+        _Walk._visit_list(self, element, document, path)
+
+    def _add(self, messages, message):
+        if self._recording is not None:
+            self._recording[1].append((messages, message))
+        _Walk._add(self, messages, message)
+
+    def _store(self, recording, path):
+        # Messages are recorded with the list they were added to, which only exists during this walk,
+        # so we store where the list belongs instead. Messages are copied, because the caller may
+        # change the messages it gets.
+        targets = { id(messages): ('group', node) for node, messages in self._groups.items() }
+        targets.update((id(messages), ('missing', bucket)) for bucket, messages in enumerate(self._missing))
+        targets[id(self._extras)] = ('extras', None)
+
+        touched_nodes = tuple(dict.fromkeys(recording[0]))
+        added = tuple((targets[id(messages)], copy.copy(message)) for messages, message in recording[1])
+        return path.text, touched_nodes, added
+
+    def _replay(self, result, path):
+        recorded_path, touched_nodes, added = result
+        if self._recording is not None:
+            self._recording[0].extend(touched_nodes)
+
+        for node in touched_nodes:
+            if node not in self._groups:
+                self._groups[node] = []
+
+        for (kind, target), message in added:
+            if kind == 'group':
+                messages = self._groups[target]
+            elif kind == 'missing':
+                messages = self._missing[target]
+            else:
+                messages = self._extras
+
+            if type(message) is str:
+                message = _move(message, recorded_path, path)
+            else:
+                message = copy.copy(message)
+                if getattr(message, 'field', None) is not None:
+                    message.field = _move(message.field, recorded_path, path)
+
+            self._add(messages, message)
+
+def _move(field, old_path, new_path):
+    if not field.startswith(old_path) or old_path == '.':
+        return field
+
+    rest = field[len(old_path):]
+    if rest and rest[0] not in '.[':
+        return field
+
+    return new_path.text + rest
@@ -1,4 +1,6 @@
+import functools
 import os
+import pytest
 import sys
 
 # Make sure the unit tests can find the modules in the src-directory.
@@ -6,4 +8,21 @@ test_dir = os.path.dirname(__file__)
 root_dir = os.path.split(test_dir)[0]
 src_dir = os.path.join(root_dir, 'src')
 if src_dir not in sys.path:
-    sys.path.append(src_dir)
\ No newline at end of file
+    sys.path.append(src_dir)
+
+# The benchmarks live in the project root.
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+import okay
+
+@pytest.fixture(params=[ 'interpreter', 'generated', 'lazy', 'profiler' ])
+def each_engine(request, monkeypatch):
+    # Runs a test once for each engine, and once with a profiler, by replacing `validate()` in the
+    # module of the test. None of them may change the result.
+    if request.param == 'profiler':
+        validate = okay.Validator(profiler=okay.Profiler()).validate
+    else:
+        validate = functools.partial(okay.validate, engine=request.param)
+
+    monkeypatch.setattr(request.module, 'validate', validate)
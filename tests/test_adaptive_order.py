@@ -0,0 +1,92 @@
+import gc
+import threading
+from okay import validate, precompile, Validator, AdaptiveOrder, SchemaCache
+from okay.schema import *
+
+class TestAdaptiveOrder:
+    def test_it_gives_the_same_answer_as_validate(self):
+        validator = Validator(adaptive_order=AdaptiveOrder(window=2, sample_every=1))
+        documents = [
+            { 'title': 'NW', 'author': { 'name': 'Zadie Smith' }, 'year': 2012 },
+            { 'title': 'NW', 'author': { 'name': 'Zadie Smith' }, 'year': -1 },
+            { 'title': 'NW', 'author': { 'name': 'Zadie Smith' }, 'year': 2012, 'isbn': 'unknown' },
+            { 'title': 'NW', 'author': {}, 'year': 2012 },
+            { 'title': 'NW', 'author': None, 'year': 2012 },
+            { 'title': 'NW', 'author': { 'name': 'Zadie Smith' }, 'year': 2012, 'a.b': 1 },
+            { 'title': 'NW', 'author': { 'name': 5 }, 'year': 2012 },
+            None
+        ]
+
+        for _ in range(3):
+            for document in documents:
+                assert validator.is_valid(book_schema, document) == (validate(book_schema, document) == [])
+    
+    def test_it_checks_fields_that_fail_often_first(self):
+        order = AdaptiveOrder(window=10, sample_every=1)
+        validator = Validator(adaptive_order=order)
+        for _ in range(10):
+            validator.is_valid(book_schema, { 'title': 'NW', 'author': { 'name': 'Zadie Smith' }, 'year': -1 })
+
+        root = precompile(book_schema, 'lazy').walker.root
+        assert order.reorders == 1
+        assert [ key for key, _ in order.get_order(root) ][0] == 'year'
+    
+    def test_it_starts_in_schema_order(self):
+        order = AdaptiveOrder()
+        root = precompile(book_schema, 'lazy').walker.root
+
+        assert [ key for key, _ in order.get_order(root) ] == [ 'title', 'author', 'year' ]
+    
+    def test_it_only_measures_some_documents(self):
+        order = AdaptiveOrder(sample_every=4)
+
+        assert [ order.add_document() for _ in range(8) ] == [ False, False, False, True, False, False, False, True ]
+    
+    def test_it_doesnt_change_the_order_of_messages(self):
+        validator = Validator(adaptive_order=AdaptiveOrder(window=1, sample_every=1))
+        document = { 'title': 5, 'author': {}, 'year': -1 }
+        for _ in range(3):
+            validator.is_valid(book_schema, document)
+
+        assert validator.validate(book_schema, document) == validate(book_schema, document)
+    
+    def test_it_forgets_everything_when_cleared(self):
+        order = AdaptiveOrder(window=2, sample_every=1)
+        validator = Validator(adaptive_order=order)
+        validator.is_valid(book_schema, { 'title': 'NW' })
+        order.clear()
+
+        assert order.documents == 0
+        root = precompile(book_schema, 'lazy').walker.root
+        assert [ key for key, _ in order.get_order(root) ] == [ 'title', 'author', 'year' ]
+    
+    def test_it_doesnt_add_nodes_while_reordering(self):
+        # Reordering goes through all nodes while it holds the lock, so adding a node has to wait.
+        order = AdaptiveOrder()
+        root = precompile(book_schema, 'lazy').walker.root
+        thread = threading.Thread(target=order.get_order, args=(root,))
+        with order._lock:
+            thread.start()
+            thread.join(timeout=0.05)
+            assert thread.is_alive()
+        thread.join()
+
+        assert root in order._orders
+    
+    def test_it_forgets_schemas_that_are_no_longer_used(self):
+        order = AdaptiveOrder(window=10, sample_every=1)
+        validator = Validator(schema_cache=SchemaCache(max_size=2), adaptive_order=order)
+        for i in range(50):
+            def schema():
+                required('title', type='string')
+            validator.is_valid(schema, { 'title': 'NW' })
+        gc.collect()
+
+        assert len(order._orders) <= 2
+        assert len(order._stats) <= 2
+
+
+def book_schema():
+    required('title', type='string')
+    required('author.name', type='string')
+    required('year', type='int', min=0)
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from okay import avalidate, avalidate_many, validate, Message, SchemaError
+from okay.schema import *
+
+class TestAsyncValidator:
+    def test_it_validates_a_document(self):
+        messages = asyncio.run(avalidate(book_schema, { 'title': 5 }, { 'source': 'books' }))
+
+        assert [ (message.type, message.field, message.source) for message in messages ] == [ ('invalid_type', 'title', 'books') ]
+    
+    def test_it_awaits_async_custom_validators(self):
+        document = { 'title': 'swing time', 'author': 'Zadie Smith', 'isbn': 'unknown', 'page_count': 0 }
+        messages = asyncio.run(avalidate(async_book_schema, document))
+
+        assert [ (message.type, message.field) for message in messages ] == [
+            ('no_capital', 'title'),
+            ('unknown_isbn', 'isbn'),
+            ('number_too_small', 'page_count')
+        ]
+    
+    def test_it_keeps_messages_in_the_same_order_as_sync_custom_validators(self):
+        document = { 'books': [ { 'title': 'swing time' }, { 'title': 'NW' }, {}, { 'title': 'on beauty' }, { 'title': None } ] }
+        for engine in ('interpreter', 'generated', 'lazy'):
+            expected = validate(sync_shelf_schema, document, engine=engine)
+            messages = asyncio.run(avalidate(async_shelf_schema, document, engine=engine))
+
+            assert [ message.__dict__ for message in messages ] == [ message.__dict__ for message in expected ]
+    
+    def test_it_limits_concurrency(self):
+        running = 0
+        max_running = 0
+        async def lookup(field, value):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        def schema():
+            required('isbns[]', type='custom', validator=lookup)
+        
+        asyncio.run(avalidate(schema, { 'isbns': list(range(10)) }, max_concurrency=3))
+
+        assert max_running == 3
+    
+    def test_it_limits_messages_after_awaiting(self):
+        document = { 'title': 'swing time', 'isbn': 'unknown', 'page_count': 0 }
+        messages = asyncio.run(avalidate(async_book_schema, document, max_messages=2))
+
+        assert [ message.type for message in messages ] == [ 'no_capital', 'unknown_isbn' ]
+        assert [ message.type for message in asyncio.run(avalidate(async_book_schema, document, fail_fast=True)) ] == [ 'no_capital' ]
+    
+    def test_it_raises_when_async_custom_validator_raises(self):
+        async def fail(field, value):
+            raise RuntimeError()
+
+        def schema():
+            required('title', type='custom', validator=fail)
+        
+        with pytest.raises(SchemaError):
+            asyncio.run(avalidate(schema, { 'title': 'NW' }))
+    
+    def test_it_raises_when_async_custom_validator_returns_something_else(self):
+        async def wrong(field, value):
+            return 'wrong'
+
+        def schema():
+            required('title', type='custom', validator=wrong)
+        
+        with pytest.raises(SchemaError):
+            asyncio.run(avalidate(schema, { 'title': 'NW' }))
+    
+    def test_it_raises_when_validating_async_custom_validators_synchronously(self):
+        with pytest.raises(SchemaError):
+            validate(async_book_schema, { 'title': 'NW', 'author': 'Zadie Smith' })
+    
+    def test_it_offloads_documents_to_an_executor(self):
+        threads = []
+        def schema():
+            required('title', type='custom', validator=lambda field, value: threads.append(threading.current_thread()))
+        
+        with ThreadPoolExecutor(1) as executor:
+            asyncio.run(avalidate(schema, { 'title': 'NW' }, offload=True, executor=executor))
+            asyncio.run(avalidate(schema, { 'title': 'NW' }, offload=lambda document: False, executor=executor))
+        
+        assert threads[0] is not threading.main_thread()
+        assert threads[1] is threading.main_thread()
+    
+    def test_it_awaits_async_custom_validators_of_offloaded_documents(self):
+        messages = asyncio.run(avalidate(async_book_schema, { 'title': 'nw', 'author': 'Zadie Smith' }, offload=True))
+
+        assert [ message.type for message in messages ] == [ 'no_capital' ]
+
+
+class TestAsyncValidateMany:
+    def test_it_validates_documents(self):
+        documents = [ { 'title': 'Swing Time', 'author': 'Zadie Smith' }, { 'title': 'nw', 'author': 'Zadie Smith' }, {} ]
+        results = asyncio.run(collect(avalidate_many(async_book_schema, documents)))
+
+        assert [ (document_number, [ message.type for message in messages ]) for document_number, messages in results ] == [
+            (0, []),
+            (1, [ 'no_capital' ]),
+            (2, [ 'missing_field' ])
+        ]
+    
+    def test_it_reads_an_async_iterable(self):
+        async def read():
+            yield { 'title': 5 }
+            yield { 'title': 'NW' }
+
+        results = asyncio.run(collect(avalidate_many(book_schema, read(), { 'source': 'books' })))
+
+        assert [ document_number for document_number, _ in results ] == [ 0, 1 ]
+        assert results[0][1][0].source == 'books'
+        assert results[1][1] == []
+    
+    def test_it_lets_other_tasks_run_between_documents(self):
+        events = []
+        async def other_task():
+            events.append('other')
+
+        async def run():
+            task = asyncio.ensure_future(other_task())
+            async for document_number, _ in avalidate_many(book_schema, [ {}, {} ]):
+                events.append(document_number)
+            await task
+        
+        asyncio.run(run())
+
+        assert events == [ 0, 'other', 1 ]
+
+
+async def collect(results):
+    return [ result async for result in results ]
+
+async def capitalized(field, value):
+    await asyncio.sleep(0)
+    if not value[0].isupper():
+        return Message(type='no_capital', field=field)
+
+async def known_isbn(field, value):
+    await asyncio.sleep(0.001)
+    if value == 'unknown':
+        return Message(type='unknown_isbn', field=field)
+
+def sync_capitalized(field, value):
+    if not value[0].isupper():
+        return Message(type='no_capital', field=field)
+
+def book_schema():
+    required('title', type='string')
+
+def async_book_schema():
+    required('title', type='custom', validator=capitalized)
+    optional('author', type='string')
+    optional('isbn', type='custom', validator=known_isbn)
+    optional('page_count', type='int', min=1)
+
+def async_shelf_schema():
+    required('books[].title', type='custom', validator=capitalized)
+
+def sync_shelf_schema():
+    required('books[].title', type='custom', validator=sync_capitalized)
@@ -0,0 +1,43 @@
+from okay import validate
+from benchmarks import accommodation, generators, runner
+
+class TestGenerators:
+    def test_it_generates_valid_documents(self):
+        schema = generators.generate_schema(fields=5, depth=3, list_length=2)
+        documents = generators.generate_documents(20, fields=5, depth=3, list_length=2)
+
+        assert all(validate(schema, document) == [] for document in documents)
+        assert 'field_4' in documents[0]['child']['child']
+        assert len(documents[0]['items']) == 2
+    
+    def test_it_generates_invalid_documents(self):
+        schema = generators.generate_schema(fields=5, depth=2, list_length=2)
+        documents = generators.generate_documents(20, fields=5, depth=2, list_length=2, error_rate=1.0)
+
+        assert all(len(validate(schema, document)) == 1 for document in documents)
+    
+    def test_it_generates_the_same_documents_for_the_same_seed(self):
+        first = generators.generate_documents(5, error_rate=0.5, seed=3)
+        second = generators.generate_documents(5, error_rate=0.5, seed=3)
+
+        assert first == second
+        assert first != generators.generate_documents(5, error_rate=0.5, seed=4)
+
+
+class TestRunner:
+    def test_it_times_each_phase_of_the_interpreter(self):
+        results = runner.run([ 'accommodation' ], [ 'interpreter', 'lazy' ], count=4, repeat=1)
+
+        interpreter, lazy = results['results']
+        assert set(interpreter['seconds']) == set(runner.PHASES) | { 'total' }
+        assert set(lazy['seconds']) == { 'compile', 'total' }
+        assert interpreter['messages'] == lazy['messages'] == 2 * len(validate(accommodation.schema, accommodation.invalid_document))
+    
+    def test_it_reports_regressions(self):
+        baseline = { 'results': [ { 'workload': 'flat', 'engine': 'lazy', 'seconds': { 'total': 1.0 } } ] }
+        slower = { 'results': [ { 'workload': 'flat', 'engine': 'lazy', 'seconds': { 'total': 1.2 } } ] }
+        faster = { 'results': [ { 'workload': 'flat', 'engine': 'lazy', 'seconds': { 'total': 0.8 } } ] }
+
+        assert len(runner.compare(baseline, slower, threshold=0.1)) == 1
+        assert runner.compare(baseline, slower, threshold=0.5) == []
+        assert runner.compare(baseline, faster) == []
@@ -0,0 +1,75 @@
+import pytest
+from okay import validate
+from okay.code_generator import generate, generate_source
+from okay.schema_compiler import compile
+from okay.schema import *
+
+class TestCodeGenerator:
+    def test_it_generates_a_function_that_returns_messages(self):
+        def schema():
+            required('metadata', type='object')
+        
+        validate_document = generate(compile(schema))
+        messages = validate_document({ 'metadata': True })
+
+        assert len(messages) == 1
+        assert messages[0].type == 'invalid_type'
+        assert messages[0].field == 'metadata'
+    
+    def test_it_reports_messages_in_the_same_order_as_the_interpreter(self):
+        def schema():
+            required('rooms[].name', type='string')
+            required('rooms[].size', type='number', min=10)
+            required('title', type='string')
+        
+        document = {
+            'title': 5,
+            'rooms': [{ 'size': 5 }, { 'name': 3, 'size': 'big', 'view': 'sea' }]
+        }
+        expected = validate(schema, document)
+        messages = validate(schema, document, engine='generated')
+
+        assert [ m.__dict__ for m in messages ] == [ m.__dict__ for m in expected ]
+    
+    def test_it_falls_back_to_the_interpreter_for_keys_containing_dots(self):
+        def schema():
+            required('accommodation.geo.latitude', type='string')
+        
+        document = {
+            'accommodation': {
+                'geo.latitude': 5
+            }
+        }
+        messages = validate(schema, document, engine='generated')
+
+        assert len(messages) == 1
+        assert messages[0].type == 'invalid_type'
+        assert messages[0].field == 'accommodation.geo.latitude'
+    
+    def test_it_handles_any_character_in_keys_below_a_list(self):
+        def schema():
+            required('rooms[].name%d\0', type='string')
+        
+        document = { 'rooms': [ { 'name%d\0': 1 } ] }
+        messages = validate(schema, document, engine='generated')
+
+        assert [ message.field for message in messages ] == [ 'rooms[0].name%d\0' ]
+        assert [ message.__dict__ for message in messages ] == [ message.__dict__ for message in validate(schema, document) ]
+    
+    def test_it_inlines_type_checks(self):
+        def schema():
+            required('metadata', type='object')
+            required('is_active', type='bool')
+        
+        source = generate_source(compile(schema))
+
+        assert 'isinstance(v1, dict)' in source
+        assert 'isinstance(v1, bool)' in source
+    
+    def test_it_raises_on_unknown_engine(self):
+        with pytest.raises(ValueError):
+            validate(empty_schema, {}, engine='turbo')
+
+
+def empty_schema():
+    pass
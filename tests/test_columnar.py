@@ -0,0 +1,231 @@
+import pytest
+from okay import validate, validate_columns, Message
+from okay.schema import *
+
+class TestColumnar:
+    def test_it_accepts_valid_columns(self):
+        columns = {
+            'id': [ 1, 2, 3 ],
+            'name': [ 'Alpha', 'Beta', 'Gamma' ],
+            'price': [ 9.99, 0, 100 ],
+            'in_stock': [ True, False, True ]
+        }
+
+        assert validate_columns(product_schema, columns) == []
+
+    def test_it_adds_row_numbers_to_messages(self):
+        columns = {
+            'id': [ 1, -2, 3 ],
+            'name': [ 'Alpha', 'Beta', 'Gamma' ],
+            'price': [ 9.99, 0, 1000 ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type, message.field) for message in messages ] == [
+            (1, 'number_too_small', 'id'),
+            (2, 'number_too_large', 'price')
+        ]
+
+    def test_it_checks_types(self):
+        columns = {
+            'id': [ 1.5, 2.0, '3' ],
+            'name': [ 'Alpha', 5, None ],
+            'price': [ 'free', True, 1 ],
+            'in_stock': [ 1, True, None ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type, message.field) for message in messages ] == [
+            (0, 'invalid_type', 'id'),
+            (0, 'invalid_type', 'price'),
+            (0, 'invalid_type', 'in_stock'),
+            (1, 'invalid_type', 'name'),
+            (2, 'invalid_type', 'id'),
+            (2, 'null_value', 'name'),
+            (2, 'null_value', 'in_stock')
+        ]
+
+    def test_it_checks_string_lengths(self):
+        columns = {
+            'id': [ 1, 2 ],
+            'name': [ '', 'A' * 21 ],
+            'price': [ 1, 1 ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ message.type for message in messages ] == [ 'string_too_short', 'string_too_long' ]
+
+    def test_it_reports_missing_and_extra_columns(self):
+        columns = {
+            'id': [ 1, 2 ],
+            'name': [ 'Alpha', 'Beta' ],
+            'colour': [ 'red', 'blue' ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type, message.field) for message in messages ] == [
+            (0, 'missing_field', 'price'),
+            (0, 'extra_field', 'colour'),
+            (1, 'missing_field', 'price'),
+            (1, 'extra_field', 'colour')
+        ]
+
+    def test_it_gives_the_same_messages_as_validating_each_row(self):
+        columns = {
+            'tags': [ [], [ 'a' ], None, 'a' ],
+            'price': [ -1, 'free', 2.5, 5 ],
+            'code': [ 'ab', 'abc', 'x', None ],
+            'id': [ 1, 2, 3.0, True ],
+            'extra': [ 1, 2, 3, 4 ]
+        }
+        messages = validate_columns(mixed_schema, columns)
+
+        expected = []
+        for row_number in range(4):
+            row = { name: column[row_number] for name, column in columns.items() }
+            expected += validate(mixed_schema, row, { 'row_number': row_number })
+
+        assert messages == expected
+
+    def test_it_runs_custom_validators_for_each_row(self):
+        def schema():
+            required('value', type='custom', validator=lambda field, value: None if value % 2 == 0 else Message(type='odd', field=field))
+
+        messages = validate_columns(schema, { 'value': [ 2, 3, 4, 5 ] })
+
+        assert [ (message.row_number, message.type) for message in messages ] == [ (1, 'odd'), (3, 'odd') ]
+
+    def test_it_validates_nested_fields_row_by_row(self):
+        def schema():
+            required('author.name', type='string')
+
+        messages = validate_columns(schema, { 'author': [ { 'name': 'Ann' }, {}, None ] })
+
+        assert [ (message.row_number, message.type, message.field) for message in messages ] == [
+            (1, 'missing_field', 'author.name'),
+            (2, 'null_value', 'author'),
+            (2, 'missing_field', 'author.name')
+        ]
+
+    def test_it_validates_objects_in_columns_row_by_row(self):
+        def schema():
+            required('a', type='object')
+            optional('b')
+            optional('c', type='list')
+
+        columns = {
+            'a': [ { 'x': 1 }, {} ],
+            'b': [ { 'y': 2 }, 1 ],
+            'c': [ [ 1 ], [ { 'z': 3 } ] ]
+        }
+        messages = validate_columns(schema, columns)
+
+        expected = []
+        for row_number in range(2):
+            row = { name: column[row_number] for name, column in columns.items() }
+            expected += validate(schema, row, { 'row_number': row_number })
+
+        assert [ message.field for message in messages ] == [ 'a.x', 'b.y', 'c[0].z' ]
+        assert messages == expected
+
+    def test_it_accepts_any_sequence_as_a_column(self):
+        columns = {
+            'id': range(3),
+            'name': ('Alpha', 'Beta', ''),
+            'price': [ 1, 2, 3 ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type) for message in messages ] == [ (2, 'string_too_short') ]
+
+    def test_it_adds_message_values(self):
+        columns = { 'id': [ -1 ], 'name': [ 'Alpha' ], 'price': [ 1 ] }
+        messages = validate_columns(product_schema, columns, { 'source': 'products.csv' })
+
+        assert messages[0].source == 'products.csv'
+        assert messages[0].row_number == 0
+
+    def test_it_accepts_no_columns(self):
+        assert validate_columns(product_schema, {}) == []
+
+    def test_it_raises_if_columns_have_different_lengths(self):
+        with pytest.raises(ValueError):
+            validate_columns(product_schema, { 'id': [ 1, 2 ], 'name': [ 'Alpha' ] })
+
+
+class TestColumnarNumPy:
+    @pytest.fixture
+    def numpy(self):
+        return pytest.importorskip('numpy')
+
+    def test_it_validates_numpy_arrays(self, numpy):
+        columns = {
+            'id': numpy.array([ 1, -2, 3 ]),
+            'name': numpy.array([ 'Alpha', '', 'Gamma' ]),
+            'price': numpy.array([ 9.99, 0.0, 1000.0 ]),
+            'in_stock': numpy.array([ True, False, True ])
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type, message.field) for message in messages ] == [
+            (1, 'number_too_small', 'id'),
+            (1, 'string_too_short', 'name'),
+            (2, 'number_too_large', 'price')
+        ]
+
+    def test_it_checks_that_floats_are_ints(self, numpy):
+        columns = {
+            'id': numpy.array([ 1.0, 1.5 ]),
+            'name': [ 'Alpha', 'Beta' ],
+            'price': [ 1, 2 ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type) for message in messages ] == [ (1, 'invalid_type') ]
+
+    def test_it_validates_object_arrays(self, numpy):
+        columns = {
+            'id': numpy.array([ 1, None, 'x' ], dtype=object),
+            'name': [ 'Alpha', 'Beta', 'Gamma' ],
+            'price': [ 1, 2, 3 ]
+        }
+        messages = validate_columns(product_schema, columns)
+
+        assert [ (message.row_number, message.type) for message in messages ] == [ (1, 'null_value'), (2, 'invalid_type') ]
+
+    def test_it_compares_float32_arrays_exactly(self, numpy):
+        def schema():
+            required('value', type='number', min=0.7)
+
+        column = numpy.array([ 0.7, 0.8 ], dtype=numpy.float32)
+        messages = validate_columns(schema, { 'value': column })
+        expected = [ message for value in column.tolist() for message in validate(schema, { 'value': value }) ]
+
+        assert [ (message.row_number, message.type) for message in messages ] == [ (0, 'number_too_small') ]
+        assert [ message.type for message in messages ] == [ message.type for message in expected ]
+
+    def test_it_compares_int_arrays_with_float_bounds_exactly(self, numpy):
+        def schema():
+            required('value', type='number', max=float(2 ** 53))
+
+        messages = validate_columns(schema, { 'value': numpy.array([ 2 ** 53, 2 ** 53 + 1 ], dtype=numpy.int64) })
+
+        assert [ (message.row_number, message.type) for message in messages ] == [ (1, 'number_too_large') ]
+
+    def test_it_raises_on_multi_dimensional_arrays(self, numpy):
+        with pytest.raises(ValueError):
+            validate_columns(product_schema, { 'id': numpy.zeros((2, 2)) })
+
+
+def product_schema():
+    required('id', type='int', min=0)
+    required('name', type='string', min=1, max=20)
+    required('price', type='number', min=0, max=999)
+    optional('in_stock', type='bool')
+
+def mixed_schema():
+    required('tags', type='list', min=1)
+    optional('price', type='number', min=0)
+    required('code', type='string?', regex='[a-z]{2}')
+    required('id', type='int')
+    required('missing')
@@ -0,0 +1,126 @@
+import copy
+from okay import validate, revalidate, Message
+from okay.schema import *
+
+class TestRevalidate:
+    def test_it_replaces_messages_of_a_changed_field(self):
+        document = { 'title': 5, 'author': 'Zadie Smith', 'page_count': 0 }
+        messages = validate(book_schema, document)
+
+        document['title'] = 'Swing Time'
+        messages = revalidate(book_schema, document, messages, [ 'title' ])
+
+        assert types(messages) == [ ('number_too_small', 'page_count') ]
+    
+    def test_it_adds_messages_of_a_changed_field(self):
+        document = { 'title': 'Swing Time', 'author': 'Zadie Smith' }
+        messages = validate(book_schema, document)
+
+        document['author'] = None
+        messages = revalidate(book_schema, document, messages, [ 'author' ])
+
+        assert types(messages) == [ ('null_value', 'author') ]
+    
+    def test_it_reports_removed_fields(self):
+        document = { 'title': 'Swing Time', 'author': 'Zadie Smith', 'isbn': '978-1594203985' }
+        messages = validate(book_schema, document)
+
+        del document['author']
+        del document['isbn']
+        messages = revalidate(book_schema, document, messages, [ 'author', 'isbn' ])
+
+        assert types(messages) == [ ('missing_field', 'author') ]
+    
+    def test_it_revalidates_nested_fields(self):
+        document = { 'title': 'NW', 'author': 'Zadie Smith', 'chapters': [ { 'title': 'Visitation' }, { 'title': 5 } ] }
+        messages = validate(book_schema, document)
+
+        document['chapters'][1] = { 'title': 'Guest', 'pages': 10 }
+        document['chapters'][0] = { 'title': None }
+        messages = revalidate(book_schema, document, messages, [ 'chapters[0]', 'chapters[1]' ])
+
+        assert sorted(types(messages)) == [ ('extra_field', 'chapters[1].pages'), ('null_value', 'chapters[0].title') ]
+    
+    def test_it_runs_custom_validators_of_parents_again(self):
+        document = { 'title': 'NW', 'author': 'Zadie Smith', 'edition': { 'year': 2012, 'reprint': 2010 } }
+        messages = validate(book_schema, document)
+
+        document['edition']['reprint'] = 2013
+        messages = revalidate(book_schema, document, messages, [ 'edition.reprint' ])
+
+        assert messages == []
+    
+    def test_it_accepts_a_json_patch(self):
+        document = { 'title': 'NW', 'author': 'Zadie Smith', 'chapters': [ { 'title': 'Visitation' }, { 'title': 5 } ] }
+        messages = validate(book_schema, document)
+
+        del document['chapters'][1]
+        document['isbn'] = 'unknown'
+        patch = [
+            { 'op': 'remove', 'path': '/chapters/1' },
+            { 'op': 'add', 'path': '/isbn', 'value': 'unknown' },
+            { 'op': 'test', 'path': '/title', 'value': 'NW' }
+        ]
+        messages = revalidate(book_schema, document, messages, patch)
+
+        assert types(messages) == [ ('extra_field', 'isbn') ]
+    
+    def test_it_gives_the_same_messages_as_validate(self):
+        document = {
+            'title': 'NW',
+            'chapters': [ { 'title': 'Visitation', 'pages': 'many' }, { 'title': None }, {} ],
+            'edition': { 'year': 2012, 'reprint': 2010 }
+        }
+        messages = validate(book_schema, document)
+
+        changed_document = copy.deepcopy(document)
+        changed_document['chapters'][0]['title'] = 1
+        changed_document['chapters'].append({ 'title': 'Guest' })
+        changed_document['edition'] = None
+        changes = [ 'chapters[0].title', 'chapters', 'edition' ]
+
+        expected = validate(book_schema, changed_document)
+        messages = revalidate(book_schema, changed_document, messages, changes, { 'source': 'editor' })
+
+        assert sorted(types(messages)) == sorted(types(expected))
+        assert all(message.source == 'editor' for message in messages if message.field.startswith(('chapters', 'edition')))
+    
+    def test_it_ignores_extra_fields_in_objects_that_ignore_them(self):
+        def schema():
+            required('title', type='string')
+            optional('edition', type='object')
+            ignore_extra_fields('edition')
+
+        document = { 'title': 'NW', 'edition': {} }
+        messages = validate(schema, document)
+
+        document['edition']['year'] = 2012
+        document['isbn'] = 'unknown'
+        messages = revalidate(schema, document, messages, [ 'edition.year', 'isbn' ])
+
+        assert types(messages) == [ ('extra_field', 'isbn') ]
+    
+    def test_it_validates_everything_when_the_document_changed(self):
+        document = { 'title': 5 }
+        messages = validate(book_schema, document)
+
+        messages = revalidate(book_schema, { 'title': 'NW' }, messages, [ '.' ])
+
+        assert types(messages) == [ ('missing_field', 'author') ]
+
+
+def types(messages):
+    return [ (message.type, message.field) for message in messages ]
+
+def reprint_after_year(field, value):
+    if value.get('reprint', value['year']) < value['year']:
+        return Message(type='reprint_before_year', field=field)
+
+def book_schema():
+    required('title', type='string')
+    required('author', type='string')
+    optional('page_count', type='int', min=1)
+    optional('chapters[].title', type='string')
+    optional('edition', type='custom', validator=reprint_after_year)
+    optional('edition.year', type='int')
+    optional('edition.reprint', type='int')
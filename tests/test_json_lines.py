@@ -0,0 +1,109 @@
+import io
+import pytest
+from okay import validate_jsonl, SchemaError
+from okay.schema import *
+
+class TestJsonLines:
+    def test_it_validates_each_line(self):
+        file = io.BytesIO(b'{"title": "Swing Time"}\n{"title": 5}\n{}\n')
+        results = list(validate_jsonl(book_schema, file))
+
+        assert [ line_number for line_number, _ in results ] == [ 1, 2, 3 ]
+        assert results[0][1] == []
+        assert results[1][1][0].type == 'invalid_type'
+        assert results[2][1][0].type == 'missing_field'
+    
+    def test_it_adds_line_number_and_byte_offset_to_messages(self):
+        file = io.BytesIO(b'{"title": "Caf\xc3\xa9"}\n{"title": 5}\n')
+        results = list(validate_jsonl(book_schema, file))
+
+        message = results[1][1][0]
+        assert message.line_number == 2
+        assert message.byte_offset == 19
+    
+    def test_it_reports_invalid_json(self):
+        file = io.BytesIO(b'{"title": "Swing Time"}\n{"title": \n')
+        results = list(validate_jsonl(book_schema, file))
+
+        message = results[1][1][0]
+        assert message.type == 'invalid_json'
+        assert message.line_number == 2
+        assert message.byte_offset == 24
+        assert message.position == 11
+    
+    def test_it_skips_empty_lines(self):
+        file = io.BytesIO(b'{"title": "Swing Time"}\n\n{"title": 5}\n')
+        results = list(validate_jsonl(book_schema, file))
+
+        assert [ line_number for line_number, _ in results ] == [ 1, 3 ]
+    
+    def test_it_reads_a_file_by_path(self, tmp_path):
+        path = tmp_path / 'books.jsonl'
+        path.write_bytes(b'{"title": 5}\n{"title": "Swing Time"}')
+        results = list(validate_jsonl(book_schema, path, { 'source': 'books' }))
+
+        assert len(results) == 2
+        assert results[0][1][0].source == 'books'
+        assert results[1][1] == []
+    
+    def test_it_reads_a_text_file(self):
+        file = io.StringIO('{"title": "Café"}\n{"title": 5}\n')
+        results = list(validate_jsonl(book_schema, file))
+
+        assert results[1][1][0].byte_offset == 19
+    
+    def test_it_counts_the_bytes_in_a_file_opened_in_text_mode(self, tmp_path):
+        path = tmp_path / 'books.jsonl'
+        path.write_bytes('{"title": "Café"}\r\n{"title": 5}\r\n'.encode('latin-1'))
+        with open(path, encoding='latin-1') as file:
+            results = list(validate_jsonl(book_schema, file))
+
+        assert results[0][1] == []
+        assert results[1][1][0].byte_offset == 19
+    
+    def test_it_reads_the_rest_of_a_file_opened_in_text_mode(self, tmp_path):
+        path = tmp_path / 'books.jsonl'
+        path.write_text('{"title": "Swing Time"}\n{"title": 5}\n{}\n')
+        with open(path) as file:
+            file.readline()
+            results = list(validate_jsonl(book_schema, file))
+
+        assert [ line_number for line_number, _ in results ] == [ 1, 2 ]
+        assert results[0][1][0].type == 'invalid_type'
+        assert results[1][1][0].type == 'missing_field'
+    
+    def test_it_raises_schema_errors_before_reading(self):
+        def schema():
+            required('title', type='unknown')
+        
+        with pytest.raises(SchemaError):
+            validate_jsonl(schema, io.BytesIO(b'{}'))
+
+    
+    def test_it_validates_byte_ranges_in_worker_processes(self, tmp_path):
+        path = tmp_path / 'books.jsonl'
+        path.write_bytes(b'{"title": "Caf\xc3\xa9"}\n{"title": 5}\n\n{"title": \n{}\n{"title": "Swing Time"}\n{"author": "Zadie Smith"}')
+        expected = [ (line_number, [ message.__dict__ for message in messages ]) for line_number, messages in validate_jsonl(book_schema, path) ]
+
+        results = validate_jsonl(book_schema, path, { 'source': 'books' }, workers=2, chunk_bytes=16)
+        results = [ (line_number, [ message.__dict__ for message in messages ]) for line_number, messages in results ]
+
+        for _, messages in expected:
+            for message in messages:
+                message['source'] = 'books'
+        assert results == expected
+        assert [ line_number for line_number, _ in results ] == [ 1, 2, 4, 5, 6, 7 ]
+    
+    def test_it_validates_an_empty_file_in_worker_processes(self, tmp_path):
+        path = tmp_path / 'books.jsonl'
+        path.write_bytes(b'')
+
+        assert list(validate_jsonl(book_schema, path, workers=2)) == []
+    
+    def test_it_raises_when_using_worker_processes_without_a_path(self):
+        with pytest.raises(ValueError):
+            validate_jsonl(book_schema, io.BytesIO(b'{}'), workers=2)
+
+
+def book_schema():
+    required('title', type='string')
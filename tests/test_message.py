@@ -0,0 +1,86 @@
+import copy
+import pickle
+import pytest
+from okay import Message
+from okay.type_validators import NumberValidator
+
+class TestMessage:
+    def test_it_stores_fields(self):
+        message = Message(type='invalid_type', field='title', expected={ 'type': 'string' }, document_number=3)
+
+        assert message.type == 'invalid_type'
+        assert message.field == 'title'
+        assert message.expected == { 'type': 'string' }
+        assert message.document_number == 3
+    
+    def test_it_adds_fields(self):
+        message = Message(type='missing_field', field='title')
+
+        message.add(field='author', source='books', line_number=2)
+
+        assert message.field == 'author'
+        assert message.source == 'books'
+        assert message.__dict__ == { 'type': 'missing_field', 'field': 'author', 'source': 'books', 'line_number': 2 }
+    
+    def test_it_sets_and_deletes_fields_like_attributes(self):
+        message = Message(type='missing_field', field='title')
+
+        message.priority = 1
+        message.field = 'author'
+
+        assert message.priority == 1
+        assert message.to_dict() == { 'type': 'missing_field', 'field': 'author', 'priority': 1 }
+
+        del message.priority
+
+        assert not hasattr(message, 'priority')
+        with pytest.raises(AttributeError):
+            del message.priority
+    
+    def test_it_writes_changes_to_its_dict_back(self):
+        message = Message(type='missing_field', field='title', source='books')
+
+        message.__dict__['priority'] = 1
+        vars(message).update(field='author')
+        del message.__dict__['source']
+
+        assert message.priority == 1
+        assert message.to_dict() == { 'type': 'missing_field', 'field': 'author', 'priority': 1 }
+    
+    def test_it_has_no_missing_fields(self):
+        message = Message(type='invalid_json', position=3)
+
+        assert not hasattr(message, 'field')
+        assert not hasattr(message, 'expected')
+        assert not hasattr(message, 'source')
+        assert vars(message) == { 'type': 'invalid_json', 'position': 3 }
+        with pytest.raises(AttributeError):
+            message.source
+    
+    def test_it_compares_by_value(self):
+        message = Message(type='missing_field', field='title', source='books')
+
+        assert message == Message(type='missing_field', field='title', source='books')
+        assert message != Message(type='missing_field', field='title')
+        assert message != Message(type='missing_field', field='author', source='books')
+    
+    def test_it_can_be_copied_and_pickled(self):
+        message = Message(type='missing_field', field='title', source='books')
+
+        for copied_message in (copy.copy(message), copy.deepcopy(message), pickle.loads(pickle.dumps(message))):
+            assert copied_message == message
+            copied_message.add(source='other')
+            assert message.source == 'books'
+    
+    def test_it_has_a_representation_without_field(self):
+        assert repr(Message(type='missing_field', field='title')) == 'missing_field: title'
+        assert repr(Message(type='invalid_json')) == 'invalid_json'
+    
+    def test_it_shares_expected_values_of_a_validator(self):
+        validate = NumberValidator(min=1)
+
+        first = validate('page_count', 0)
+        second = validate('page_count', -1)
+
+        assert first.expected is second.expected
+        assert first.expected == { 'min': 1, 'max': None, 'options': None }
@@ -166,4 +166,47 @@ class TestNumberValidator:
 
         message = validate_number('score', 6)
 
-        assert message.type == 'number_too_large'
\ No newline at end of file
+        assert message.type == 'number_too_large'
+    
+    def test_it_compares_floats_exactly(self):
+        validate_number = NumberValidator(max=2**53)
+
+        message = validate_number('score', float(2**53 + 1))
+
+        assert message is None
+        assert validate_number('score', 2**53 + 1).type == 'number_too_large'
+    
+    def test_it_accepts_a_float_equal_to_an_integer_option(self):
+        validate_number = NumberValidator(options=[1, 2, 3])
+
+        message = validate_number('score', 2.0)
+
+        assert message is None
+    
+    def test_it_compares_a_float_with_a_decimal_limit_exactly(self):
+        validate_number = NumberValidator(min=Decimal('0.1'))
+
+        message = validate_number('score', 0.1)
+
+        assert message is None
+        assert validate_number('score', Decimal('0.09')).type == 'number_too_small'
+    
+    def test_it_accepts_a_decimal_in_a_list_of_options(self):
+        validate_number = NumberValidator(options=[0.5, 1.5])
+
+        message = validate_number('score', Decimal('1.5'))
+
+        assert message is None
+    
+    def test_it_keeps_the_list_of_options_in_the_message(self):
+        validate_number = NumberValidator(options=(1, 2))
+
+        message = validate_number('score', 3)
+
+        assert message.expected['options'] == (1, 2)
+    
+    def test_it_raises_when_comparing_nan_with_a_limit(self):
+        validate_number = NumberValidator(min=0)
+
+        with pytest.raises(ArithmeticError):
+            validate_number('score', float('nan'))
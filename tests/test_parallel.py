@@ -0,0 +1,49 @@
+import pytest
+from okay import validate_many, SchemaError
+from okay.schema import *
+
+class TestParallel:
+    def test_it_validates_documents_in_worker_processes(self):
+        documents = [ { 'title': 'Mr Loverman' }, { 'title': 7 }, {}, { 'title': 'Swing Time' }, { 'title': None } ]
+        results = list(validate_many(book_schema, documents, workers=2, chunk_size=2))
+
+        assert [ document_number for document_number, _ in results ] == [ 0, 1, 2, 3, 4 ]
+        assert [ [ message.type for message in messages ] for _, messages in results ] == [
+            [],
+            [ 'invalid_type' ],
+            [ 'missing_field' ],
+            [],
+            [ 'null_value' ]
+        ]
+        assert results[1][1][0].field == 'title'
+    
+    def test_it_validates_documents_with_a_schema_that_cant_be_pickled(self):
+        minimum = 1
+        def schema():
+            required('page_count', type='int', min=minimum)
+        
+        documents = [ { 'page_count': 0 }, { 'page_count': 1 } ]
+        results = list(validate_many(schema, documents, workers=1, engine='generated'))
+
+        assert results[0][1][0].type == 'number_too_small'
+        assert results[1][1] == []
+    
+    def test_it_adds_specified_values_to_messages(self):
+        results = list(validate_many(book_schema, [ {} ], { 'source': 'books.jsonl' }, workers=1))
+
+        assert results[0][1][0].source == 'books.jsonl'
+    
+    def test_it_raises_schema_errors_before_starting_workers(self):
+        def schema():
+            required('title', type='unknown')
+        
+        with pytest.raises(SchemaError):
+            list(validate_many(schema, [ {} ], workers=2))
+    
+    def test_it_raises_when_chunk_size_is_invalid(self):
+        with pytest.raises(ValueError):
+            list(validate_many(book_schema, [ {} ], workers=1, chunk_size=0))
+
+
+def book_schema():
+    required('title', type='string')
@@ -0,0 +1,114 @@
+import pytest
+from okay import Pipeline
+from okay.schema import *
+
+class TestPipeline:
+    def test_it_routes_valid_and_invalid_documents(self):
+        valid_sink = ListSink()
+        invalid_sink = ListSink()
+        documents = [ { 'title': 'Swing Time' }, { 'title': 5 }, {}, { 'title': 'NW' } ]
+
+        Pipeline(book_schema, valid_sink, invalid_sink).run(documents)
+
+        assert valid_sink.items == [ { 'title': 'Swing Time' }, { 'title': 'NW' } ]
+        assert invalid_sink.items == [ { 'title': 5 }, {} ]
+    
+    def test_it_writes_messages_with_document_number(self):
+        message_sink = ListSink()
+        documents = [ { 'title': 'Swing Time' }, { 'title': 5 }, {} ]
+
+        Pipeline(book_schema, message_sink=message_sink, message_values={ 'source': 'books' }).run(documents)
+
+        assert [ (message.document_number, message.type, message.source) for message in message_sink.items ] == [
+            (1, 'invalid_type', 'books'),
+            (2, 'missing_field', 'books')
+        ]
+    
+    def test_it_writes_in_batches(self):
+        valid_sink = ListSink()
+        documents = [ { 'title': str(i) } for i in range(5) ]
+
+        Pipeline(book_schema, valid_sink, batch_size=2).run(documents)
+
+        assert [ len(batch) for batch in valid_sink.batches ] == [ 2, 2, 1 ]
+    
+    def test_it_reads_documents_one_at_a_time(self):
+        valid_sink = ListSink()
+        read_count = 0
+        def read():
+            nonlocal read_count
+            for i in range(3):
+                read_count += 1
+                yield { 'title': str(i) }
+        
+        pipeline = Pipeline(book_schema, valid_sink, batch_size=1)
+        pipeline.valid_sink.write = lambda batch: valid_sink.batches.append((read_count, batch))
+        pipeline.run(read())
+
+        assert [ count for count, _ in valid_sink.batches ] == [ 1, 2, 3 ]
+    
+    def test_it_closes_sinks(self):
+        valid_sink = ListSink()
+        invalid_sink = ListSink()
+
+        Pipeline(book_schema, valid_sink, invalid_sink).run([])
+
+        assert valid_sink.is_closed
+        assert invalid_sink.is_closed
+    
+    def test_it_closes_sinks_when_reading_fails(self):
+        valid_sink = ListSink()
+        def read():
+            yield { 'title': 'Swing Time' }
+            raise RuntimeError('Reading failed.')
+
+        with pytest.raises(RuntimeError):
+            Pipeline(book_schema, valid_sink).run(read())
+        
+        assert valid_sink.is_closed
+    
+    def test_it_reports_stats(self):
+        documents = [ { 'title': 'Swing Time' }, { 'title': 5 }, { 'author': None } ]
+
+        stats = Pipeline(book_schema).run(documents)
+
+        assert stats.documents == 3
+        assert stats.valid_documents == 1
+        assert stats.invalid_documents == 2
+        assert stats.messages == 3
+        assert stats.seconds > 0
+        assert stats.documents_per_second > 0
+    
+    def test_it_validates_in_worker_processes(self):
+        valid_sink = ListSink()
+        invalid_sink = ListSink()
+        documents = [ { 'title': str(i) } if i % 3 else { 'title': i } for i in range(10) ]
+
+        Pipeline(book_schema, valid_sink, invalid_sink, workers=2, chunk_size=3).run(documents)
+
+        assert invalid_sink.items == [ { 'title': 0 }, { 'title': 3 }, { 'title': 6 }, { 'title': 9 } ]
+        assert len(valid_sink.items) == 6
+    
+    def test_it_raises_on_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            Pipeline(book_schema, batch_size=0)
+
+
+class ListSink:
+    def __init__(self):
+        self.batches = []
+        self.is_closed = False
+
+    @property
+    def items(self):
+        return [ item for batch in self.batches for item in batch ]
+
+    def write(self, items):
+        self.batches.append(items)
+
+    def close(self):
+        self.is_closed = True
+
+
+def book_schema():
+    required('title', type='string')
@@ -0,0 +1,80 @@
+from okay import Validator, Profiler, Message
+from okay.profiler import PHASES
+from okay.schema import *
+
+class TestProfiler:
+    def test_it_times_each_phase(self):
+        profiler = Profiler()
+        validator = Validator(profiler=profiler)
+
+        validator.validate(book_schema, { 'title': 'NW', 'chapters': [ { 'title': 5 }, {} ] })
+        validator.validate(book_schema, { 'title': 'Swing Time', 'author': 'Zadie Smith' })
+
+        assert set(profiler.phases) == set(PHASES)
+        assert all(seconds >= 0 for seconds in profiler.phases.values())
+        assert profiler.phases['compile'] > 0
+        assert profiler.seconds == sum(profiler.phases.values())
+        assert profiler.documents == 2
+        assert profiler.messages == 2
+    
+    def test_it_counts_rules(self):
+        calls = []
+        def slow(field, value):
+            calls.append(field)
+            return Message(type='slow', field=field)
+
+        def schema():
+            required('title', type='string')
+            optional('chapters[].title', type='custom', validator=slow)
+        
+        profiler = Profiler()
+        Validator(profiler=profiler).validate(schema, { 'title': 'NW', 'chapters': [ { 'title': 'Visitation' }, { 'title': 'Guest' } ] })
+
+        stats = profiler.rules[('chapters[].title', 'custom')]
+        assert (stats.field, stats.type, stats.calls, stats.messages) == ('chapters[].title', 'custom', 2, 2)
+        assert stats.seconds > 0
+        assert profiler.rules[('title', 'string')].calls == 1
+        assert profiler.slowest_rules(1)[0].calls >= 1
+        assert len(profiler.slowest_rules()) == len(profiler.rules)
+    
+    def test_it_calls_the_callback(self):
+        results = []
+        profiler = Profiler(callback=lambda phases, messages: results.append((phases, messages)))
+
+        messages = Validator(profiler=profiler).validate(book_schema, { 'title': 5 })
+
+        assert len(results) == 1
+        assert set(results[0][0]) == { 'index', 'rules', 'missing', 'extra' }
+        assert results[0][1] == messages
+    
+    def test_it_profiles_many_documents(self):
+        profiler = Profiler()
+
+        list(Validator(profiler=profiler).validate_many(book_schema, [ {}, {}, {} ]))
+
+        assert profiler.documents == 3
+        assert profiler.messages == 6
+    
+    def test_it_limits_messages(self):
+        profiler = Profiler()
+
+        messages = Validator(profiler=profiler).validate(book_schema, {}, max_messages=1)
+
+        assert len(messages) == 1
+        assert profiler.messages == 2
+    
+    def test_it_resets(self):
+        profiler = Profiler()
+        Validator(profiler=profiler).validate(book_schema, {})
+
+        profiler.reset()
+
+        assert profiler.documents == 0
+        assert profiler.rules == {}
+        assert profiler.seconds == 0
+
+
+def book_schema():
+    required('title', type='string')
+    required('author', type='string')
+    optional('chapters[].title', type='string')
@@ -0,0 +1,130 @@
+from okay import validate, Validator, ResultCache, Message
+from okay.schema import *
+
+class TestResultCache:
+    def test_it_reuses_results_for_identical_documents(self):
+        calls = []
+        validator = Validator(result_cache=ResultCache())
+        schema = counting_schema(calls)
+
+        first = validator.validate(schema, { 'title': 'swing time', 'page_count': 0 })
+        second = validator.validate(schema, { 'title': 'swing time', 'page_count': 0 })
+
+        assert len(calls) == 1
+        assert [ message.__dict__ for message in second ] == [ message.__dict__ for message in first ]
+        assert validator.result_cache.hits == 1
+        assert validator.result_cache.misses == 1
+        assert validator.result_cache.hit_rate == 0.5
+    
+    def test_it_returns_new_messages_each_time(self):
+        validator = Validator(result_cache=ResultCache())
+
+        first = validator.validate(book_schema, { 'title': 5 }, { 'source': 'first' })
+        second = validator.validate(book_schema, { 'title': 5 })
+
+        assert first[0] is not second[0]
+        assert not hasattr(second[0], 'source')
+    
+    def test_it_distinguishes_values_of_different_types(self):
+        validator = Validator(result_cache=ResultCache())
+
+        assert validator.validate(book_schema, { 'title': 'NW', 'in_print': True }) == []
+        assert [ message.type for message in validator.validate(book_schema, { 'title': 'NW', 'in_print': 1 }) ] == [ 'invalid_type' ]
+    
+    def test_it_rewrites_paths_of_cached_fields(self):
+        calls = []
+        validator = Validator(result_cache=ResultCache(fields=[ 'books[]' ]))
+        book = { 'title': 'swing time', 'page_count': 0 }
+        document = { 'books': [ book, { 'title': 'NW' }, dict(book) ] }
+
+        messages = validator.validate(shelf_schema(calls), document)
+
+        assert [ message.__dict__ for message in messages ] == [ message.__dict__ for message in validate(shelf_schema([]), document) ]
+        assert [ message.field for message in messages if message.type == 'no_capital' ] == [ 'books[0].title', 'books[2].title' ]
+        assert len(calls) == 2
+    
+    def test_it_reuses_results_for_nested_fields_across_documents(self):
+        calls = []
+        validator = Validator(result_cache=ResultCache(fields=[ 'books[]' ]))
+        schema = shelf_schema(calls)
+
+        validator.validate(schema, { 'books': [ { 'title': 'swing time' } ] })
+        messages = validator.validate(schema, { 'books': [ { 'title': 'NW' }, { 'title': 'swing time' } ] })
+
+        assert [ message.field for message in messages ] == [ 'books[1].title' ]
+        assert len(calls) == 2
+    
+    def test_it_uses_a_custom_key(self):
+        validator = Validator(result_cache=ResultCache(key=lambda document: document['id']))
+
+        validator.validate(book_schema, { 'id': 1, 'title': 5 })
+        messages = validator.validate(book_schema, { 'id': 1, 'title': 'changed' })
+
+        assert [ message.type for message in messages ] == [ 'invalid_type', 'extra_field' ]
+    
+    def test_it_skips_values_that_cant_be_hashed(self):
+        validator = Validator(result_cache=ResultCache())
+
+        messages = validator.validate(book_schema, { 'title': { 'NW' } })
+
+        assert [ message.type for message in messages ] == [ 'invalid_type' ]
+        assert validator.result_cache.misses == 0
+    
+    def test_it_respects_the_maximum_number_of_messages(self):
+        validator = Validator(result_cache=ResultCache())
+        document = { 'title': 5, 'page_count': 0 }
+
+        validator.validate(book_schema, document)
+        messages = validator.validate(book_schema, document, max_messages=1)
+
+        assert [ message.type for message in messages ] == [ 'invalid_type' ]
+    
+    def test_it_evicts_least_recently_used_results(self):
+        cache = ResultCache(max_size=2)
+        validator = Validator(result_cache=cache)
+
+        for title in ('NW', 'Swing Time', 'NW', 'On Beauty'):
+            validator.validate(book_schema, { 'title': title })
+        validator.validate(book_schema, { 'title': 'NW' })
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.hits == 2
+    
+    def test_it_clears(self):
+        cache = ResultCache()
+        Validator(result_cache=cache).validate(book_schema, { 'title': 'NW' })
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+def book_schema():
+    required('title', type='string')
+    optional('page_count', type='int', min=1)
+    optional('in_print', type='bool')
+
+def counting_schema(calls):
+    def capitalized(field, value):
+        calls.append(field)
+        if not value[0].isupper():
+            return Message(type='no_capital', field=field)
+
+    def schema():
+        required('title', type='custom', validator=capitalized)
+        optional('page_count', type='int', min=1)
+    
+    return schema
+
+def shelf_schema(calls):
+    def capitalized(field, value):
+        calls.append(field)
+        if not value[0].isupper():
+            return Message(type='no_capital', field=field)
+
+    def schema():
+        required('books[].title', type='custom', validator=capitalized)
+        optional('books[].page_count', type='int', min=1)
+    
+    return schema
@@ -0,0 +1,92 @@
+from okay import explain
+from okay.schema_compiler import compile
+from okay.schema import *
+
+class TestRulePlan:
+    def test_it_drops_rules_that_cant_fail(self):
+        def schema():
+            required('title')
+
+        plan = compile(schema).tree.nodes['title'].plan
+
+        assert plan.validators == ()
+        assert plan.null_types == ('any',)
+    
+    def test_it_reports_null_values_for_each_non_nullable_rule(self):
+        def schema():
+            required('title', type='string')
+            required('title', type='string', min=1)
+            optional('edition', type='object?')
+
+        tree = compile(schema).tree
+
+        assert tree.nodes['title'].plan.null_types == ('string', 'string')
+        assert tree.nodes['edition'].plan.null_types == ()
+    
+    def test_it_checks_the_type_once_for_rules_of_the_same_type(self):
+        def schema():
+            required('title', type='string')
+            required('title', type='string', min=1)
+
+        plan = compile(schema).tree.nodes['title'].plan
+
+        assert plan.type_check == (str, { 'type': 'string' }, 2)
+        assert [ rule.parameters for rule in plan.checks ] == [ { 'min': 1 } ]
+    
+    def test_it_merges_implicit_object_rules_into_a_type_check(self):
+        def schema():
+            required('author.name', type='string')
+
+        plan = compile(schema).tree.nodes['author'].plan
+
+        assert plan.type_check == (dict, { 'type': 'object' }, 1)
+        assert plan.checks == ()
+    
+    def test_it_doesnt_check_the_type_separately_if_every_rule_has_parameters(self):
+        def schema():
+            required('title', type='string', min=1)
+
+        plan = compile(schema).tree.nodes['title'].plan
+
+        assert plan.type_check is None
+        assert len(plan.checks) == 1
+    
+    def test_it_keeps_rules_of_different_types_in_order(self):
+        def schema():
+            required('code', type='string', min=2)
+            required('code', type='custom', validator=lambda field, value: None)
+
+        plan = compile(schema).tree.nodes['code'].plan
+
+        assert plan.type_check is None
+        assert [ rule.type for rule in plan.checks ] == [ 'string', 'custom' ]
+
+
+class TestExplain:
+    def test_it_describes_the_plan_of_each_field(self):
+        def schema():
+            required('author.name', type='string', min=1)
+            optional('tags', type='list?')
+            required('isbn')
+
+        assert explain(schema) == '\n'.join([
+            'author.name',
+            '  if null: null_value (string)',
+            '  run: string(min=1)',
+            'author',
+            '  if null: null_value (object)',
+            '  if not dict: invalid_type',
+            '  dropped: implicit object (merged into type check)',
+            '.',
+            '  if null: null_value (object)',
+            '  if not dict: invalid_type',
+            '  dropped: implicit object (merged into type check)',
+            'tags[]',
+            '  nothing to run',
+            'tags',
+            '  if not list: invalid_type',
+            '  dropped: list? (merged into type check)',
+            'isbn',
+            '  if null: null_value (any)',
+            '  dropped: implicit any (no-op)'
+        ])
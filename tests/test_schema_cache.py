@@ -0,0 +1,124 @@
+import pytest
+from okay import SchemaError
+from okay.schema_cache import SchemaCache
+from okay.schema import *
+
+class TestSchemaCache:
+    def test_it_compiles_a_schema(self):
+        def schema():
+            required('title')
+        
+        schema_cache = SchemaCache()
+        compiled_schema = schema_cache.get(schema)
+
+        assert 'title' in compiled_schema.fields
+    
+    def test_it_compiles_a_schema_only_once(self):
+        call_count = 0
+        def schema():
+            nonlocal call_count
+            call_count += 1
+        
+        schema_cache = SchemaCache()
+        first = schema_cache.get(schema)
+        second = schema_cache.get(schema)
+
+        assert first is second
+        assert call_count == 1
+    
+    def test_it_wraps_exceptions_raised_by_the_schema(self):
+        def schema():
+            raise RuntimeError()
+        
+        schema_cache = SchemaCache()
+        with pytest.raises(SchemaError) as exception_info:
+            schema_cache.get(schema)
+        
+        assert type(exception_info.value.__cause__) == RuntimeError
+    
+    def test_it_counts_hits_and_misses(self):
+        schema_cache = SchemaCache()
+        schema_cache.get(book_schema)
+        schema_cache.get(book_schema)
+        schema_cache.get(author_schema)
+
+        assert schema_cache.hits == 1
+        assert schema_cache.misses == 2
+        assert len(schema_cache) == 2
+    
+    def test_it_evicts_the_least_recently_used_schema(self):
+        schema_cache = SchemaCache(max_size=2)
+        schema_cache.get(book_schema)
+        schema_cache.get(author_schema)
+        schema_cache.get(book_schema)
+        schema_cache.get(review_schema)
+
+        assert len(schema_cache) == 2
+        assert schema_cache.evictions == 1
+
+        schema_cache.get(book_schema)
+        schema_cache.get(author_schema)
+
+        assert schema_cache.hits == 2
+        assert schema_cache.misses == 4
+    
+    def test_it_recompiles_an_invalidated_schema(self):
+        schema_cache = SchemaCache()
+        first = schema_cache.get(book_schema)
+        schema_cache.invalidate(book_schema)
+        second = schema_cache.get(book_schema)
+
+        assert first is not second
+        assert schema_cache.misses == 2
+    
+    def test_it_clears_all_schemas(self):
+        schema_cache = SchemaCache()
+        schema_cache.get(book_schema)
+        schema_cache.get(author_schema)
+        schema_cache.clear()
+
+        assert len(schema_cache) == 0
+    
+    def test_it_forgets_schemas_that_no_longer_exist_when_using_weak_references(self):
+        def make_schema(field_name):
+            def schema():
+                required(field_name)
+            return schema
+        
+        schema_cache = SchemaCache(weak=True)
+        schema = make_schema('title')
+        schema_cache.get(schema)
+
+        assert len(schema_cache) == 1
+        assert schema_cache.get(schema) is not None
+        assert schema_cache.hits == 1
+
+        del schema
+
+        assert len(schema_cache) == 0
+    
+    def test_it_supports_methods_when_using_weak_references(self):
+        class Schemas:
+            def book(self):
+                required('title')
+        
+        schemas = Schemas()
+        schema_cache = SchemaCache(weak=True)
+        schema_cache.get(schemas.book)
+        schema_cache.get(schemas.book)
+
+        assert schema_cache.hits == 1
+
+        del schemas
+
+        assert len(schema_cache) == 0
+
+
+def book_schema():
+    required('title')
+
+def author_schema():
+    required('name')
+
+def review_schema():
+    required('score')
@@ -4,6 +4,21 @@ from okay.schema_compiler import required, optional, compile
 from okay.type_validators import AnyValidator, IntValidator, ObjectValidator, CustomValidator, StringValidator, NumberValidator, ListValidator
 
 class TestSchemaCompiler:
+    def test_it_compiles_a_schema_while_compiling_another_schema(self):
+        def inner_schema():
+            required('name')
+
+        def outer_schema():
+            required('author')
+            compile(inner_schema)
+            required('title')
+        
+        compiled_schema = compile(outer_schema)
+
+        assert 'author' in compiled_schema.fields
+        assert 'title' in compiled_schema.fields
+        assert 'name' not in compiled_schema.fields
+    
     def test_it_extracts_no_names_for_empty_schema(self):
         def schema():
             pass
@@ -0,0 +1,125 @@
+import io
+import pytest
+from decimal import Decimal
+from okay import validate, dump_schema, dumps_schema, load_schema, loads_schema, precompile, SchemaError, Message
+from okay.schema import *
+
+class TestSchemaSerializer:
+    def test_it_loads_a_schema_without_running_the_schema_definition(self):
+        call_count = 0
+        def schema():
+            nonlocal call_count
+            call_count += 1
+            required('title', type='string', min=1)
+        
+        data = dumps_schema(schema)
+        compiled_schema = loads_schema(data)
+        validate(compiled_schema, {})
+
+        assert call_count == 1
+    
+    def test_it_produces_the_same_messages_as_the_original_schema(self):
+        document = {
+            'metadata': { 'accommodation_id': -1 },
+            'accommodation': {
+                'name': 5,
+                'phone': 'call me',
+                'ratings': [{ 'aspect': 'loneliness', 'score': 6 }, None],
+                'stars': Decimal('6.5'),
+                'website': 'example.com'
+            },
+            'trace': None
+        }
+        compiled_schema = loads_schema(dumps_schema(accommodation_schema))
+
+        expected = validate(accommodation_schema, document)
+        messages = validate(compiled_schema, document)
+
+        assert len(messages) > 5
+        assert [ message.__dict__ for message in messages ] == [ message.__dict__ for message in expected ]
+    
+    def test_it_writes_and_reads_files(self):
+        file = io.BytesIO()
+        dump_schema(accommodation_schema, file)
+        file.seek(0)
+        compiled_schema = load_schema(file)
+
+        assert list(compiled_schema.fields) == list(precompile(accommodation_schema).fields)
+    
+    def test_it_serializes_a_compiled_schema(self):
+        compiled_schema = precompile(accommodation_schema)
+
+        assert dumps_schema(compiled_schema) == dumps_schema(accommodation_schema)
+    
+    def test_it_keeps_objects_that_ignore_extra_fields(self):
+        def schema():
+            required('accommodation.name', type='string')
+            ignore_extra_fields('accommodation')
+        
+        document = { 'accommodation': { 'name': 'Hotel', 'stars': 4 }, 'trace': True }
+        compiled_schema = loads_schema(dumps_schema(schema))
+        messages = validate(compiled_schema, document)
+
+        assert [ (message.type, message.field) for message in messages ] == [ ('extra_field', 'trace') ]
+    
+    def test_it_keeps_tuples(self):
+        def schema():
+            required('title', type='string', options=('Swing Time', 'Top Hat'))
+        
+        compiled_schema = loads_schema(dumps_schema(schema))
+
+        assert compiled_schema.fields['title'].rules[-1].parameters['options'] == ('Swing Time', 'Top Hat')
+        assert dumps_schema(compiled_schema) == dumps_schema(schema)
+    
+    def test_it_raises_when_a_field_that_ignores_extra_fields_is_invalid(self):
+        def schema():
+            required('accommodation.name', type='string')
+            ignore_extra_fields('accommodation')
+        
+        data = dumps_schema(schema)
+
+        with pytest.raises(SchemaError):
+            loads_schema(data.replace(b'"ignore_extra_fields_in":["accommodation"]', b'"ignore_extra_fields_in":"accommodation"'))
+        with pytest.raises(SchemaError):
+            loads_schema(data.replace(b'"ignore_extra_fields_in":["accommodation"]', b'"ignore_extra_fields_in":[5]'))
+        with pytest.raises(SchemaError):
+            loads_schema(data.replace(b'"ignore_extra_fields_in":["accommodation"]', b'"ignore_extra_fields_in":["hotel"]'))
+    
+    def test_it_raises_when_a_custom_validator_cant_be_imported(self):
+        def local_validator(field, value):
+            pass
+
+        def schema():
+            required('title', type='custom', validator=local_validator)
+        
+        with pytest.raises(SchemaError):
+            dumps_schema(schema)
+    
+    def test_it_raises_when_the_format_version_is_unknown(self):
+        data = dumps_schema(accommodation_schema).replace(b'"version":1', b'"version":99')
+
+        with pytest.raises(SchemaError):
+            loads_schema(data)
+    
+    def test_it_raises_when_the_data_is_not_a_schema(self):
+        with pytest.raises(SchemaError):
+            loads_schema(b'{"title": "Swing Time"}')
+
+
+def phone_validator(field, value, country_code):
+    if not value.startswith(country_code):
+        return Message(
+            type='invalid_phone',
+            field=field
+        )
+
+def accommodation_schema():
+    required('metadata.accommodation_id', type='int', min=1)
+    required('accommodation.name', type='string')
+    optional('accommodation.phone', type='custom', validator=phone_validator, country_code='+')
+    optional('accommodation.stars', type='number', min=Decimal('0.5'), max=Decimal('5.5'))
+    optional('accommodation.website', type='string', regex=r'https?://.+')
+    required('accommodation.ratings[].aspect', type='string', options=['general', 'staff'], case_sensitive=False)
+    required('accommodation.ratings[].score', type='number', min=0, max=5)
+    optional('accommodation.ratings[]', type='object?')
+    optional('trace', type='object?')
@@ -0,0 +1,117 @@
+from okay.schema_compiler import compile
+from okay.schema_tree import SchemaTree
+from okay.schema import *
+
+class TestSchemaTree:
+    def test_it_is_created_when_compiling_a_schema(self):
+        compiled_schema = compile(book_schema)
+
+        assert isinstance(compiled_schema.tree, SchemaTree)
+    
+    def test_it_links_a_node_to_its_children(self):
+        tree = compile(book_schema).tree
+
+        assert tree.root.children['author'] is tree.nodes['author']
+        assert tree.nodes['author'].children['name'] is tree.nodes['author.name']
+    
+    def test_it_links_a_list_to_its_elements(self):
+        tree = compile(book_schema).tree
+
+        assert tree.nodes['chapters'].element is tree.nodes['chapters[]']
+        assert tree.nodes['chapters[]'].children['title'] is tree.nodes['chapters[].title']
+    
+    def test_it_has_a_root_node_if_the_schema_has_no_root_field(self):
+        tree = SchemaTree(dict.fromkeys([ 'title' ]))
+
+        assert tree.root.name == '.'
+        assert tree.root.field is None
+        assert tree.root.children['title'] is tree.nodes['title']
+    
+    def test_it_knows_which_keys_a_node_allows(self):
+        tree = compile(book_schema).tree
+
+        assert tree.root.allowed_keys == frozenset([ 'title', 'author', 'chapters', 'isbn' ])
+        assert tree.nodes['author'].allowed_keys == frozenset([ 'name', 'born' ])
+    
+    def test_it_passes_ignoring_extra_fields_on_to_children(self):
+        def schema():
+            required('author.name')
+            required('chapters[].title')
+            ignore_extra_fields('chapters')
+
+        tree = compile(schema).tree
+
+        assert not tree.root.ignore_extra_fields
+        assert not tree.nodes['author'].ignore_extra_fields
+        assert tree.nodes['chapters'].ignore_extra_fields
+        assert tree.nodes['chapters[]'].ignore_extra_fields
+        assert tree.nodes['chapters[].title'].ignore_extra_fields
+
+    def test_it_ignores_extra_fields_everywhere_if_the_root_does(self):
+        def schema():
+            required('author.name')
+            ignore_extra_fields()
+
+        tree = compile(schema).tree
+
+        assert all(node.ignore_extra_fields for node in tree.nodes.values())
+
+    def test_it_knows_which_keys_a_node_requires(self):
+        tree = compile(book_schema).tree
+
+        assert tree.root.required_keys == frozenset([ 'title', 'author' ])
+        assert tree.nodes['author'].required_keys == frozenset([ 'name' ])
+        assert tree.nodes['chapters[]'].required_keys == frozenset([ 'title' ])
+    
+    def test_it_numbers_required_fields_in_schema_order(self):
+        tree = compile(book_schema).tree
+
+        assert tree.root.missing == ((0, 'title', 'title'), (1, 'author', 'author'))
+        assert tree.nodes['author'].missing == ((2, 'name', 'name'),)
+        assert tree.nodes['chapters[]'].missing == ((3, 'title', 'title'),)
+        assert tree.bucket_count == 4
+    
+    def test_it_only_lists_nodes_with_required_children_as_parents(self):
+        tree = compile(book_schema).tree
+
+        assert [ node.name for node in tree.parents ] == [ '.', 'author', 'chapters[]' ]
+    
+    def test_it_accepts_a_list_as_root(self):
+        def schema():
+            required('.', type='list')
+            required('.[]', type='string')
+        
+        tree = compile(schema).tree
+
+        assert '.[]' in tree.nodes
+        assert tree.root.missing == ()
+        assert tree.bucket_count == 0
+    
+    def test_it_doesnt_link_unusual_keys(self):
+        tree = compile(book_schema).tree
+
+        assert 'author.name' not in tree.root.children
+        assert 'author.name' in tree.root.unusual_keys
+        assert 'chapters[]' in tree.root.unusual_keys
+    
+    def test_it_finds_children_with_unusual_keys_by_name(self):
+        tree = compile(book_schema).tree
+
+        assert tree.get_child(tree.root, 'author.name') is tree.nodes['author.name']
+        assert tree.get_child(tree.root, 'author') is tree.nodes['author']
+        assert tree.get_child(tree.root, 'publisher') is None
+    
+    def test_it_can_be_built_from_field_names(self):
+        tree = SchemaTree(dict.fromkeys([ 'title', 'author', 'author.name' ]))
+
+        assert tree.nodes['author'].children['name'] is tree.nodes['author.name']
+        assert tree.bucket_count == 0
+
+
+def book_schema():
+    required('title', type='string')
+    required('author', type='object')
+    required('author.name', type='string')
+    optional('author.born', type='int')
+    required('chapters[].title', type='string')
+    optional('isbn', type='string')
@@ -0,0 +1,97 @@
+import gc
+from okay import validate, Validator, Profiler, SchemaCache, ShapeCache
+from okay.schema import *
+
+class TestShapeCache:
+    def test_it_reuses_the_shape_of_an_object(self):
+        validator = Validator(shape_cache=ShapeCache())
+
+        validator.validate(book_schema, { 'title': 'NW', 'author': { 'name': 'Zadie Smith' } })
+        validator.validate(book_schema, { 'title': 'Swing Time', 'author': { 'name': 'Zadie Smith' } })
+
+        assert validator.shape_cache.misses == 2
+        assert validator.shape_cache.hits == 2
+        assert validator.shape_cache.hit_rate == 0.5
+        assert len(validator.shape_cache) == 2
+    
+    def test_it_distinguishes_key_order(self):
+        validator = Validator(shape_cache=ShapeCache())
+
+        validator.validate(book_schema, { 'title': 'NW', 'isbn': '978-0-241-14414-8' })
+        validator.validate(book_schema, { 'isbn': '978-0-241-14414-8', 'title': 'NW' })
+
+        assert validator.shape_cache.hits == 0
+        assert len(validator.shape_cache) == 2
+    
+    def test_it_reports_the_same_missing_and_extra_fields(self):
+        validator = Validator(shape_cache=ShapeCache())
+        documents = [
+            { 'author': { 'born': 1975 }, 'publisher': 'Penguin' },
+            { 'author': { 'born': 1975 }, 'publisher': 'Penguin' },
+            { 'title': 'NW', 'author': None, 'chapters': [ {}, { 'number': 1 } ] },
+            { 'title': 'NW', 'author': None, 'chapters': [ {}, { 'number': 1 } ] }
+        ]
+
+        for document in documents:
+            assert validator.validate(book_schema, document) == validate(book_schema, document)
+    
+    def test_it_reports_the_same_messages_for_keys_that_contain_a_dot(self):
+        validator = Validator(shape_cache=ShapeCache())
+        document = { 'title': 'NW', 'author.name': 'Zadie Smith' }
+
+        for _ in range(2):
+            assert validator.validate(book_schema, document) == validate(book_schema, document)
+    
+    def test_it_limits_the_number_of_shapes_per_field(self):
+        validator = Validator(shape_cache=ShapeCache(max_size=2))
+
+        for key in [ 'a', 'b', 'c' ]:
+            validator.validate(book_schema, { 'title': 'NW', key: 1 })
+        validator.validate(book_schema, { 'title': 'NW', 'a': 1 })
+
+        assert len(validator.shape_cache) == 2
+        assert validator.shape_cache.evictions == 2
+        assert validator.shape_cache.hits == 0
+    
+    def test_it_is_used_with_a_profiler(self):
+        validator = Validator(shape_cache=ShapeCache(), profiler=Profiler())
+
+        validator.validate(book_schema, { 'title': 'NW' })
+        messages = validator.validate(book_schema, { 'title': 'NW' })
+
+        assert validator.shape_cache.hits == 1
+        assert [ message.field for message in messages ] == [ 'author' ]
+    
+    def test_it_is_only_used_by_the_interpreter(self):
+        validator = Validator(engine='lazy', shape_cache=ShapeCache())
+
+        validator.validate(book_schema, { 'title': 'NW' })
+
+        assert validator.shape_cache.misses == 0
+    
+    def test_it_can_be_cleared(self):
+        validator = Validator(shape_cache=ShapeCache())
+        validator.validate(book_schema, { 'title': 'NW' })
+
+        validator.shape_cache.clear()
+
+        assert len(validator.shape_cache) == 0
+    
+    def test_it_forgets_shapes_of_schemas_that_are_no_longer_used(self):
+        validator = Validator(schema_cache=SchemaCache(max_size=2), shape_cache=ShapeCache())
+        for i in range(50):
+            def schema():
+                required('title', type='string')
+            validator.validate(schema, { 'title': 'NW' })
+        gc.collect()
+
+        assert len(validator.shape_cache) <= 2
+
+
+def book_schema():
+    required('title', type='string')
+    required('author', type='object')
+    required('author.name', type='string')
+    optional('author.born', type='int')
+    required('chapters[].title', type='string')
+    optional('chapters[].number', type='int')
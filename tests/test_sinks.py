@@ -0,0 +1,65 @@
+import io
+import json
+from decimal import Decimal
+from okay import CSVMessageSink, JSONLinesSink, Message
+
+class TestJSONLinesSink:
+    def test_it_writes_documents(self):
+        file = io.StringIO()
+        sink = JSONLinesSink(file)
+        sink.write([ { 'title': 'Café' }, { 'title': 5 } ])
+        sink.close()
+
+        assert file.getvalue() == '{"title": "Café"}\n{"title": 5}\n'
+    
+    def test_it_writes_messages(self):
+        file = io.StringIO()
+        sink = JSONLinesSink(file)
+        sink.write([ Message(type='number_too_small', field='page_count', expected={ 'min': Decimal('1') }) ])
+        sink.close()
+
+        assert json.loads(file.getvalue()) == { 'type': 'number_too_small', 'field': 'page_count', 'expected': { 'min': '1' } }
+    
+    def test_it_writes_to_a_path(self, tmp_path):
+        path = tmp_path / 'valid.jsonl'
+        sink = JSONLinesSink(path)
+        sink.write([ { 'title': 'Swing Time' } ])
+        sink.close()
+
+        assert path.read_text(encoding='utf-8') == '{"title": "Swing Time"}\n'
+
+
+class TestCSVMessageSink:
+    def test_it_writes_messages(self):
+        file = io.StringIO()
+        sink = CSVMessageSink(file)
+        sink.write([
+            Message(type='invalid_type', field='title', document_number=1),
+            Message(type='missing_field', field='author', document_number=2)
+        ])
+        sink.close()
+
+        assert file.getvalue().splitlines() == [
+            'document_number,type,field',
+            '1,invalid_type,title',
+            '2,missing_field,author'
+        ]
+    
+    def test_it_writes_selected_columns(self):
+        file = io.StringIO()
+        sink = CSVMessageSink(file, columns=('field', 'expected', 'line_number'))
+        sink.write([ Message(type='invalid_type', field='title', expected={ 'type': 'string' }) ])
+        sink.close()
+
+        assert file.getvalue().splitlines() == [
+            'field,expected,line_number',
+            'title,"{""type"": ""string""}",'
+        ]
+    
+    def test_it_writes_to_a_path(self, tmp_path):
+        path = tmp_path / 'messages.csv'
+        sink = CSVMessageSink(path)
+        sink.write([ Message(type='extra_field', field='isbn', document_number=0) ])
+        sink.close()
+
+        assert path.read_text(encoding='utf-8').splitlines() == [ 'document_number,type,field', '0,extra_field,isbn' ]
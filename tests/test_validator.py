@@ -1,7 +1,10 @@
 import pytest
-from okay import validate, SchemaError, Message
+import threading
+from okay import validate, validate_many, is_valid, precompile, Validator, SchemaError, Message
+from okay.schema_cache import SchemaCache
 from okay.schema import *
 
+@pytest.mark.usefixtures('each_engine')
 class TestValidator:
     def test_it_accepts_any_document_when_the_schema_is_empty(self):
         document = {}
@@ -554,6 +557,78 @@ class TestValidator:
 
         assert messages == []
     
+    def test_it_ignores_extra_fields_in_a_single_object(self):
+        def schema():
+            required('accommodation.name', type='string')
+            ignore_extra_fields('accommodation')
+        
+        document = {
+            'accommodation': {
+                'name': 'Hotel',
+                'stars': 4
+            },
+            'trace': True
+        }
+        messages = validate(schema, document)
+
+        assert len(messages) == 1
+        message = messages[0]
+        assert message.type == 'extra_field'
+        assert message.field == 'trace'
+    
+    def test_it_ignores_extra_fields_in_the_children_of_an_object(self):
+        def schema():
+            required('accommodation.rooms', type='list')
+            required('accommodation.rooms[].name', type='string')
+            optional('metadata', type='object')
+            ignore_extra_fields('accommodation')
+        
+        document = {
+            'accommodation': {
+                'rooms': [{
+                    'name': 'Suite',
+                    'beds': 2
+                }, {
+                    'beds': 1
+                }]
+            },
+            'metadata': {
+                'source': 'import'
+            }
+        }
+        messages = validate(schema, document)
+
+        assert [ (message.type, message.field) for message in messages ] == [
+            ('missing_field', 'accommodation.rooms[1].name'),
+            ('extra_field', 'metadata.source')
+        ]
+    
+    def test_it_still_validates_defined_fields_in_an_object_that_ignores_extra_fields(self):
+        def schema():
+            required('accommodation.name', type='string')
+            ignore_extra_fields('accommodation')
+        
+        document = {
+            'accommodation': {
+                'name': 5,
+                'stars': 4
+            }
+        }
+        messages = validate(schema, document)
+
+        assert len(messages) == 1
+        message = messages[0]
+        assert message.type == 'invalid_type'
+        assert message.field == 'accommodation.name'
+    
+    def test_it_raises_if_an_object_that_ignores_extra_fields_isnt_in_the_schema(self):
+        def schema():
+            required('accommodation', type='object')
+            ignore_extra_fields('metadata')
+        
+        with pytest.raises(SchemaError):
+            validate(schema, {})
+    
     def test_it_adds_specified_values_to_missing_field_message(self):
         def schema():
             required('metadata')
@@ -721,6 +796,32 @@ class TestValidator:
         with pytest.raises(SchemaError):
             validate(schema, document)
     
+    def test_it_accepts_a_type_for_a_field_that_was_specified_without_one(self):
+        def schema():
+            required('metadata')
+            required('metadata', type='object')
+        
+        messages = validate(schema, { 'metadata': 5 })
+
+        assert len(messages) == 1
+        message = messages[0]
+        assert message.type == 'invalid_type'
+        assert message.field == 'metadata'
+    
+    def test_it_reports_each_failing_rule_of_a_field_with_several_rules_of_the_same_type(self):
+        def schema():
+            required('name', type='string')
+            required('name', type='string', min=2)
+        
+        messages = validate(schema, { 'name': 5 })
+        assert [ message.type for message in messages ] == [ 'invalid_type', 'invalid_type' ]
+
+        messages = validate(schema, { 'name': None })
+        assert [ message.type for message in messages ] == [ 'null_value', 'null_value' ]
+
+        messages = validate(schema, { 'name': 'a' })
+        assert [ message.type for message in messages ] == [ 'string_too_short' ]
+    
     def test_it_raises_when_required_field_is_already_optional(self):
         def schema():
             optional('accommodation', type='object')
@@ -1168,5 +1269,317 @@ class TestValidator:
         assert message.type == 'extra_field'
         assert message.field == 'price_USD'
 
+    def test_it_accepts_a_null_list_element_when_elements_are_nullable_objects(self):
+        def schema():
+            required('authors[].name')
+            required('authors[]', type='object?')
+        
+        document = { 'authors': [ None, { 'name': 'Vikram Seth' } ] }
+        messages = validate(schema, document)
+
+        assert messages == []
+
+
+class TestValidateMany:
+    def test_it_yields_document_numbers_and_messages(self):
+        def schema():
+            required('title', type='string')
+        
+        documents = [ { 'title': 'Mr Loverman' }, { 'title': 7 }, {} ]
+        results = list(validate_many(schema, documents))
+
+        assert [ document_number for document_number, _ in results ] == [ 0, 1, 2 ]
+        assert results[0][1] == []
+        assert results[1][1][0].type == 'invalid_type'
+        assert results[2][1][0].type == 'missing_field'
+    
+    def test_it_validates_documents_lazily(self):
+        def schema():
+            required('title', type='string')
+        
+        def documents():
+            yield { 'title': 'Mr Loverman' }
+            raise AssertionError('validate_many() read too far ahead')
+        
+        results = validate_many(schema, documents())
+        document_number, messages = next(results)
+
+        assert document_number == 0
+        assert messages == []
+    
+    def test_it_adds_specified_values_to_messages(self):
+        def schema():
+            required('title', type='string')
+        
+        results = list(validate_many(schema, [ {}, {} ], { 'source': 'books.jsonl' }))
+
+        assert results[0][1][0].source == 'books.jsonl'
+        assert results[1][1][0].source == 'books.jsonl'
+    
+    def test_it_keeps_messages_of_previous_documents(self):
+        def schema():
+            required('title', type='string')
+        
+        results = list(validate_many(schema, [ {}, { 'title': 'Mr Loverman' } ]))
+
+        assert len(results[0][1]) == 1
+    
+    def test_it_supports_the_generated_engine(self):
+        def schema():
+            required('title', type='string')
+        
+        results = list(validate_many(schema, [ { 'title': 1 } ], engine='generated'))
+
+        assert results[0][1][0].type == 'invalid_type'
+
+
+class TestEngines:
+    @pytest.mark.parametrize('engine', [ 'generated', 'lazy' ])
+    def test_it_doesnt_create_an_index(self, engine, monkeypatch):
+        def schema():
+            required('accommodation.ratings[].score', type='number')
+        
+        def fail(*args):
+            raise AssertionError()
+        monkeypatch.setattr('okay.validator.create_index', fail)
+
+        messages = validate(schema, { 'accommodation': { 'ratings': [ { 'score': 1 }, { 'score': 'bad' } ] } }, engine=engine)
+
+        assert len(messages) == 1
+        assert messages[0].field == 'accommodation.ratings[1].score'
+
+
+class TestValidatorInstances:
+    def test_it_validates_a_document(self):
+        def schema():
+            required('title', type='string')
+        
+        validator = Validator()
+        messages = validator.validate(schema, { 'title': 5 }, { 'document_number': 3 })
+
+        assert len(messages) == 1
+        assert messages[0].type == 'invalid_type'
+        assert messages[0].document_number == 3
+    
+    def test_it_validates_many_documents(self):
+        def schema():
+            required('title', type='string')
+        
+        validator = Validator(engine='generated')
+        results = list(validator.validate_many(schema, [ {}, { 'title': 'Swing Time' } ]))
+
+        assert results[0][1][0].type == 'missing_field'
+        assert results[1][1] == []
+    
+    def test_it_uses_the_specified_schema_cache(self):
+        def schema():
+            required('title')
+        
+        schema_cache = SchemaCache()
+        validator = Validator(schema_cache=schema_cache)
+        validator.validate(schema, {})
+
+        assert schema_cache.get(schema) is schema_cache.get(schema)
+        assert 'title' in schema_cache.get(schema).fields
+    
+    def test_it_allows_custom_validators_to_call_validate(self):
+        def author_schema():
+            required('name', type='string')
+        
+        def author_validator(field, value):
+            messages = validate(author_schema, value)
+            if messages:
+                return Message(
+                    type='invalid_author',
+                    field=field
+                )
+        
+        def book_schema():
+            required('title', type='string')
+            required('author', type='custom', validator=author_validator)
+        
+        document = {
+            'title': 5,
+            'author': {}
+        }
+        messages = validate(book_schema, document)
+
+        assert [ message.type for message in messages ] == [ 'invalid_type', 'invalid_author' ]
+    
+    def test_it_validates_from_multiple_threads_at_once(self):
+        barrier = threading.Barrier(4)
+        def slow_validator(field, value):
+            barrier.wait(timeout=5)
+
+        def make_schema(field_name):
+            def schema():
+                required(field_name, type='custom', validator=slow_validator)
+            return schema
+
+        results = {}
+        def run(field_name):
+            document = { field_name: True, 'extra_' + field_name: True }
+            results[field_name] = validate(make_schema(field_name), document)
+        
+        threads = [ threading.Thread(target=run, args=(str(i),)) for i in range(4) ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        for field_name, messages in results.items():
+            assert len(messages) == 1
+            assert messages[0].field == 'extra_' + field_name
+
+
+class TestPrecompile:
+    def test_it_returns_a_compiled_schema_that_validate_accepts(self):
+        call_count = 0
+        def schema():
+            nonlocal call_count
+            call_count += 1
+            required('title', type='string')
+        
+        compiled_schema = precompile(schema)
+        messages = validate(compiled_schema, { 'title': 5 })
+
+        assert call_count == 1
+        assert len(messages) == 1
+        assert messages[0].type == 'invalid_type'
+    
+    def test_it_caches_the_compiled_schema(self):
+        call_count = 0
+        def schema():
+            nonlocal call_count
+            call_count += 1
+        
+        precompile(schema)
+        validate(schema, {})
+
+        assert call_count == 1
+    
+    def test_it_generates_the_validation_function_up_front(self):
+        def schema():
+            required('title', type='string')
+        
+        compiled_schema = precompile(schema, engine='generated')
+
+        assert compiled_schema.generated_function is not None
+        assert validate(compiled_schema, {}, engine='generated')[0].type == 'missing_field'
+    
+    def test_it_raises_schema_errors_up_front(self):
+        def schema():
+            required('title', type='unknown')
+        
+        with pytest.raises(SchemaError):
+            precompile(schema)
+    
+    def test_it_accepts_a_compiled_schema_in_validate_many(self):
+        def schema():
+            required('title', type='string')
+        
+        compiled_schema = precompile(schema)
+        results = list(validate_many(compiled_schema, [ {}, { 'title': 'Swing Time' } ]))
+
+        assert results[0][1][0].type == 'missing_field'
+        assert results[1][1] == []
+    
+    def test_it_warms_up_a_validator(self):
+        def book_schema():
+            required('title', type='string')
+        
+        def author_schema():
+            required('name', type='string')
+        
+        schema_cache = SchemaCache()
+        validator = Validator(engine='generated', schema_cache=schema_cache)
+        compiled_schemas = validator.warmup([ book_schema, author_schema ])
+        validator.validate(book_schema, {})
+
+        assert len(compiled_schemas) == 2
+        assert all(compiled_schema.generated_function is not None for compiled_schema in compiled_schemas)
+        assert schema_cache.misses == 2
+        assert schema_cache.hits == 1
+
+
+class TestMessageLimits:
+    def test_it_stops_after_the_first_message_when_failing_fast(self):
+        def schema():
+            required('title', type='string')
+            required('author', type='string')
+        
+        messages = validate(schema, { 'title': 1, 'author': 2 }, fail_fast=True)
+
+        assert len(messages) == 1
+        assert messages[0].type == 'invalid_type'
+    
+    def test_it_stops_after_the_maximum_number_of_messages(self):
+        def schema():
+            required('scores[]', type='number')
+        
+        messages = validate(schema, { 'scores': [ 'a', 'b', 'c', 'd' ] }, max_messages=2)
+
+        assert [ message.field for message in messages ] == [ 'scores[0]', 'scores[1]' ]
+    
+    def test_it_stops_traversing_the_document_when_the_limit_is_reached(self):
+        visited = []
+        def validator(field, value):
+            visited.append(field)
+            return Message(
+                type='rejected',
+                field=field
+            )
+        
+        def schema():
+            required('scores[]', type='custom', validator=validator)
+        
+        validate(schema, { 'scores': [ 1, 2, 3 ] }, engine='interpreter', fail_fast=True)
+
+        assert visited == [ 'scores[0]' ]
+    
+    def test_it_counts_missing_and_extra_fields(self):
+        def schema():
+            required('title')
+        
+        messages = validate(schema, { 'author': 'Zadie Smith', 'isbn': '' }, max_messages=2)
+
+        assert len(messages) == 2
+        assert [ message.type for message in messages ] == [ 'missing_field', 'extra_field' ]
+    
+    def test_it_reports_all_messages_if_the_limit_isnt_reached(self):
+        def schema():
+            required('title', type='string')
+        
+        messages = validate(schema, { 'title': 1 }, max_messages=5)
+
+        assert len(messages) == 1
+    
+    def test_it_limits_messages_in_validate_many(self):
+        def schema():
+            required('title', type='string')
+            required('author', type='string')
+        
+        results = list(validate_many(schema, [ {}, { 'title': 'Swing Time' } ], fail_fast=True))
+
+        assert len(results[0][1]) == 1
+        assert len(results[1][1]) == 1
+    
+    def test_it_raises_when_the_limit_is_invalid(self):
+        with pytest.raises(ValueError):
+            validate(empty_schema, {}, max_messages=0)
+    
+    def test_it_reports_a_valid_document(self):
+        def schema():
+            required('title', type='string')
+        
+        assert is_valid(schema, { 'title': 'Swing Time' })
+    
+    def test_it_reports_an_invalid_document(self):
+        def schema():
+            required('title', type='string')
+        
+        assert not is_valid(schema, { 'title': 'Swing Time', 'author': 'Zadie Smith' })
+        assert not Validator().is_valid(schema, {})
+
 def empty_schema():
     pass
\ No newline at end of file
@@ -0,0 +1,47 @@
+from okay import validate
+from okay.schema_compiler import compile
+from okay.walker import Walker
+from okay.schema import *
+
+class TestWalker:
+    def test_it_walks_a_document(self):
+        def schema():
+            required('rooms[].name', type='string')
+        
+        walker = Walker(compile(schema))
+        messages = walker.walk({ 'rooms': [ { 'name': 'Suite' }, { 'name': 5 } ] })
+
+        assert len(messages) == 1
+        assert messages[0].type == 'invalid_type'
+        assert messages[0].field == 'rooms[1].name'
+    
+    def test_it_passes_the_path_to_custom_validators(self):
+        fields = []
+        def validator(field, value):
+            fields.append(field)
+        
+        def schema():
+            required('rooms[].name', type='custom', validator=validator)
+        
+        validate(schema, { 'rooms': [ { 'name': 'Suite' }, { 'name': 'Attic' } ] }, engine='lazy')
+
+        assert fields == [ 'rooms[0].name', 'rooms[1].name' ]
+    
+    def test_it_stops_walking_when_the_maximum_number_of_messages_is_reached(self):
+        def schema():
+            required('rooms[].name', type='string')
+        
+        walker = Walker(compile(schema))
+        messages = walker.walk({ 'rooms': [ { 'name': 1 }, { 'name': 2 }, {} ] }, max_messages=1)
+
+        assert len(messages) == 1
+        assert messages[0].field == 'rooms[0].name'
+    
+    def test_it_returns_none_for_keys_containing_dots(self):
+        def schema():
+            required('accommodation.geo.latitude', type='string')
+        
+        walker = Walker(compile(schema))
+        messages = walker.walk({ 'accommodation': { 'geo.latitude': 5 } })
+
+        assert messages is None